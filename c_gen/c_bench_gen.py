@@ -0,0 +1,237 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+@brief Benchmark generation functions
+
+The following components of locibench are generated.
+
+bench_classes.c: For each concrete class and version, loops that create
+and delete an instance and that get and set each of its scalar members.
+Also a per-class function that iterates over each list member of a
+parsed object.
+
+bench_data.c: The test_data corpus compiled in, along with a function
+that builds each object from its C section.
+
+The timing harness and JSON output are in the static locibench.c.
+"""
+
+import re
+import c_gen.of_g_legacy as of_g
+import c_gen.type_maps as type_maps
+import c_gen.loxi_utils_legacy as loxi_utils
+import util
+import test_data
+from c_test_gen import var_name_map, scalar_member_types_get, ignore_member
+
+def gen_makefile(out, name):
+    util.render_template(out, "locibench.mk")
+
+def gen_bench_data(out, name):
+    entries = []
+    for filename in test_data.list_files():
+        data = test_data.read(filename)
+        if not 'binary' in data:
+            continue
+        entries.append(dict(name=re.sub(r'[^A-Za-z0-9_]', '_', filename[:-5]),
+                            filename=filename,
+                            c=data.get('c'),
+                            binary=data['binary']))
+
+    util.render_template(out, "bench_data.c", entries=entries)
+
+def concrete_classes(version):
+    for cls in of_g.standard_class_order:
+        if not loxi_utils.class_in_version(cls, version):
+            continue
+        if cls in type_maps.inheritance_map:
+            continue
+        yield cls
+
+def gen_accessor_loop(out, cls, version):
+    """
+    Generate a loop that gets and sets each scalar member of cls
+
+    @returns False if the class has no scalar members
+    """
+    members, member_types = scalar_member_types_get(cls, version)
+    members = [m for m in members if m["m_type"] in member_types and
+               not ignore_member(cls, version, m["name"], m["m_type"])]
+    if not members:
+        return False
+
+    out.write("""
+static void
+bench_accessors_%(cls)s_%(v_name)s(long iterations)
+{
+    %(cls)s_t *obj = %(cls)s_new(%(v_name)s);
+""" % dict(cls=cls, v_name=loxi_utils.version_to_name(version)))
+    for m_type in member_types:
+        out.write("    %s %s;\n" % (m_type, var_name_map(m_type)))
+    out.write("""    long i;
+
+    for (i = 0; i < iterations; i++) {
+""")
+    for member in members:
+        out.write("""\
+        %(cls)s_%(m_name)s_get(obj, &%(v_name)s);
+        %(cls)s_%(m_name)s_set(obj, %(v_name)s);
+""" % dict(cls=cls, m_name=member["name"],
+           v_name=var_name_map(member["m_type"])))
+    out.write("""\
+    }
+
+    of_object_delete(obj);
+}
+""")
+    return True
+
+def gen_list_iter(out, cls, version):
+    """
+    Generate a function counting the elements of each list member of cls
+
+    @returns False if the class has no list members
+    """
+    members, member_types = loxi_utils.all_member_types_get(cls, version)
+    members = [m for m in members if loxi_utils.class_is_list(m["m_type"])]
+    if not members:
+        return False
+
+    out.write("""
+static int
+bench_list_iter_%(cls)s_%(v_name)s(of_object_t *obj)
+{
+    int count = 0;
+    int rv;
+""" % dict(cls=cls, v_name=loxi_utils.version_to_name(version)))
+    for member in members:
+        m_type = member["m_type"]
+        out.write("""
+    {
+        %(m_type)s list;
+        %(elt_type)s elt;
+
+        %(cls)s_%(m_name)s_bind(obj, &list);
+        %(u_type)s_ITER(&list, &elt, rv) {
+            count++;
+        }
+    }
+""" % dict(cls=cls, m_name=member["name"], m_type=m_type,
+           elt_type=loxi_utils.list_to_entry_type(m_type),
+           u_type=m_type[:-2].upper()))
+    out.write("""
+    return count;
+}
+""")
+    return True
+
+def gen_bench_classes(out, name):
+    loxi_utils.gen_c_copy_license(out)
+    out.write("""
+/**
+ *
+ * AUTOMATICALLY GENERATED FILE.  Edits will be lost on regen.
+ *
+ * Per class benchmark loops for all versions.
+ */
+
+#include <locibench/locibench.h>
+""")
+
+    table = []
+    list_iters = {}
+    for version in of_g.of_version_range:
+        v_name = loxi_utils.version_to_name(version)
+        for cls in concrete_classes(version):
+            out.write("""
+static void
+bench_new_delete_%(cls)s_%(v_name)s(long iterations)
+{
+    long i;
+
+    for (i = 0; i < iterations; i++) {
+        of_object_delete(%(cls)s_new(%(v_name)s));
+    }
+}
+""" % dict(cls=cls, v_name=v_name))
+            if gen_accessor_loop(out, cls, version):
+                accessors = "bench_accessors_%s_%s" % (cls, v_name)
+            else:
+                accessors = "NULL"
+            if gen_list_iter(out, cls, version):
+                list_iters[(cls, version)] = \
+                    "bench_list_iter_%s_%s" % (cls, v_name)
+            table.append((cls, v_name, accessors))
+
+    out.write("""
+const bench_class_t bench_classes[] = {
+""")
+    for cls, v_name, accessors in table:
+        out.write("""\
+    { "%(cls)s", %(v_name)s,
+      bench_new_delete_%(cls)s_%(v_name)s, %(accessors)s },
+""" % dict(cls=cls, v_name=v_name, accessors=accessors))
+    out.write("""\
+};
+
+const int bench_class_count = sizeof(bench_classes) / sizeof(bench_classes[0]);
+""")
+
+    for version in of_g.of_version_range:
+        out.write("""
+static const bench_list_iter_f list_iters_v%(version)s[OF_OBJECT_COUNT] = {
+""" % dict(version=version))
+        out.write("    NULL, /* of_object, not a valid specific type */\n")
+        for j, cls in enumerate(of_g.all_class_order):
+            comma = ""
+            if j < len(of_g.all_class_order) - 1: # Avoid ultimate comma
+                comma = ","
+            out.write("    %s%s\n" %
+                      (list_iters.get((cls, version), "NULL"), comma))
+        out.write("};\n")
+
+    out.write("""
+static const bench_list_iter_f *const list_iters[5] = {
+    NULL,
+    list_iters_v1,
+    list_iters_v2,
+    list_iters_v3,
+    list_iters_v4
+};
+
+bench_list_iter_f
+bench_list_iter_get(of_object_t *obj)
+{
+    if (!OF_VERSION_OKAY(obj->version) ||
+            obj->object_id <= 0 || obj->object_id >= OF_OBJECT_COUNT) {
+        return NULL;
+    }
+
+    return list_iters[obj->version][obj->object_id];
+}
+""")
@@ -353,6 +353,29 @@ typedef int (*loci_logger_f)(loci_log_level_t level,
  */
 extern loci_logger_f loci_logger;
 
+/*
+ * Storage class used for per-thread LOCI state. Define LOCI_THREAD_LOCAL
+ * before including this header if the compiler spells it differently
+ * (for example _Thread_local or __declspec(thread)).
+ */
+#if !defined(LOCI_THREAD_LOCAL)
+#define LOCI_THREAD_LOCAL __thread
+#endif
+
+/**
+ * @brief Override loci_logger for the calling thread only.
+ * @param logger The logger to use, or NULL to fall back to loci_logger.
+ */
+extern void loci_thread_logger_set(loci_logger_f logger);
+
+/**
+ * @brief Return the status of the last message parse on the calling thread.
+ *
+ * Set by of_object_new_from_message and
+ * of_object_new_from_message_preallocated; OF_ERROR_NONE on success.
+ */
+extern int loci_last_error(void);
+
 /**
  * Map a generic object to the underlying wire buffer
  *
@@ -446,6 +469,8 @@ def match_c_gen(out, name):
     c_match.gen_match_conversions(out)
     c_match.gen_serialize(out)
     c_match.gen_deserialize(out)
+    c_match.gen_wire_match_access(out)
+    c_match.gen_match_hash(out)
 
 ################################################################
 # Top Matter
@@ -690,6 +715,55 @@ typedef uint64_t of_match_bmap_t;
         }                                                                    \\
     } while (0)
 
+/**
+ * Hash mixing primitives (MurmurHash3 32-bit round and finalizer)
+ *
+ * of_hash_bytes folds a buffer into a running hash; call
+ * of_hash_finish once on the result.  Words are read in host order,
+ * so hash values are not portable between hosts of different
+ * endianness.
+ */
+static inline uint32_t
+of_hash_mix(uint32_t hash, uint32_t word)
+{
+    word *= 0xcc9e2d51;
+    word = (word << 15) | (word >> 17);
+    word *= 0x1b873593;
+    hash ^= word;
+    hash = (hash << 13) | (hash >> 19);
+    return hash * 5 + 0xe6546b64;
+}
+
+static inline uint32_t
+of_hash_finish(uint32_t hash)
+{
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6b;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35;
+    hash ^= hash >> 16;
+    return hash;
+}
+
+static inline uint32_t
+of_hash_bytes(uint32_t hash, const void *data, int bytes)
+{
+    const uint8_t *ptr = data;
+    uint32_t word;
+
+    for (; bytes >= 4; bytes -= 4, ptr += 4) {
+        MEMCPY(&word, ptr, 4);
+        hash = of_hash_mix(hash, word);
+    }
+    if (bytes > 0) {
+        word = 0;
+        MEMCPY(&word, ptr, bytes);
+        hash = of_hash_mix(hash, word);
+    }
+
+    return hash;
+}
+
 /* The extent of an OF match object is determined by its length field, but
  * aligned to 8 bytes
  */
@@ -982,6 +1056,8 @@ def param_list(cls, m_name, a_type):
             params.append("%s *%s" % (m_type, m_name))
     elif a_type in ["get", "bind"]:
         params.append("%s *%s" % (m_type, m_name))
+    elif a_type in ["wire_bind", "wire_set"]:
+        params.append("of_object_t *%s" % m_name)
     else:
         debug("Class %s, name %s Bad param list a_type: %s" %
             (cls, m_name, a_type))
@@ -1145,6 +1221,17 @@ extern %(get_ret_type)s %(base_name)s_get(
 """ % dict(base_name=base_name, gparams=gparams, sparams=sparams,
            get_ret_type=get_ret_type, set_ret_type=set_ret_type))
 
+            if m_type == "of_match_t":
+                wbparams = ",\n    ".join(param_list(cls, m_name, "wire_bind"))
+                wsparams = ",\n    ".join(param_list(cls, m_name, "wire_set"))
+                out.write("""\
+extern %(ret_type)s %(base_name)s_wire_bind(
+    %(wbparams)s);
+extern %(ret_type)s %(base_name)s_wire_set(
+    %(wsparams)s);
+""" % dict(base_name=base_name, wbparams=wbparams, wsparams=wsparams,
+           ret_type=accessor_return_type("set", m_type)))
+
         if loxi_utils.class_is_list(cls):
             e_type = loxi_utils.list_to_entry_type(cls)
             out.write("""
@@ -1322,7 +1409,16 @@ def gen_get_accessor_body(out, cls, m_type, m_name):
 """ % dict(m_type=m_type[:-2], m_name=m_name))
 
 
-def gen_set_accessor_body(out, cls, m_type, m_name):
+def gen_match_wire_bind_body(out, m_name):
+    """
+    Generate the operations for binding a wire match object to a match member
+    """
+    out.write("""
+    LOCI_ASSERT(cur_len + abs_offset <= WBUF_CURRENT_BYTES(wbuf));
+    OF_TRY(of_match_wire_bind((of_object_t *)obj, %(m_name)s, offset, cur_len));
+""" % dict(m_name=m_name))
+
+def gen_set_accessor_body(out, cls, m_type, m_name, a_type="set"):
     """
     Generate the contents of a set accessor
     """
@@ -1343,18 +1439,22 @@ def gen_set_accessor_body(out, cls, m_type, m_name):
            m_name=m_name))
 
     elif m_type == "of_match_t":
+        if a_type == "wire_set":
+            serialize = "of_match_wire_serialize"
+        else:
+            serialize = "of_match_serialize"
         out.write("""
     {
         /* Match object */
         of_octets_t match_octets;
-        OF_TRY(of_match_serialize(ver, %(m_name)s, &match_octets));
+        OF_TRY(%(serialize)s(ver, %(m_name)s, &match_octets));
         new_len = match_octets.bytes;
         of_wire_buffer_replace_data(wbuf, abs_offset, cur_len,
             match_octets.data, new_len);
         /* Free match serialized octets */
         FREE(match_octets.data);
     }
-""" % dict(m_name=m_name))
+""" % dict(m_name=m_name, serialize=serialize))
 
     else:  # Other object type
         out.write("\n    /* LOCI object type */")
@@ -1468,7 +1568,7 @@ def gen_unified_acc_body(out, cls, m_name, ver_type_map, a_type, m_type):
         out.write("""\
     int cur_len = 0; /* Current length of object data */
 """)
-        if a_type == "set":
+        if a_type in ["set", "wire_set"]:
             out.write("""\
     int new_len, delta; /* For set, need new length and delta */
 """)
@@ -1516,10 +1616,12 @@ def gen_unified_acc_body(out, cls, m_name, ver_type_map, a_type, m_type):
         out.write("    LOCI_ASSERT(cur_len >= 0 && cur_len < 64 * 1024);\n")
 
     # Now generate the common accessor code
-    if a_type in ["get", "bind"]:
+    if a_type == "wire_bind":
+        gen_match_wire_bind_body(out, m_name)
+    elif a_type in ["get", "bind"]:
         gen_get_accessor_body(out, cls, m_type, m_name)
     else:
-        gen_set_accessor_body(out, cls, m_type, m_name)
+        gen_set_accessor_body(out, cls, m_type, m_name, a_type)
 
     out.write("""
     OF_LENGTH_CHECK_ASSERT(obj);
@@ -1572,6 +1674,42 @@ def gen_get_accessor(out, cls, m_name, m_type, ver_type_map):
     out.write("%s\n%s_%s_get(\n    %s)\n" % (ret_type, cls, m_name, params))
     gen_unified_acc_body(out, cls, m_name, ver_type_map, "get", m_type)
 
+def gen_match_wire_accessors(out, cls, m_name, m_type, ver_type_map):
+    """
+    For generating the wire_bind and wire_set calls for match members
+    """
+    params = ",\n    ".join(param_list(cls, m_name, "wire_bind"))
+    out.write("""
+/**
+ * Bind the version specific wire match of %(m_name)s in an object of
+ * type %(cls)s.
+ * @param obj Pointer to an object of type %(cls)s.
+ * @param %(m_name)s Pointer to the wire match object to be filled out.
+ *
+ * The wire match points to the same underlying wire buffer as its parent
+ * and can be used with the of_match_wire_* functions without converting
+ * it to an of_match_t.
+ */
+""" % dict(m_name=m_name, cls=cls))
+    ret_type = accessor_return_type("wire_bind", m_type)
+    out.write("%s\n%s_%s_wire_bind(\n    %s)\n" % (ret_type, cls, m_name, params))
+    gen_unified_acc_body(out, cls, m_name, ver_type_map, "wire_bind", m_type)
+
+    params = ",\n    ".join(param_list(cls, m_name, "wire_set"))
+    out.write("""
+/**
+ * Set %(m_name)s in an object of type %(cls)s from a wire match.
+ * @param obj Pointer to an object of type %(cls)s.
+ * @param %(m_name)s Pointer to the wire match object to copy.
+ *
+ * If the wire match has the same version as obj its bytes are copied
+ * through unchanged; otherwise it is converted through of_match_t.
+ */
+""" % dict(m_name=m_name, cls=cls))
+    ret_type = accessor_return_type("wire_set", m_type)
+    out.write("%s\n%s_%s_wire_set(\n    %s)\n" % (ret_type, cls, m_name, params))
+    gen_unified_acc_body(out, cls, m_name, ver_type_map, "wire_set", m_type)
+
 def gen_accessor_definitions(out, cls):
         for m_name in of_g.ordered_members[cls]:
             if m_name in of_g.skip_members:
@@ -1587,6 +1725,9 @@ def gen_accessor_definitions(out, cls):
             else:
                 gen_get_accessor(out, cls, m_name, m_type, ver_type_map)
 
+            if m_type == "of_match_t":
+                gen_match_wire_accessors(out, cls, m_name, m_type, ver_type_map)
+
             # Now generate set accessor for all objects
             params = ",\n    ".join(param_list(cls, m_name, "set"))
             out.write("""
@@ -84,7 +84,31 @@ extern int of_match_v3_to_match(of_match_v3_t *src, of_match_t *dst);
 extern int of_match_to_wire_match_v1(of_match_t *src, of_match_v1_t *dst);
 extern int of_match_to_wire_match_v2(of_match_t *src, of_match_v2_t *dst);
 extern int of_match_to_wire_match_v3(of_match_t *src, of_match_v3_t *dst);
+
+/*
+ * Wire match access declarations
+ *
+ * These operate directly on a version specific wire match object (see the
+ * *_match_wire_bind accessors) without building an of_match_t.
+ */
+extern int of_match_wire_bind(of_object_t *parent, of_object_t *wire_match,
+                              int offset, int length);
+extern int of_match_wire_to_match(of_object_t *src, of_match_t *dst);
+extern int of_match_wire_serialize(of_version_t version,
+                                   of_object_t *wire_match,
+                                   of_octets_t *octets);
+extern int of_match_wire_to_sparse(of_object_t *src, of_match_sparse_t *dst);
+extern int of_match_sparse_to_match(of_match_sparse_t *src, of_match_t *dst);
+extern int of_match_sparse_get(of_match_sparse_t *match,
+                               of_match_field_t field,
+                               void *value, void *mask);
 """)
+    for key in match.match_keys_sorted:
+        entry = match.of_match_members[key]
+        out.write("""\
+extern int of_match_wire_%(key)s_get(of_object_t *src,
+    %(m_type)s *value, %(m_type)s *mask);
+""" % dict(key=key, m_type=entry["m_type"]))
 
 def gen_v4_match_compat(out):
     """
@@ -176,6 +200,9 @@ typedef struct of_match_s {
     of_match_fields_t fields;
     of_match_fields_t masks;
 } of_match_t;
+""")
+    gen_sparse_match_struct(out)
+    out.write("""
 
 /*
  * AND 'len' bytes starting from 'value' with the corresponding byte in
@@ -221,6 +248,102 @@ extern uint32_t of_ip_index_to_mask(int index);
      ((version) == OF_VERSION_1_1 ? 0xfffe : 0x1000))
 """)
 
+def gen_sparse_match_struct(out):
+    """
+    Generate the sparse match representation
+
+    A sparse match holds only the active fields of a match, with their
+    values and masks packed into a byte buffer at their own sizes, rather
+    than two full copies of every field.
+    """
+    # Entries store the field and its size in a byte each
+    assert len(match.match_keys_sorted) < 256
+    out.write("""
+/**
+ * @brief Identifiers for the fields of the unified match
+ */
+
+typedef enum of_match_field_e {
+""")
+    for key in match.match_keys_sorted:
+        out.write("    OF_MATCH_FIELD_%s,\n" % key.upper())
+    out.write("""\
+    OF_MATCH_FIELD_COUNT
+} of_match_field_t;
+
+/**
+ * @brief Storage for the value or mask of any single match field
+ *
+ * Member names are the same as in of_match_fields_t.
+ */
+
+typedef union of_match_field_value_u {
+""")
+    for key in match.match_keys_sorted:
+        entry = match.of_match_members[key]
+        out.write("    %-20s %s;\n" % (entry["m_type"], entry["name"]))
+    out.write("""\
+} of_match_field_value_t;
+
+/**
+ * @brief An active field of a sparse match
+ *
+ * The value and then the mask of the field, size bytes each, are stored
+ * at offset in the data buffer of the sparse match.
+ */
+
+typedef struct of_match_sparse_entry_s {
+    uint8_t field;
+    uint8_t size;
+    uint16_t offset;
+} of_match_sparse_entry_t;
+
+/**
+ * Maximum number of active fields in an of_match_sparse_t, and the size
+ * of the buffer holding their values and masks. Conversions return
+ * OF_ERROR_RESOURCE for matches that do not fit.
+ */
+#if !defined(OF_MATCH_SPARSE_MAX_FIELDS)
+#define OF_MATCH_SPARSE_MAX_FIELDS 16
+#endif
+
+#if !defined(OF_MATCH_SPARSE_DATA_BYTES)
+#define OF_MATCH_SPARSE_DATA_BYTES 160
+#endif
+
+/**
+ * @brief Sparse match structure holding only the active fields
+ */
+
+typedef struct of_match_sparse_s {
+    of_version_t version;
+    uint16_t count;
+    uint16_t data_used;
+    of_match_sparse_entry_t entries[OF_MATCH_SPARSE_MAX_FIELDS];
+    uint8_t data[OF_MATCH_SPARSE_DATA_BYTES];
+} of_match_sparse_t;
+
+/**
+ * Find a field in a sparse match
+ * @param match The sparse match to search
+ * @param field The field to look for
+ * @returns Pointer to the entry for field or NULL if the field is not matched
+ */
+static inline of_match_sparse_entry_t *
+of_match_sparse_find(of_match_sparse_t *match, of_match_field_t field)
+{
+    int idx;
+
+    for (idx = 0; idx < match->count; idx++) {
+        if (match->entries[idx].field == field) {
+            return &match->entries[idx];
+        }
+    }
+
+    return NULL;
+}
+""")
+
 def gen_oxm_defines(out):
     """
     Generate verbatim definitions for OXM
@@ -768,10 +891,47 @@ def gen_match_comp(out=sys.stdout):
     """
     out.write("""
 /**
- * Determine "more specific" relationship between mac addrs
+ * More-specific-than macro for integer types
  * @return true if v1 is equal to or more specific than v2
  *
- * @todo Could be optimized
+ * If there is a bit that is set in v2 and not in v1, return false.
+ */
+#define OF_MORE_SPECIFIC_INT(v1, v2) (!(~(v1) & (v2)))
+
+/**
+ * Boolean test if two values agree when restricted to a mask
+ */
+#define OF_RESTRICTED_MATCH_INT(v1, v2, mask) \\
+   (((v1) & (mask)) == ((v2) & (mask)))
+
+
+#define OF_OVERLAP_INT(v1, v2, m1, m2) \\
+    ((((v1) & (m1)) & (m2)) == (((v2) & (m1)) & (m2)))
+
+/**
+ * Load a 16-byte IPv6 address or 6-byte MAC address as 64-bit words
+ *
+ * The comparisons below operate on these words instead of byte by
+ * byte.  MEMCPY keeps the loads safe for unaligned addresses; the
+ * unused high bytes of a MAC address word are zero.
+ */
+static inline void
+of_ipv6_words(of_ipv6_t *v, uint64_t *hi, uint64_t *lo) {
+    MEMCPY(hi, &v->addr[0], sizeof(*hi));
+    MEMCPY(lo, &v->addr[8], sizeof(*lo));
+}
+
+static inline uint64_t
+of_mac_addr_word(of_mac_addr_t *v) {
+    uint64_t word = 0;
+
+    MEMCPY(&word, v->addr, OF_MAC_ADDR_BYTES);
+    return word;
+}
+
+/**
+ * Determine "more specific" relationship between IPv6 addrs
+ * @return true if v1 is equal to or more specific than v2
  *
  * Check: Every bit in v2 is set in v1; v1 may have add'l bits set.
  * That is, return false if there is a bit set in v2 and not in v1.
@@ -779,16 +939,13 @@ def gen_match_comp(out=sys.stdout):
 
 static inline int
 of_more_specific_ipv6(of_ipv6_t *v1, of_ipv6_t *v2) {
-    int idx;
+    uint64_t v1_hi, v1_lo, v2_hi, v2_lo;
 
-    for (idx = 0; idx < OF_IPV6_BYTES; idx++) {
-        /* If there's a bit set in v2 that is clear in v1, return false */
-        if (~v1->addr[idx] & v2->addr[idx]) {
-            return 0;
-        }
-    }
+    of_ipv6_words(v1, &v1_hi, &v1_lo);
+    of_ipv6_words(v2, &v2_hi, &v2_lo);
 
-    return 1;
+    /* If there's a bit set in v2 that is clear in v1, return false */
+    return !((~v1_hi & v2_hi) | (~v1_lo & v2_lo));
 }
 
 /**
@@ -797,16 +954,13 @@ of_more_specific_ipv6(of_ipv6_t *v1, of_ipv6_t *v2) {
 
 static inline int
 of_restricted_match_ipv6(of_ipv6_t *v1, of_ipv6_t *v2, of_ipv6_t *mask) {
-    int idx;
+    uint64_t v1_hi, v1_lo, v2_hi, v2_lo, m_hi, m_lo;
 
-    for (idx = 0; idx < OF_IPV6_BYTES; idx++) {
-        if ((v1->addr[idx] & mask->addr[idx]) !=
-               (v2->addr[idx] & mask->addr[idx])) {
-            return 0;
-        }
-    }
+    of_ipv6_words(v1, &v1_hi, &v1_lo);
+    of_ipv6_words(v2, &v2_hi, &v2_lo);
+    of_ipv6_words(mask, &m_hi, &m_lo);
 
-    return 1;
+    return !(((v1_hi ^ v2_hi) & m_hi) | ((v1_lo ^ v2_lo) & m_lo));
 }
 
 /**
@@ -816,16 +970,15 @@ of_restricted_match_ipv6(of_ipv6_t *v1, of_ipv6_t *v2, of_ipv6_t *mask) {
 static inline int
 of_overlap_ipv6(of_ipv6_t *v1, of_ipv6_t *v2,
                          of_ipv6_t *m1, of_ipv6_t *m2) {
-    int idx;
+    uint64_t v1_hi, v1_lo, v2_hi, v2_lo, m1_hi, m1_lo, m2_hi, m2_lo;
 
-    for (idx = 0; idx < OF_IPV6_BYTES; idx++) {
-        if (((v1->addr[idx] & m1->addr[idx]) & m2->addr[idx]) !=
-               ((v2->addr[idx] & m1->addr[idx]) & m2->addr[idx])) {
-            return 0;
-        }
-    }
+    of_ipv6_words(v1, &v1_hi, &v1_lo);
+    of_ipv6_words(v2, &v2_hi, &v2_lo);
+    of_ipv6_words(m1, &m1_hi, &m1_lo);
+    of_ipv6_words(m2, &m2_hi, &m2_lo);
 
-    return 1;
+    return !(((v1_hi ^ v2_hi) & m1_hi & m2_hi) |
+             ((v1_lo ^ v2_lo) & m1_lo & m2_lo));
 }
 
 #define OF_MORE_SPECIFIC_IPV6(v1, v2) of_more_specific_ipv6((v1), (v2))
@@ -839,23 +992,12 @@ of_overlap_ipv6(of_ipv6_t *v1, of_ipv6_t *v2,
  * Determine "more specific" relationship between mac addrs
  * @return true if v1 is equal to or more specific than v2
  *
- * @todo Could be optimized
- *
  * Check: Every bit in v2 is set in v1; v1 may have add'l bits set.
  * That is, return false if there is a bit set in v2 and not in v1.
  */
 static inline int
 of_more_specific_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2) {
-    int idx;
-
-    for (idx = 0; idx < OF_MAC_ADDR_BYTES; idx++) {
-        /* If there's a bit set in v2 that is clear in v1, return false */
-        if (~v1->addr[idx] & v2->addr[idx]) {
-            return 0;
-        }
-    }
-
-    return 1;
+    return OF_MORE_SPECIFIC_INT(of_mac_addr_word(v1), of_mac_addr_word(v2));
 }
 
 /**
@@ -864,16 +1006,8 @@ of_more_specific_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2) {
 static inline int
 of_restricted_match_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2,
                              of_mac_addr_t *mask) {
-    int idx;
-
-    for (idx = 0; idx < OF_MAC_ADDR_BYTES; idx++) {
-        if ((v1->addr[idx] & mask->addr[idx]) !=
-               (v2->addr[idx] & mask->addr[idx])) {
-            return 0;
-        }
-    }
-
-    return 1;
+    return OF_RESTRICTED_MATCH_INT(of_mac_addr_word(v1), of_mac_addr_word(v2),
+                                   of_mac_addr_word(mask));
 }
 
 /**
@@ -883,16 +1017,8 @@ of_restricted_match_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2,
 static inline int
 of_overlap_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2,
                          of_mac_addr_t *m1, of_mac_addr_t *m2) {
-    int idx;
-
-    for (idx = 0; idx < OF_MAC_ADDR_BYTES; idx++) {
-        if (((v1->addr[idx] & m1->addr[idx]) & m2->addr[idx]) !=
-               ((v2->addr[idx] & m1->addr[idx]) & m2->addr[idx])) {
-            return 0;
-        }
-    }
-
-    return 1;
+    return OF_OVERLAP_INT(of_mac_addr_word(v1), of_mac_addr_word(v2),
+                          of_mac_addr_word(m1), of_mac_addr_word(m2));
 }
 
 #define OF_MORE_SPECIFIC_MAC_ADDR(v1, v2) of_more_specific_mac_addr((v1), (v2))
@@ -912,23 +1038,6 @@ of_overlap_mac_addr(of_mac_addr_t *v1, of_mac_addr_t *v2,
 #define OF_OVERLAP_BITMAP_128(v1, v2, m1, m2) \\
     (OF_OVERLAP_INT((v1)->lo, (v2)->lo, (m1)->lo, (m2)->lo) && OF_OVERLAP_INT((v1)->hi, (v2)->hi, (m1)->hi, (m2)->hi))
 
-/**
- * More-specific-than macro for integer types; see above
- * @return true if v1 is equal to or more specific than v2
- *
- * If there is a bit that is set in v2 and not in v1, return false.
- */
-#define OF_MORE_SPECIFIC_INT(v1, v2) (!(~(v1) & (v2)))
-
-/**
- * Boolean test if two values agree when restricted to a mask
- */
-#define OF_RESTRICTED_MATCH_INT(v1, v2, mask) \\
-   (((v1) & (mask)) == ((v2) & (mask)))
-
-
-#define OF_OVERLAP_INT(v1, v2, m1, m2) \\
-    ((((v1) & (m1)) & (m2)) == (((v2) & (m1)) & (m2)))
 """)
 
     out.write("""
@@ -943,6 +1052,30 @@ of_match_eq(of_match_t *match1, of_match_t *match2)
     return (MEMCMP(match1, match2, sizeof(of_match_t)) == 0);
 }
 
+/**
+ * Compare the fields and masks of two match structures
+ *
+ * Unlike of_match_eq, the version is ignored, so the same flow space
+ * parsed from different wire versions compares equal.
+ */
+static inline int
+of_match_fields_eq(of_match_t *match1, of_match_t *match2)
+{
+    return (MEMCMP(&match1->fields, &match2->fields,
+                   sizeof(match1->fields)) == 0 &&
+            MEMCMP(&match1->masks, &match2->masks,
+                   sizeof(match1->masks)) == 0);
+}
+
+/**
+ * Hash the active fields of a match structure
+ *
+ * Only the values and masks of active fields are hashed, so matches
+ * which are of_match_fields_eq hash to the same value regardless of
+ * the wire version they came from.
+ */
+extern uint32_t of_match_hash(of_match_t *match);
+
 /**
  * Is the entry match more specific than (or equal to) the query match?
  * @param entry Match expected to be more specific (subset of query)
@@ -1117,3 +1250,385 @@ of_ip_index_to_mask(int index)
     gen_v1_to_unified_match(out)
     gen_v2_to_unified_match(out)
     gen_v3_to_unified_match(out)
+
+def gen_wire_match_access(out):
+    """
+    Generate functions that work directly on wire match objects
+
+    These avoid the full conversion to and from of_match_t when only some
+    fields are needed or when a match is forwarded unchanged.
+    """
+    out.write("""
+/**
+ * Bind a version specific wire match object to a match in a parent
+ * @param parent The object containing the match
+ * @param wire_match The wire match object to initialize
+ * @param offset The offset of the match RELATIVE TO THE PARENT
+ * @param length The padded length of the match
+ */
+
+int
+of_match_wire_bind(of_object_t *parent, of_object_t *wire_match,
+                   int offset, int length)
+{
+    switch (parent->version) {
+""")
+    for version in of_g.of_version_range:
+        out.write("""
+    case %(ver_name)s:
+        of_match_v%(version)d_init(wire_match, %(ver_name)s, length, 1);
+        break;
+""" % dict(version=version, ver_name=of_g.of_version_wire2name[version]))
+    out.write("""
+    default:
+        return OF_ERROR_COMPAT;
+    }
+
+    of_object_attach(parent, wire_match, offset, length);
+
+    return OF_ERROR_NONE;
+}
+
+/**
+ * Convert a version specific wire match object to a generic match object
+ * @param src The wire match object
+ * @param dst Pointer to the generic match object destination
+ */
+
+int
+of_match_wire_to_match(of_object_t *src, of_match_t *dst)
+{
+    switch (src->version) {
+""")
+    for version in of_g.of_version_range:
+        out.write("""
+    case %(ver_name)s:
+        return of_match_v%(version)d_to_match(src, dst);
+""" % dict(version=version, ver_name=of_g.of_version_wire2name[version]))
+    out.write("""
+    default:
+        return OF_ERROR_COMPAT;
+    }
+}
+
+/**
+ * Serialize a wire match object according to the version passed
+ * @param version The version to use for serialization protocol
+ * @param wire_match The wire match object to serialize
+ * @param octets Pointer to an octets object to fill out
+ *
+ * If the wire match already has the requested version its bytes are
+ * copied through unchanged. Otherwise it is converted through of_match_t.
+ *
+ * As with of_match_serialize, FREE must be called on octets->data when
+ * processing of the object is complete.
+ */
+
+int
+of_match_wire_serialize(of_version_t version, of_object_t *wire_match,
+                        of_octets_t *octets)
+{
+    of_match_t match;
+
+    if (wire_match->version == version) {
+        octets->bytes = OF_MATCH_BYTES(wire_match->length);
+        if ((octets->data = (uint8_t *)MALLOC(octets->bytes)) == NULL) {
+            return OF_ERROR_RESOURCE;
+        }
+        MEMSET(octets->data, 0, octets->bytes);
+        MEMCPY(octets->data, OF_OBJECT_BUFFER_INDEX(wire_match, 0),
+               wire_match->length);
+        return OF_ERROR_NONE;
+    }
+
+    OF_TRY(of_match_wire_to_match(wire_match, &match));
+    return of_match_serialize(version, &match, octets);
+}
+""")
+
+    for key in match.match_keys_sorted:
+        entry = match.of_match_members[key]
+        ku = key.upper()
+        out.write("""
+/**
+ * Get %(key)s from a wire match object without converting the match
+ * @param src The wire match object
+ * @param value Filled out with the (masked) value of the field
+ * @param mask Filled out with the mask of the field
+ * @returns OF_ERROR_NONE if the field is matched, OF_ERROR_RANGE if not
+ */
+
+int
+of_match_wire_%(key)s_get(of_object_t *src,
+    %(m_type)s *value, %(m_type)s *mask)
+{
+""" % dict(key=key, m_type=entry["m_type"]))
+        if key in match.of_v1_keys or \
+                (key in match.of_v2_keys and key not in match.of_v2_full_mask):
+            out.write("    of_wc_bmap_t wc;\n")
+        out.write("""\
+    of_list_oxm_t oxm_list;
+    of_oxm_t oxm_entry;
+    int rv;
+
+    switch (src->version) {
+""")
+        if key in match.of_v1_keys:
+            out.write("    case OF_VERSION_1_0:\n")
+            out.write("        of_match_v1_wildcards_get(src, &wc);\n")
+            if key in ["ipv4_src", "ipv4_dst"]:
+                out.write("""\
+        *mask = of_ip_index_to_mask(OF_MATCH_V1_WC_%(ku)s_GET(wc));
+        if (*mask == 0) {
+            return OF_ERROR_RANGE;
+        }
+        of_match_v1_%(key)s_get(src, value);
+        *value &= *mask;
+        return OF_ERROR_NONE;
+""" % dict(key=key, ku=ku))
+            else:
+                out.write("""\
+        if (OF_MATCH_V1_WC_%(ku)s_TEST(wc)) {
+            return OF_ERROR_RANGE;
+        }
+        of_match_v1_%(key)s_get(src, value);
+        MEMSET(mask, 0xff, sizeof(*mask));
+        return OF_ERROR_NONE;
+""" % dict(key=key, ku=ku))
+        if key in match.of_v2_keys:
+            out.write("    case OF_VERSION_1_1:\n")
+            if key in match.of_v2_full_mask:
+                out.write("""\
+        of_match_v2_%(key)s_mask_get(src, mask);
+        if (!OF_VARIABLE_IS_NON_ZERO(mask)) {
+            return OF_ERROR_RANGE;
+        }
+        of_match_v2_%(key)s_get(src, value);
+        of_memmask(value, mask, sizeof(*value));
+        return OF_ERROR_NONE;
+""" % dict(key=key, ku=ku))
+            else:
+                out.write("""\
+        of_match_v2_wildcards_get(src, &wc);
+        if (OF_MATCH_V2_WC_%(ku)s_TEST(wc)) {
+            return OF_ERROR_RANGE;
+        }
+        of_match_v2_%(key)s_get(src, value);
+        MEMSET(mask, 0xff, sizeof(*mask));
+        return OF_ERROR_NONE;
+""" % dict(key=key, ku=ku))
+        out.write("""\
+    case OF_VERSION_1_2:
+    case OF_VERSION_1_3:
+        of_match_v3_oxm_list_bind(src, &oxm_list);
+        OF_LIST_OXM_ITER(&oxm_list, &oxm_entry, rv) {
+            switch (oxm_entry.header.object_id) {
+            case OF_OXM_%(ku)s_MASKED:
+                of_oxm_%(key)s_masked_value_mask_get(
+                    &oxm_entry.%(key)s_masked, mask);
+                of_oxm_%(key)s_masked_value_get(
+                    &oxm_entry.%(key)s_masked, value);
+                of_memmask(value, mask, sizeof(*value));
+                return OF_ERROR_NONE;
+            case OF_OXM_%(ku)s:
+                of_oxm_%(key)s_value_get(&oxm_entry.%(key)s, value);
+                MEMSET(mask, 0xff, sizeof(*mask));
+                return OF_ERROR_NONE;
+            default:
+                break;
+            }
+        }
+        return OF_ERROR_RANGE;
+    default:
+        return OF_ERROR_RANGE;
+    }
+}
+""" % dict(key=key, ku=ku))
+
+    out.write("""
+static int
+of_match_sparse_append(of_match_sparse_t *match, of_match_field_t field,
+                       const void *value, const void *mask, int size)
+{
+    of_match_sparse_entry_t *entry;
+
+    if (match->count >= OF_MATCH_SPARSE_MAX_FIELDS ||
+        match->data_used + 2 * size > OF_MATCH_SPARSE_DATA_BYTES) {
+        return OF_ERROR_RESOURCE;
+    }
+    entry = &match->entries[match->count++];
+    entry->field = field;
+    entry->size = size;
+    entry->offset = match->data_used;
+    MEMCPY(&match->data[entry->offset], value, size);
+    MEMCPY(&match->data[entry->offset + size], mask, size);
+    match->data_used += 2 * size;
+    return OF_ERROR_NONE;
+}
+
+/**
+ * Get the value and mask of a field of a sparse match
+ * @param match The sparse match
+ * @param field The field to get
+ * @param value Pointer to the value destination, of the field's type
+ * @param mask Pointer to the mask destination, of the field's type
+ * @returns OF_ERROR_RANGE if the field is not matched
+ */
+
+int
+of_match_sparse_get(of_match_sparse_t *match, of_match_field_t field,
+                    void *value, void *mask)
+{
+    of_match_sparse_entry_t *entry;
+
+    if ((entry = of_match_sparse_find(match, field)) == NULL) {
+        return OF_ERROR_RANGE;
+    }
+    MEMCPY(value, &match->data[entry->offset], entry->size);
+    MEMCPY(mask, &match->data[entry->offset + entry->size], entry->size);
+    return OF_ERROR_NONE;
+}
+
+/**
+ * Convert a wire match object to a sparse match
+ * @param src The wire match object
+ * @param dst Pointer to the sparse match destination
+ *
+ * For OXM matches the entries are in wire order; otherwise they are in
+ * the standard field order.
+ */
+
+int
+of_match_wire_to_sparse(of_object_t *src, of_match_sparse_t *dst)
+{
+    of_match_field_value_t value;
+    of_match_field_value_t mask;
+    of_match_field_t field;
+    of_list_oxm_t oxm_list;
+    of_oxm_t oxm_entry;
+    int size;
+    int rv;
+
+    dst->version = src->version;
+    dst->count = 0;
+    dst->data_used = 0;
+
+    switch (src->version) {
+""")
+    for version, name in [(1, "OF_VERSION_1_0"), (2, "OF_VERSION_1_1")]:
+        out.write("    case %s:\n" % name)
+        for key in match.match_keys_sorted:
+            if key not in match.match_keys[version]:
+                continue
+            out.write("""\
+        if (of_match_wire_%(key)s_get(src, &value.%(key)s,
+                                      &mask.%(key)s) == OF_ERROR_NONE) {
+            OF_TRY(of_match_sparse_append(dst, OF_MATCH_FIELD_%(ku)s,
+                                          &value, &mask,
+                                          sizeof(value.%(key)s)));
+        }
+""" % dict(key=key, ku=key.upper()))
+        out.write("        break;\n")
+    out.write("""\
+    case OF_VERSION_1_2:
+    case OF_VERSION_1_3:
+        of_match_v3_oxm_list_bind(src, &oxm_list);
+        OF_LIST_OXM_ITER(&oxm_list, &oxm_entry, rv) {
+            switch (oxm_entry.header.object_id) {
+""")
+    for key in match.match_keys_sorted:
+        out.write("""\
+            case OF_OXM_%(ku)s_MASKED:
+                field = OF_MATCH_FIELD_%(ku)s;
+                size = sizeof(value.%(key)s);
+                of_oxm_%(key)s_masked_value_mask_get(
+                    &oxm_entry.%(key)s_masked, &mask.%(key)s);
+                of_oxm_%(key)s_masked_value_get(
+                    &oxm_entry.%(key)s_masked, &value.%(key)s);
+                of_memmask(&value.%(key)s, &mask.%(key)s, size);
+                break;
+            case OF_OXM_%(ku)s:
+                field = OF_MATCH_FIELD_%(ku)s;
+                size = sizeof(value.%(key)s);
+                of_oxm_%(key)s_value_get(&oxm_entry.%(key)s, &value.%(key)s);
+                MEMSET(&mask.%(key)s, 0xff, size);
+                break;
+""" % dict(key=key, ku=key.upper()))
+    out.write("""\
+            default:
+                return OF_ERROR_PARSE;
+            }
+            OF_TRY(of_match_sparse_append(dst, field, &value, &mask, size));
+        }
+        break;
+    default:
+        return OF_ERROR_COMPAT;
+    }
+
+    return OF_ERROR_NONE;
+}
+
+/**
+ * Expand a sparse match into a generic match object
+ * @param src Pointer to the sparse match source
+ * @param dst Pointer to the generic match object destination
+ */
+
+int
+of_match_sparse_to_match(of_match_sparse_t *src, of_match_t *dst)
+{
+    of_match_sparse_entry_t *entry;
+    uint8_t *value;
+    uint8_t *mask;
+    int idx;
+
+    MEMSET(dst, 0, sizeof(*dst));
+    dst->version = src->version;
+
+    for (idx = 0; idx < src->count; idx++) {
+        entry = &src->entries[idx];
+        value = &src->data[entry->offset];
+        mask = value + entry->size;
+        switch (entry->field) {
+""")
+    for key in match.match_keys_sorted:
+        out.write("""\
+        case OF_MATCH_FIELD_%(ku)s:
+            MEMCPY(&dst->fields.%(key)s, value, sizeof(dst->fields.%(key)s));
+            MEMCPY(&dst->masks.%(key)s, mask, sizeof(dst->masks.%(key)s));
+            break;
+""" % dict(key=key, ku=key.upper()))
+    out.write("""\
+        default:
+            return OF_ERROR_PARAM;
+        }
+    }
+
+    return OF_ERROR_NONE;
+}
+""")
+
+def gen_match_hash(out):
+    """
+    Generate of_match_hash, which hashes the active fields of a match
+    """
+    out.write("""
+uint32_t
+of_match_hash(of_match_t *match)
+{
+    uint32_t hash = 0;
+""")
+    for key in match.match_keys_sorted:
+        out.write("""
+    if (OF_MATCH_MASK_%(ku)s_ACTIVE_TEST(match)) {
+        hash = of_hash_mix(hash, OF_MATCH_FIELD_%(ku)s);
+        hash = of_hash_bytes(hash, &match->fields.%(key)s,
+                             sizeof(match->fields.%(key)s));
+        hash = of_hash_bytes(hash, &match->masks.%(key)s,
+                             sizeof(match->masks.%(key)s));
+    }
+""" % dict(key=key, ku=key.upper()))
+    out.write("""
+    return of_hash_finish(hash);
+}
+""")
@@ -253,8 +253,7 @@ int
 of_object_show(loci_writer_f writer, void* cookie, of_object_t *obj)
 {
     if ((obj->object_id > 0) && (obj->object_id < OF_OBJECT_COUNT)) {
-        if (((obj)->version > 0) && ((obj)->version <= OF_VERSION_1_2)) {
-            /* @fixme VERSION */
+        if (((obj)->version > 0) && ((obj)->version <= OF_VERSION_1_3)) {
             return show_funs[obj->version][obj->object_id](writer, cookie, (of_object_t *)obj);
         } else {
             return writer(cookie, "Bad version %d\\n", obj->version);
@@ -264,3 +263,398 @@ of_object_show(loci_writer_f writer, void* cookie, of_object_t *obj)
 }
 """)
 
+
+def gen_obj_show_buf_c(out, name):
+    loxi_utils.gen_c_copy_license(out)
+    out.write("""
+/**
+ *
+ * AUTOMATICALLY GENERATED FILE.  Edits will be lost on regen.
+ *
+ * Source file for buffered object showing.
+ *
+ * These functions render the same text as of_object_show into a
+ * caller-supplied buffer.  Field names are emitted as precomputed
+ * literals and the common value types are formatted by hand rather
+ * than through the writer's printf-style interface.
+ *
+ * The per-type LOCI_SHOW macros from loci_show.h are redefined below
+ * to target the buffer, so the per-field display choices made there
+ * apply here unchanged.
+ */
+
+#define DISABLE_WARN_UNUSED_RESULT
+#include <loci/loci.h>
+#include <loci/loci_show.h>
+#include <loci/loci_obj_show.h>
+#include <stdarg.h>
+
+typedef struct loci_show_buf_s {
+    char *data;
+    int size;  /* Capacity of data */
+    int len;   /* Length of the full text, may exceed size */
+} loci_show_buf_t;
+
+typedef void (*loci_obj_show_buf_f)(loci_show_buf_t *buf, of_object_t *obj);
+
+static const char show_buf_hex_digits[] = "0123456789abcdef";
+
+static inline void
+show_buf_write(loci_show_buf_t *buf, const char *str, int len)
+{
+    int avail = buf->size - buf->len;
+
+    if (avail > 0) {
+        MEMCPY(buf->data + buf->len, str, len < avail ? len : avail);
+    }
+    buf->len += len;
+}
+
+#define SHOW_BUF_LITERAL(buf, str) show_buf_write(buf, str, sizeof(str) - 1)
+
+static void
+show_buf_dec(loci_show_buf_t *buf, uint64_t val)
+{
+    char tmp[20];
+    int idx = sizeof(tmp);
+
+    do {
+        tmp[--idx] = '0' + val % 10;
+        val /= 10;
+    } while (val);
+
+    show_buf_write(buf, tmp + idx, sizeof(tmp) - idx);
+}
+
+static void
+show_buf_sdec(loci_show_buf_t *buf, int64_t val)
+{
+    if (val < 0) {
+        SHOW_BUF_LITERAL(buf, "-");
+        show_buf_dec(buf, -(uint64_t)val);
+    } else {
+        show_buf_dec(buf, val);
+    }
+}
+
+/* Lower case hex, zero padded to at least min_digits */
+static void
+show_buf_hex(loci_show_buf_t *buf, uint64_t val, int min_digits)
+{
+    char tmp[16];
+    int idx = sizeof(tmp);
+
+    do {
+        tmp[--idx] = show_buf_hex_digits[val & 0xf];
+        val >>= 4;
+    } while (val || (int)sizeof(tmp) - idx < min_digits);
+
+    show_buf_write(buf, tmp + idx, sizeof(tmp) - idx);
+}
+
+static void
+show_buf_string(loci_show_buf_t *buf, const char *str, int max_len)
+{
+    int len = 0;
+
+    while (len < max_len && str[len] != '\\0') {
+        len++;
+    }
+    show_buf_write(buf, str, len);
+}
+
+/* For the rare types whose text is defined by printf itself */
+static void
+show_buf_printf(loci_show_buf_t *buf, const char *fmt, ...)
+{
+    int avail = buf->size - buf->len;
+    va_list ap;
+    int rv;
+
+    va_start(ap, fmt);
+    rv = vsnprintf(avail > 0 ? buf->data + buf->len : NULL,
+                   avail > 0 ? avail : 0, fmt, ap);
+    va_end(ap);
+
+    if (rv > 0) {
+        buf->len += rv;
+    }
+}
+
+static void
+show_buf_u32(loci_show_buf_t *buf, uint32_t val)
+{
+    show_buf_dec(buf, val);
+    SHOW_BUF_LITERAL(buf, " (0x");
+    show_buf_hex(buf, val, 1);
+    SHOW_BUF_LITERAL(buf, ")");
+}
+
+static void
+show_buf_u64(loci_show_buf_t *buf, uint64_t val)
+{
+    show_buf_dec(buf, val);
+    SHOW_BUF_LITERAL(buf, "(0x");
+    show_buf_hex(buf, val, 1);
+    SHOW_BUF_LITERAL(buf, ")");
+}
+
+static void
+show_buf_mac(loci_show_buf_t *buf, of_mac_addr_t *mac)
+{
+    int idx;
+
+    for (idx = 0; idx < OF_MAC_ADDR_BYTES; idx++) {
+        if (idx > 0) {
+            SHOW_BUF_LITERAL(buf, ":");
+        }
+        show_buf_hex(buf, mac->addr[idx], 2);
+    }
+}
+
+static void
+show_buf_ipv4(loci_show_buf_t *buf, uint32_t val)
+{
+    show_buf_dec(buf, val >> 24);
+    SHOW_BUF_LITERAL(buf, ".");
+    show_buf_dec(buf, (val >> 16) & 0xff);
+    SHOW_BUF_LITERAL(buf, ".");
+    show_buf_dec(buf, (val >> 8) & 0xff);
+    SHOW_BUF_LITERAL(buf, ".");
+    show_buf_dec(buf, val & 0xff);
+}
+
+static void
+show_buf_ipv6(loci_show_buf_t *buf, of_ipv6_t *ipv6)
+{
+    int idx;
+
+    for (idx = 0; idx < OF_IPV6_BYTES; idx++) {
+        if (idx > 0 && !(idx & 1)) {
+            SHOW_BUF_LITERAL(buf, ":");
+        }
+        show_buf_hex(buf, ipv6->addr[idx], 2);
+    }
+}
+
+static void show_buf_match(loci_show_buf_t *buf, of_match_t *match);
+static void of_object_show_buf(loci_show_buf_t *buf, of_object_t *obj);
+
+/*
+ * Retarget the per-type show macros.  The writer argument is unused;
+ * the cookie is the show buffer.
+ */
+#undef LOCI_SHOW_u8
+#undef LOCI_SHOW_u16
+#undef LOCI_SHOW_u32
+#undef LOCI_SHOW_u64
+#undef LOCI_SHOW_x8
+#undef LOCI_SHOW_x16
+#undef LOCI_SHOW_x32
+#undef LOCI_SHOW_x64
+#undef LOCI_SHOW_d8
+#undef LOCI_SHOW_d16
+#undef LOCI_SHOW_d32
+#undef LOCI_SHOW_d64
+#undef LOCI_SHOW_port_no
+#undef LOCI_SHOW_wc_bmap
+#undef LOCI_SHOW_match_bmap
+#undef LOCI_SHOW_octets
+#undef LOCI_SHOW_mac
+#undef LOCI_SHOW_ipv4
+#undef LOCI_SHOW_ipv6
+#undef LOCI_SHOW_string
+#undef LOCI_SHOW_match
+#undef LOCI_SHOW_bitmap_128
+#undef LOCI_SHOW_checksum_128
+
+#define LOCI_SHOW_u8(writer, buf, val) show_buf_dec(buf, val)
+#define LOCI_SHOW_u16(writer, buf, val) show_buf_u32(buf, val)
+#define LOCI_SHOW_u32(writer, buf, val) show_buf_u32(buf, val)
+#define LOCI_SHOW_u64(writer, buf, val) show_buf_u64(buf, val)
+#define LOCI_SHOW_x8(writer, buf, val) \\
+    (SHOW_BUF_LITERAL(buf, "0x"), show_buf_hex(buf, val, 1))
+#define LOCI_SHOW_x16(writer, buf, val) LOCI_SHOW_x8(writer, buf, val)
+#define LOCI_SHOW_x32(writer, buf, val) LOCI_SHOW_x8(writer, buf, val)
+#define LOCI_SHOW_x64(writer, buf, val) LOCI_SHOW_x8(writer, buf, val)
+/* Match printf's sign handling for %d of each width */
+#define LOCI_SHOW_d8(writer, buf, val) show_buf_sdec(buf, (int)(val))
+#define LOCI_SHOW_d16(writer, buf, val) show_buf_sdec(buf, (int)(val))
+#define LOCI_SHOW_d32(writer, buf, val) show_buf_sdec(buf, (int32_t)(val))
+#define LOCI_SHOW_d64(writer, buf, val) show_buf_sdec(buf, (int64_t)(val))
+#define LOCI_SHOW_port_no(writer, buf, val) show_buf_sdec(buf, (int32_t)(val))
+#define LOCI_SHOW_wc_bmap(writer, buf, val) LOCI_SHOW_x64(writer, buf, val)
+#define LOCI_SHOW_match_bmap(writer, buf, val) LOCI_SHOW_x64(writer, buf, val)
+#define LOCI_SHOW_octets(writer, buf, val) \\
+    show_buf_printf(buf, "%d bytes at location %p", (val).bytes, (val).data)
+#define LOCI_SHOW_mac(writer, buf, val) show_buf_mac(buf, &(val))
+#define LOCI_SHOW_ipv4(writer, buf, val) show_buf_ipv4(buf, val)
+#define LOCI_SHOW_ipv6(writer, buf, val) show_buf_ipv6(buf, &(val))
+#define LOCI_SHOW_string(writer, buf, val) \\
+    show_buf_string(buf, val, sizeof(val))
+#define LOCI_SHOW_match(writer, buf, val) show_buf_match(buf, &(val))
+#define LOCI_SHOW_bitmap_128(writer, buf, val) \\
+    (show_buf_hex(buf, (val).hi, 1), show_buf_hex(buf, (val).lo, 1))
+#define LOCI_SHOW_checksum_128(writer, buf, val) \\
+    (show_buf_hex(buf, (val).hi, 16), show_buf_hex(buf, (val).lo, 16))
+
+static void
+unknown_show_buf(loci_show_buf_t *buf, of_object_t *obj)
+{
+    show_buf_printf(buf, "Unable to print object of type %d, version %d\\n",
+                    obj->object_id, obj->version);
+}
+""")
+
+    for version in of_g.of_version_range:
+        for cls in of_g.standard_class_order:
+            if not loxi_utils.class_in_version(cls, version):
+                continue
+            if cls in type_maps.inheritance_map:
+                continue
+            out.write("""\
+static void %(cls)s_%(ver_name)s_show_buf(loci_show_buf_t *buf, %(cls)s_t *obj);
+""" % dict(cls=cls, ver_name=loxi_utils.version_to_name(version)))
+
+    for version in of_g.of_version_range:
+        ver_name = loxi_utils.version_to_name(version)
+        for cls in of_g.standard_class_order:
+            if not loxi_utils.class_in_version(cls, version):
+                continue
+            if cls in type_maps.inheritance_map:
+                continue
+            out.write("""
+static void
+%(cls)s_%(ver_name)s_show_buf(loci_show_buf_t *buf, %(cls)s_t *obj)
+{
+""" % dict(cls=cls, ver_name=ver_name))
+
+            members, member_types = loxi_utils.all_member_types_get(cls, version)
+            for m_type in member_types:
+                out.write("    %s %s;\n" % (m_type, var_name_map(m_type)))
+                if loxi_utils.class_is_list(m_type):
+                    base_type = loxi_utils.list_to_entry_type(m_type)
+                    out.write("    %s elt;\n    int rv;\n" % base_type)
+            for member in members:
+                m_type = member["m_type"]
+                m_name = member["name"]
+                emitter = "LOCI_SHOW_" + loxi_utils.type_to_short_name(m_type) + "_" + m_name;
+                if loxi_utils.skip_member_name(m_name):
+                    continue
+                if (loxi_utils.type_is_scalar(m_type) or
+                    m_type in ["of_match_t", "of_octets_t"]):
+                    out.write("""
+    %(cls)s_%(m_name)s_get(obj, &%(v_name)s);
+    SHOW_BUF_LITERAL(buf, "%(m_name)s=");
+    %(emitter)s(NULL, buf, %(v_name)s);
+    SHOW_BUF_LITERAL(buf, " ");
+""" % dict(cls=cls, m_name=m_name, v_name=var_name_map(m_type),
+           emitter=emitter))
+                elif loxi_utils.class_is_list(m_type):
+                    sub_cls = m_type[:-2] # Trim _t
+                    elt_type = loxi_utils.list_to_entry_type(m_type)
+                    out.write("""
+    SHOW_BUF_LITERAL(buf, "%(elt_type)s={ ");
+    %(cls)s_%(m_name)s_bind(obj, &%(v_name)s);
+    %(u_type)s_ITER(&%(v_name)s, &elt, rv) {
+        of_object_show_buf(buf, (of_object_t *)&elt);
+    }
+    SHOW_BUF_LITERAL(buf, "} ");
+""" % dict(u_type=sub_cls.upper(), v_name=var_name_map(m_type),
+           elt_type=elt_type, cls=cls, m_name=m_name))
+                else:
+                    sub_cls = m_type[:-2] # Trim _t
+                    out.write("""
+    %(cls)s_%(m_name)s_bind(obj, &%(v_name)s);
+    %(sub_cls)s_%(ver_name)s_show_buf(buf, &%(v_name)s);
+""" % dict(cls=cls, sub_cls=sub_cls, m_name=m_name,
+           v_name=var_name_map(m_type), ver_name=ver_name))
+
+            out.write("}\n")
+
+    out.write("""
+static void
+show_buf_match(loci_show_buf_t *buf, of_match_t *match)
+{
+""")
+    for key, entry in match.of_match_members.items():
+        m_type = entry["m_type"]
+        emitter = "LOCI_SHOW_" + loxi_utils.type_to_short_name(m_type) + "_" + key;
+        out.write("""
+    if (OF_MATCH_MASK_%(ku)s_ACTIVE_TEST(match)) {
+        SHOW_BUF_LITERAL(buf, "%(key)s active=");
+        %(emitter)s(NULL, buf, match->fields.%(key)s);
+        SHOW_BUF_LITERAL(buf, "/");
+        %(emitter)s(NULL, buf, match->masks.%(key)s);
+        SHOW_BUF_LITERAL(buf, " ");
+    }
+""" % dict(key=key, ku=key.upper(), emitter=emitter))
+    out.write("}\n")
+
+    for version in of_g.of_version_range:
+        out.write("""
+static const loci_obj_show_buf_f show_buf_funs_v%(version)s[OF_OBJECT_COUNT] = {
+""" % dict(version=version))
+        out.write("    unknown_show_buf, /* of_object, not a valid specific type */\n")
+        for j, cls in enumerate(of_g.all_class_order):
+            comma = ""
+            if j < len(of_g.all_class_order) - 1: # Avoid ultimate comma
+                comma = ","
+
+            if (not loxi_utils.class_in_version(cls, version) or
+                    cls in type_maps.inheritance_map):
+                out.write("    unknown_show_buf%s\n" % comma);
+            else:
+                out.write("    (loci_obj_show_buf_f)%s_%s_show_buf%s\n" %
+                          (cls, loxi_utils.version_to_name(version), comma))
+        out.write("};\n\n")
+
+    out.write("""
+static const loci_obj_show_buf_f *const show_buf_funs[5] = {
+    NULL,
+    show_buf_funs_v1,
+    show_buf_funs_v2,
+    show_buf_funs_v3,
+    show_buf_funs_v4
+};
+
+static void
+of_object_show_buf(loci_show_buf_t *buf, of_object_t *obj)
+{
+    if ((obj->object_id > 0) && (obj->object_id < OF_OBJECT_COUNT)) {
+        if (((obj)->version > 0) && ((obj)->version <= OF_VERSION_1_3)) {
+            show_buf_funs[obj->version][obj->object_id](buf, obj);
+        } else {
+            show_buf_printf(buf, "Bad version %d\\n", obj->version);
+        }
+    } else {
+        show_buf_printf(buf, "Bad object id %d\\n", obj->object_id);
+    }
+}
+
+int
+of_object_show_to_buffer(char *data, int size, of_object_t *obj)
+{
+    loci_show_buf_t buf = { data, size, 0 };
+
+    of_object_show_buf(&buf, obj);
+
+    if (size > 0) {
+        data[buf.len < size ? buf.len : size - 1] = '\\0';
+    }
+
+    return buf.len;
+}
+
+int
+of_object_show_buffered(loci_writer_f writer, void *cookie, of_object_t *obj,
+                        char *data, int size)
+{
+    if (of_object_show_to_buffer(data, size, obj) >= size) {
+        /* Too long for the buffer; use the unbuffered path */
+        return of_object_show(writer, cookie, obj);
+    }
+
+    return writer(cookie, "%s", data);
+}
+""")
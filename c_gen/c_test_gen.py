@@ -347,9 +347,11 @@ extern int of_match_populate(of_match_t *match, of_version_t version,
 extern int of_match_check(of_match_t *match, of_version_t version, int value);
 extern int test_ident_macros(void);
 extern int test_dump_objs(void);
+extern int test_show_objs(void);
 
 /* In test_match_utils.c */
 extern int test_match_utils(void);
+extern int test_match_hash(void);
 
 extern int run_unified_accessor_tests(void);
 extern int run_match_tests(void);
@@ -363,6 +365,8 @@ extern int run_validator_tests(void);
 
 extern int run_list_limits_tests(void);
 
+extern int run_thread_tests(void);
+
 extern int test_ext_objs(void);
 extern int test_datafiles(void);
 
@@ -420,8 +424,10 @@ def gen_common_test(out, name):
 #define DISABLE_WARN_UNUSED_RESULT
 #include "loci_log.h"
 #include <loci/loci_obj_dump.h>
+#include <loci/loci_show.h>
 #include <locitest/unittest.h>
 #include <locitest/test_common.h>
+#include <stdarg.h>
 
 /* mcheck is a glibc extension */
 #if defined(__linux__)
@@ -1049,6 +1055,115 @@ test_match_3(void)
     out.write("""
     return TEST_PASS;
 }
+""")
+
+    out.write("""
+static int
+test_match_4(void)
+{
+    of_flow_add_t *flow_add;
+    of_flow_add_t *copy;
+    of_object_t wire_match;
+    of_match_sparse_t sparse;
+    of_match_field_value_t value;
+    of_match_field_value_t mask;
+    of_match_t match1;
+    of_match_t match2;
+    int value_seed = 1;
+    int active;
+    int data_bytes;
+    int rv;
+
+    /* The sparse match must be worth using */
+    TEST_ASSERT(sizeof(of_match_sparse_t) < sizeof(of_match_t) / 2);
+""")
+    for version in of_g.of_version_range:
+        out.write("""
+    /* Wire match access for version %(v_name)s */
+    TEST_ASSERT((value_seed = of_match_populate(&match1, %(v_name)s, value_seed)) > 0);
+    flow_add = of_flow_add_new(%(v_name)s);
+    TEST_ASSERT(flow_add != NULL);
+    TEST_OK(of_flow_add_match_set(flow_add, &match1));
+    TEST_OK(of_flow_add_match_get(flow_add, &match1));
+    TEST_OK(of_flow_add_match_wire_bind(flow_add, &wire_match));
+    active = 0;
+    data_bytes = 0;
+""" % dict(v_name=loxi_utils.version_to_name(version)))
+        for key in match.match_keys_sorted:
+            if version in [1, 2] and key not in match.match_keys[version]:
+                continue
+            out.write("""
+    rv = of_match_wire_%(key)s_get(&wire_match, &value.%(key)s, &mask.%(key)s);
+    if (OF_MATCH_MASK_%(ku)s_ACTIVE_TEST(&match1)) {
+        TEST_OK(rv);
+        TEST_ASSERT(memcmp(&value.%(key)s, &match1.fields.%(key)s, sizeof(value.%(key)s)) == 0);
+        TEST_ASSERT(memcmp(&mask.%(key)s, &match1.masks.%(key)s, sizeof(mask.%(key)s)) == 0);
+        active++;
+        data_bytes += 2 * sizeof(value.%(key)s);
+    } else {
+        TEST_ASSERT(rv == OF_ERROR_RANGE);
+    }
+""" % dict(key=key, ku=key.upper()))
+        out.write("""
+    rv = of_match_wire_to_sparse(&wire_match, &sparse);
+    if (active > OF_MATCH_SPARSE_MAX_FIELDS ||
+        data_bytes > OF_MATCH_SPARSE_DATA_BYTES) {
+        TEST_ASSERT(rv == OF_ERROR_RESOURCE);
+    } else {
+        TEST_OK(rv);
+        TEST_ASSERT(sparse.count == active);
+        TEST_OK(of_match_sparse_to_match(&sparse, &match2));
+        TEST_ASSERT(memcmp(&match1, &match2, sizeof(match1)) == 0);
+    }
+
+    /* Pass the wire match through to another flow mod unchanged */
+    copy = of_flow_add_new(%(v_name)s);
+    TEST_ASSERT(copy != NULL);
+    TEST_OK(of_flow_add_match_wire_set(copy, &wire_match));
+    TEST_ASSERT(copy->length == flow_add->length);
+    TEST_OK(of_flow_add_match_get(copy, &match2));
+    TEST_ASSERT(memcmp(&match1, &match2, sizeof(match1)) == 0);
+    of_flow_add_delete(copy);
+    of_flow_add_delete(flow_add);
+""" % dict(v_name=loxi_utils.version_to_name(version)))
+
+        # OF 1.1 wire matches cannot wildcard most fields
+        if version == 2:
+            continue
+
+        out.write("""
+    /* Sparse conversion of a typical match with few fields */
+    MEMSET(&match1, 0, sizeof(match1));
+    match1.version = %(v_name)s;
+    match1.fields.in_port = 3;
+    OF_MATCH_MASK_IN_PORT_EXACT_SET(&match1);
+    match1.fields.eth_type = 0x0800;
+    OF_MATCH_MASK_ETH_TYPE_EXACT_SET(&match1);
+    match1.fields.ipv4_dst = 0x0a000000;
+    match1.masks.ipv4_dst = 0xff000000;
+    flow_add = of_flow_add_new(%(v_name)s);
+    TEST_ASSERT(flow_add != NULL);
+    TEST_OK(of_flow_add_match_set(flow_add, &match1));
+    TEST_OK(of_flow_add_match_get(flow_add, &match1));
+    TEST_OK(of_flow_add_match_wire_bind(flow_add, &wire_match));
+    TEST_OK(of_match_wire_to_sparse(&wire_match, &sparse));
+    TEST_ASSERT(sparse.count == 3);
+    TEST_ASSERT(sparse.data_used == 2 * (4 + 2 + 4));
+    TEST_OK(of_match_sparse_get(&sparse, OF_MATCH_FIELD_IPV4_DST,
+                                &value.ipv4_dst, &mask.ipv4_dst));
+    TEST_ASSERT(value.ipv4_dst == 0x0a000000);
+    TEST_ASSERT(mask.ipv4_dst == 0xff000000);
+    TEST_ASSERT(of_match_sparse_find(&sparse, OF_MATCH_FIELD_IPV4_SRC) == NULL);
+    TEST_ASSERT(of_match_sparse_get(&sparse, OF_MATCH_FIELD_IPV4_SRC,
+                                    &value.ipv4_src, &mask.ipv4_src) == OF_ERROR_RANGE);
+    TEST_OK(of_match_sparse_to_match(&sparse, &match2));
+    TEST_ASSERT(memcmp(&match1, &match2, sizeof(match1)) == 0);
+    of_flow_add_delete(flow_add);
+""" % dict(v_name=loxi_utils.version_to_name(version)))
+
+    out.write("""
+    return TEST_PASS;
+}
 """)
 
     out.write("""
@@ -1057,7 +1172,9 @@ int run_match_tests(void)
     RUN_TEST(match_1);
     RUN_TEST(match_2);
     RUN_TEST(match_3);
+    RUN_TEST(match_4);
     RUN_TEST(match_utils);
+    RUN_TEST(match_hash);
 
     return TEST_PASS;
 }
@@ -1964,6 +2081,92 @@ test_dump_objs(void)
     fclose(out);
     return TEST_PASS;
 }
+""")
+
+    out.write("""
+
+/**
+ * Test that buffered show output matches of_object_show
+ */
+
+typedef struct show_test_text_s {
+    char data[65536];
+    int len;
+    int calls;
+} show_test_text_t;
+
+static int
+show_test_writer(void *cookie, const char *fmt, ...)
+{
+    show_test_text_t *text = cookie;
+    va_list ap;
+    int rv;
+
+    va_start(ap, fmt);
+    rv = vsnprintf(text->data + text->len, sizeof(text->data) - text->len,
+                   fmt, ap);
+    va_end(ap);
+
+    text->len += rv;
+    text->calls++;
+    return rv;
+}
+
+static int
+show_buffered_check(of_object_t *obj)
+{
+    static show_test_text_t expected, buffered;
+    static char data[65536];
+    char small[8];
+    int len;
+
+    expected.len = 0;
+    expected.data[0] = '\\0';
+    of_object_show(show_test_writer, &expected, obj);
+    TEST_ASSERT(expected.len < (int)sizeof(expected.data));
+
+    len = of_object_show_to_buffer(data, sizeof(data), obj);
+    TEST_ASSERT(len == expected.len);
+    TEST_ASSERT(memcmp(data, expected.data, len + 1) == 0);
+
+    /* Truncation reports the full length */
+    TEST_ASSERT(of_object_show_to_buffer(small, sizeof(small), obj) == len);
+    TEST_ASSERT(small[sizeof(small) - 1] == '\\0' || len < (int)sizeof(small));
+
+    buffered.len = buffered.calls = 0;
+    of_object_show_buffered(show_test_writer, &buffered, obj,
+                            data, sizeof(data));
+    TEST_ASSERT(buffered.calls == 1);
+    TEST_ASSERT(buffered.len == expected.len);
+    TEST_ASSERT(memcmp(buffered.data, expected.data, len) == 0);
+
+    return TEST_PASS;
+}
+
+int
+test_show_objs(void)
+{
+    of_object_t *obj;
+
+    /* Compare buffered and unbuffered show for each populated object */
+""")
+    for version in of_g.of_version_range:
+        v_name = loxi_utils.version_to_name(version)
+        for cls in of_g.standard_class_order:
+            if not loxi_utils.class_in_version(cls, version):
+                continue
+            if cls in type_maps.inheritance_map:
+                continue
+            out.write("""
+    obj = (of_object_t *)%(cls)s_new(%(version)s);
+    TEST_ASSERT(%(cls)s_%(v_name)s_populate(obj, 1) != 0);
+    TEST_ASSERT(show_buffered_check(obj) == TEST_PASS);
+    of_object_delete(obj);
+""" % dict(cls=cls, v_name=v_name, version=of_g.of_version_wire2name[version]))
+
+    out.write("""
+    return TEST_PASS;
+}
 """)
 
 def gen_ident_tests(out):
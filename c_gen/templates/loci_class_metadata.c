@@ -39,7 +39,7 @@
 #include "loci_log.h"
 #include <loci/loci.h>
 
-struct loci_class_metadata loci_class_metadata[OF_OBJECT_COUNT] = {
+const struct loci_class_metadata loci_class_metadata[OF_OBJECT_COUNT] = {
 :: for data in class_metadata:
     [${data.name.upper()}] = {
         .wire_length_get=${data.wire_length_get},
@@ -42,7 +42,7 @@ struct loci_class_metadata {
     of_wire_type_set_f wire_type_set;
 };
 
-extern struct loci_class_metadata loci_class_metadata[OF_OBJECT_COUNT];
+extern const struct loci_class_metadata loci_class_metadata[OF_OBJECT_COUNT];
 
 static inline void
 of_object_wire_length_set(of_object_t *obj, int bytes)
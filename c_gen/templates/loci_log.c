@@ -42,3 +42,11 @@ loci_null_logger(loci_log_level_t level,
 }
 
 loci_logger_f loci_logger = loci_null_logger;
+
+LOCI_THREAD_LOCAL loci_logger_f loci_thread_logger;
+
+void
+loci_thread_logger_set(loci_logger_f logger)
+{
+    loci_thread_logger = logger;
+}
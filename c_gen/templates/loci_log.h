@@ -38,11 +38,19 @@
 #endif
 #include <inttypes.h>
 
+#include <loci/loci.h>
+
+/**
+ * Per-thread logger override; see loci_thread_logger_set
+ */
+extern LOCI_THREAD_LOCAL loci_logger_f loci_thread_logger;
+
 /**
  * Per level log macros.  printf semantics
  */
 
-#define LOCI_LOG_COMMON(level, ...) loci_logger(level, __func__, __FILE__, __LINE__, __VA_ARGS__)
+#define LOCI_LOG_COMMON(level, ...) \
+    (loci_thread_logger ? loci_thread_logger : loci_logger)(level, __func__, __FILE__, __LINE__, __VA_ARGS__)
 #define LOCI_LOG_TRACE(...) LOCI_LOG_COMMON(LOCI_LOG_LEVEL_TRACE, __VA_ARGS__)
 #define LOCI_LOG_VERBOSE(...) LOCI_LOG_COMMON(LOCI_LOG_LEVEL_VERBOSE, __VA_ARGS__)
 #define LOCI_LOG_INFO(...) LOCI_LOG_COMMON(LOCI_LOG_LEVEL_INFO, __VA_ARGS__)
@@ -152,7 +152,8 @@ typedef int (*loci_obj_show_f)(loci_writer_f writer,
                (val).addr[8], (val).addr[9], (val).addr[10], (val).addr[11], \
                (val).addr[12], (val).addr[13], (val).addr[14], (val).addr[15])
 
-#define LOCI_SHOW_string(writer, cookie, val) writer(cookie, "%s", val)
+#define LOCI_SHOW_string(writer, cookie, val) \
+    writer(cookie, "%.*s", (int)sizeof(val), val)
 
 #define LOCI_SHOW_port_name(writer, cookie, val) LOCI_SHOW_string(writer, cookie, val)
 #define LOCI_SHOW_port_name_if_name(writer, cookie, val) LOCI_SHOW_string(writer, cookie, val)
@@ -173,6 +174,27 @@ int loci_show_match(loci_writer_f writer, void *cookie, of_match_t *match);
  */
 int of_object_show(loci_writer_f writer, void *cookie, of_object_t *obj);
 
+/**
+ * Render any object into a caller-supplied buffer
+ * @param data The buffer to write to
+ * @param size The size of the buffer
+ * @param obj The object to show
+ * @returns The length of the full text, which is >= size if truncated
+ *
+ * The text is the same as of_object_show produces.  The result is NUL
+ * terminated when size > 0.
+ */
+int of_object_show_to_buffer(char *data, int size, of_object_t *obj);
+
+/**
+ * Show any object with a single writer call
+ *
+ * Renders into data and passes the text to the writer at once.  Falls
+ * back to of_object_show if the text does not fit.
+ */
+int of_object_show_buffered(loci_writer_f writer, void *cookie,
+                            of_object_t *obj, char *data, int size);
+
 
 
 
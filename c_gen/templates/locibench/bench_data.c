@@ -0,0 +1,83 @@
+:: # Copyright 2013, Big Switch Networks, Inc.
+:: #
+:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+:: # the following special exception:
+:: #
+:: # LOXI Exception
+:: #
+:: # As a special exception to the terms of the EPL, you may distribute libraries
+:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+:: #
+:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+:: #
+:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+:: # a copy of the EPL at:
+:: #
+:: # http://www.eclipse.org/legal/epl-v10.html
+:: #
+:: # Unless required by applicable law or agreed to in writing, software
+:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+:: # EPL for the specific language governing permissions and limitations
+:: # under the EPL.
+::
+:: include('_copyright.c')
+
+/**
+ *
+ * AUTOMATICALLY GENERATED FILE.  Edits will be lost on regen.
+ *
+ * Benchmark corpus built from the test_data files.
+ */
+
+#include <locibench/locibench.h>
+
+<?py
+def hexarray(data, indent):
+    i = 0
+    text = []
+    text.append(" " * indent)
+    for byte in data:
+        text.append("0x%02x, " % ord(byte))
+        i += 1
+        if i == 8:
+            text.append("\n" + " " * indent)
+            i = 0
+        #endif
+    #endfor
+    return "".join(text)
+#end
+?>
+
+:: for entry in entries:
+/* Generated from ${entry['filename']} */
+static const uint8_t binary_${entry['name']}[] = {
+${hexarray(entry['binary'], indent=4)}
+};
+
+:: if entry['c']:
+static of_object_t *
+build_${entry['name']}(void)
+{
+    of_object_t *obj;
+
+${'\n'.join([' ' * 4 + x for x in entry['c'].split("\n")])}
+
+    return obj;
+}
+
+:: #endif
+:: #endfor
+const bench_data_t bench_data[] = {
+:: for entry in entries:
+:: build = entry['c'] and 'build_' + entry['name'] or 'NULL'
+    { "${entry['filename']}", binary_${entry['name']},
+      sizeof(binary_${entry['name']}), ${build} },
+:: #endfor
+};
+
+const int bench_data_count = sizeof(bench_data) / sizeof(bench_data[0]);
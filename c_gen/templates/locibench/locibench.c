@@ -0,0 +1,417 @@
+:: # Copyright 2013, Big Switch Networks, Inc.
+:: #
+:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+:: # the following special exception:
+:: #
+:: # LOXI Exception
+:: #
+:: # As a special exception to the terms of the EPL, you may distribute libraries
+:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+:: #
+:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+:: #
+:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+:: # a copy of the EPL at:
+:: #
+:: # http://www.eclipse.org/legal/epl-v10.html
+:: #
+:: # Unless required by applicable law or agreed to in writing, software
+:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+:: # EPL for the specific language governing permissions and limitations
+:: # under the EPL.
+::
+:: include('_copyright.c')
+
+/**
+ * LOCI micro-benchmarks
+ *
+ * Measures the throughput of the library's hot paths and writes the
+ * results as JSON:
+ *
+ *   wrap        of_object_new_from_message_preallocated on each message
+ *               in the test_data corpus; this only wraps the buffer and
+ *               doesn't read the members, so it is not comparable to the
+ *               parse of the other backends
+ *   validate    of_validate_message on the same messages
+ *   list_iter   iteration over every list member of the wrapped messages
+ *   build       the accessor calls in each test_data C section, which
+ *               serialize the object into its wire buffer
+ *   new_delete  <cls>_new followed by of_object_delete, for each class
+ *               and version
+ *   accessors   a get and a set of every scalar member, for each class
+ *               and version
+ *
+ * Workload files (-w, any number of times) hold concatenated messages,
+ * such as the ones written by --lang=workload. For each file, wrap and
+ * validate run over all of its messages.
+ *
+ * Each benchmark is repeated with a doubling iteration count until one
+ * run takes at least the minimum time (-t, in seconds). Each result
+ * records the messages and bytes processed per operation and the number
+ * of malloc calls per operation; locibench is linked with
+ * -Wl,--wrap=malloc to count them.
+ *
+ * Usage: locibench [-o results.json] [-t seconds] [-f filter] [-w file]...
+ */
+
+#include <locibench/locibench.h>
+#include <loci/loci_validator.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include <unistd.h>
+
+volatile uint32_t bench_sink;
+
+static FILE *results;
+static int result_count;
+static double min_time = 0.01;
+static const char *filter;
+
+/* Number of malloc calls, see __wrap_malloc */
+static long bench_allocs;
+
+/* Inputs for the corpus benchmarks */
+static uint8_t *cur_buf;
+static int cur_bytes;
+static int cur_messages;
+static of_object_t *cur_obj;
+static bench_list_iter_f cur_list_iter;
+static bench_build_f cur_build;
+
+void *__real_malloc(size_t size);
+
+void *
+__wrap_malloc(size_t size)
+{
+    bench_allocs++;
+    return __real_malloc(size);
+}
+
+static double
+bench_now(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static void
+bench_run(const char *op, const char *name, const char *cls,
+          of_version_t version, int messages, int bytes, bench_loop_f loop)
+{
+    long iterations = 1;
+    long allocs;
+    double elapsed;
+    double ns_per_op;
+
+    for (;;) {
+        double start = bench_now();
+        allocs = bench_allocs;
+        loop(iterations);
+        elapsed = bench_now() - start;
+        allocs = bench_allocs - allocs;
+        if (elapsed >= min_time || iterations >= (1L << 40)) {
+            break;
+        }
+        iterations *= 2;
+    }
+
+    ns_per_op = elapsed * 1e9 / iterations;
+
+    fprintf(results, "%s\n    {\"op\": \"%s\", \"name\": \"%s\", "
+            "\"class\": \"%s\", \"version\": %d, \"iterations\": %ld, "
+            "\"messages\": %d, \"bytes\": %d, \"ns_per_op\": %.2f, "
+            "\"ops_per_sec\": %.0f, \"allocs_per_op\": %.2f}",
+            result_count++ ? "," : "", op, name, cls, version, iterations,
+            messages, bytes, ns_per_op, 1e9 / ns_per_op,
+            (double)allocs / iterations);
+
+    fprintf(stderr, "%-10s %-56s %12.1f ns/op\n", op, name, ns_per_op);
+}
+
+static void
+wrap_loop(long iterations)
+{
+    of_object_storage_t storage;
+    of_object_t *obj;
+    long i;
+
+    for (i = 0; i < iterations; i++) {
+        obj = of_object_new_from_message_preallocated(
+            &storage, cur_buf, cur_bytes);
+        bench_sink += obj->object_id;
+    }
+}
+
+static void
+wrap_all_loop(long iterations)
+{
+    of_object_storage_t storage;
+    of_object_t *obj;
+    long i;
+    int offset;
+
+    for (i = 0; i < iterations; i++) {
+        for (offset = 0; offset < cur_bytes;
+                offset += of_message_length_get(cur_buf + offset)) {
+            obj = of_object_new_from_message_preallocated(
+                &storage, cur_buf + offset,
+                of_message_length_get(cur_buf + offset));
+            bench_sink += obj->object_id;
+        }
+    }
+}
+
+static void
+validate_all_loop(long iterations)
+{
+    long i;
+    int offset;
+
+    for (i = 0; i < iterations; i++) {
+        for (offset = 0; offset < cur_bytes;
+                offset += of_message_length_get(cur_buf + offset)) {
+            bench_sink += of_validate_message(
+                cur_buf + offset, of_message_length_get(cur_buf + offset));
+        }
+    }
+}
+
+static void
+validate_loop(long iterations)
+{
+    long i;
+
+    for (i = 0; i < iterations; i++) {
+        bench_sink += of_validate_message(cur_buf, cur_bytes);
+    }
+}
+
+static void
+list_iter_loop(long iterations)
+{
+    long i;
+
+    for (i = 0; i < iterations; i++) {
+        bench_sink += cur_list_iter(cur_obj);
+    }
+}
+
+static void
+build_loop(long iterations)
+{
+    long i;
+
+    for (i = 0; i < iterations; i++) {
+        of_object_delete(cur_build());
+    }
+}
+
+static void
+bench_corpus(const bench_data_t *data)
+{
+    of_object_storage_t storage;
+    const char *cls = "";
+    of_version_t version = OF_VERSION_UNKNOWN;
+    of_object_t *obj;
+
+    cur_bytes = data->bytes;
+    cur_buf = malloc(cur_bytes);
+    memcpy(cur_buf, data->binary, cur_bytes);
+
+    if (data->build != NULL) {
+        obj = data->build();
+        cls = of_class_name(obj);
+        version = obj->version;
+        of_object_delete(obj);
+    }
+
+    /* Only messages can be wrapped on their own */
+    cur_obj = NULL;
+    if (cur_bytes >= OF_MESSAGE_MIN_LENGTH &&
+            of_message_length_get(cur_buf) == cur_bytes) {
+        cur_obj = of_object_new_from_message_preallocated(
+            &storage, cur_buf, cur_bytes);
+    }
+
+    if (cur_obj != NULL) {
+        cls = of_class_name(cur_obj);
+        version = cur_obj->version;
+        bench_run("wrap", data->name, cls, version, 1, cur_bytes,
+                  wrap_loop);
+        bench_run("validate", data->name, cls, version, 1, cur_bytes,
+                  validate_loop);
+        if ((cur_list_iter = bench_list_iter_get(cur_obj)) != NULL) {
+            bench_run("list_iter", data->name, cls, version, 1, cur_bytes,
+                      list_iter_loop);
+        }
+    }
+
+    if (data->build != NULL) {
+        cur_build = data->build;
+        bench_run("build", data->name, cls, version, 1, cur_bytes,
+                  build_loop);
+    }
+
+    free(cur_buf);
+}
+
+/**
+ * Read a workload file into cur_buf and count its messages
+ *
+ * Returns -1 if the file can't be read or doesn't hold a whole number
+ * of messages.
+ */
+static int
+workload_read(const char *filename)
+{
+    FILE *f;
+    long size;
+    int offset;
+    int length = 0;
+
+    if ((f = fopen(filename, "rb")) == NULL) {
+        perror(filename);
+        return -1;
+    }
+
+    fseek(f, 0, SEEK_END);
+    size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+
+    cur_buf = malloc(size > 0 ? size : 1);
+    if (fread(cur_buf, 1, size, f) != (size_t)size) {
+        perror(filename);
+        fclose(f);
+        free(cur_buf);
+        return -1;
+    }
+    fclose(f);
+    cur_bytes = size;
+
+    cur_messages = 0;
+    for (offset = 0; offset < cur_bytes; offset += length) {
+        if (cur_bytes - offset < OF_MESSAGE_MIN_LENGTH ||
+                (length = of_message_length_get(cur_buf + offset)) <
+                OF_MESSAGE_MIN_LENGTH || length > cur_bytes - offset) {
+            fprintf(stderr, "%s: truncated message at offset %d\n",
+                    filename, offset);
+            free(cur_buf);
+            return -1;
+        }
+        cur_messages++;
+    }
+
+    return 0;
+}
+
+static int
+bench_workload(const char *filename)
+{
+    of_object_storage_t storage;
+    of_object_t *obj;
+
+    if (workload_read(filename) < 0) {
+        return -1;
+    }
+
+    if (cur_messages > 0) {
+        /* Report the class of the first message */
+        obj = of_object_new_from_message_preallocated(
+            &storage, cur_buf, of_message_length_get(cur_buf));
+        bench_run("wrap", filename, of_class_name(obj), obj->version,
+                  cur_messages, cur_bytes, wrap_all_loop);
+        bench_run("validate", filename, of_class_name(obj), obj->version,
+                  cur_messages, cur_bytes, validate_all_loop);
+    }
+
+    free(cur_buf);
+    return 0;
+}
+
+int
+main(int argc, char *argv[])
+{
+    const char *output = NULL;
+    const char **workloads;
+    int workload_count = 0;
+    int opt;
+    int i;
+
+    workloads = calloc(argc, sizeof(*workloads));
+
+    while ((opt = getopt(argc, argv, "o:t:f:w:")) != -1) {
+        switch (opt) {
+        case 'o':
+            output = optarg;
+            break;
+        case 't':
+            min_time = atof(optarg);
+            break;
+        case 'f':
+            filter = optarg;
+            break;
+        case 'w':
+            workloads[workload_count++] = optarg;
+            break;
+        default:
+            fprintf(stderr,
+                    "usage: %s [-o results.json] [-t seconds] [-f filter] "
+                    "[-w file]...\n", argv[0]);
+            return 1;
+        }
+    }
+
+    results = stdout;
+    if (output != NULL && (results = fopen(output, "w")) == NULL) {
+        perror(output);
+        return 1;
+    }
+
+    fprintf(results, "{\n  \"min_time\": %g,\n  \"results\": [", min_time);
+
+    for (i = 0; i < bench_data_count; i++) {
+        if (filter == NULL || strstr(bench_data[i].name, filter)) {
+            bench_corpus(&bench_data[i]);
+        }
+    }
+
+    for (i = 0; i < bench_class_count; i++) {
+        const bench_class_t *bench = &bench_classes[i];
+
+        if (filter != NULL && !strstr(bench->cls, filter)) {
+            continue;
+        }
+        bench_run("new_delete", bench->cls, bench->cls, bench->version,
+                  0, 0, bench->new_delete);
+        if (bench->accessors != NULL) {
+            bench_run("accessors", bench->cls, bench->cls, bench->version,
+                      0, 0, bench->accessors);
+        }
+    }
+
+    for (i = 0; i < workload_count; i++) {
+        if (filter != NULL && !strstr(workloads[i], filter)) {
+            continue;
+        }
+        if (bench_workload(workloads[i]) < 0) {
+            return 1;
+        }
+    }
+
+    fprintf(results, "\n  ]\n}\n");
+
+    if (results != stdout) {
+        fclose(results);
+    }
+
+    return 0;
+}
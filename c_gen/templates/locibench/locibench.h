@@ -0,0 +1,86 @@
+:: # Copyright 2013, Big Switch Networks, Inc.
+:: #
+:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+:: # the following special exception:
+:: #
+:: # LOXI Exception
+:: #
+:: # As a special exception to the terms of the EPL, you may distribute libraries
+:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+:: #
+:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+:: #
+:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+:: # a copy of the EPL at:
+:: #
+:: # http://www.eclipse.org/legal/epl-v10.html
+:: #
+:: # Unless required by applicable law or agreed to in writing, software
+:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+:: # EPL for the specific language governing permissions and limitations
+:: # under the EPL.
+::
+:: include('_copyright.c')
+
+/**
+ * Shared declarations for the LOCI micro-benchmarks
+ */
+
+#if !defined(_LOCIBENCH_H_)
+#define _LOCIBENCH_H_
+
+#define DISABLE_WARN_UNUSED_RESULT
+#include <loci/loci.h>
+
+/**
+ * Run a benchmarked operation the given number of times
+ */
+typedef void (*bench_loop_f)(long iterations);
+
+/**
+ * Construct an object with accessors, as in a test_data C section
+ */
+typedef of_object_t *(*bench_build_f)(void);
+
+/**
+ * Count the elements of every list member of a parsed object
+ */
+typedef int (*bench_list_iter_f)(of_object_t *obj);
+
+/**
+ * Per class benchmarks, generated for each concrete class and version
+ */
+typedef struct bench_class_s {
+    const char *cls;
+    of_version_t version;
+    bench_loop_f new_delete;
+    bench_loop_f accessors;    /* NULL if the class has no scalar members */
+} bench_class_t;
+
+/**
+ * Benchmarks driven by the test_data corpus
+ */
+typedef struct bench_data_s {
+    const char *name;          /* Data file, relative to test_data */
+    const uint8_t *binary;
+    int bytes;
+    bench_build_f build;       /* NULL if the file has no C section */
+} bench_data_t;
+
+extern const bench_class_t bench_classes[];
+extern const int bench_class_count;
+
+extern const bench_data_t bench_data[];
+extern const int bench_data_count;
+
+extern bench_list_iter_f bench_list_iter_get(of_object_t *obj);
+
+/* Defeats dead code elimination of benchmarked reads */
+extern volatile uint32_t bench_sink;
+
+#endif /* _LOCIBENCH_H_ */
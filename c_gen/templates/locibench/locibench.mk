@@ -0,0 +1,22 @@
+LOCIBENCH_SRCS := $(wildcard src/*.c)
+LOCI_SRCS := $(wildcard ../loci/src/*.c)
+
+LOCIBENCH_OBJS := $(LOCIBENCH_SRCS:.c=.o)
+LOCI_OBJS := $(LOCI_SRCS:.c=.o)
+
+CFLAGS := -Wall -Werror -g -O2
+CFLAGS += -Iinc -I../loci/inc -I ../loci/src
+
+# Count the malloc calls of each benchmark, see __wrap_malloc
+LDFLAGS := -Wl,--wrap=malloc
+
+all: locibench
+
+locibench: $(LOCIBENCH_OBJS) loci.a
+	$(CC) $(LDFLAGS) $^ -o $@
+
+loci.a: $(LOCI_OBJS)
+	ar rc $@ $^
+
+clean:
+	rm -f locibench loci.a $(LOCIBENCH_OBJS) $(LOCI_OBJS)
@@ -220,3 +220,45 @@ test_match_utils(void)
     
     return TEST_PASS;
 }
+
+int
+test_match_hash(void)
+{
+    of_match_t match1, match2, match3;
+    of_match_v1_t *wire_v1;
+    of_match_v3_t *wire_v3;
+
+    /* The same flow space read from different wire versions */
+    MEMSET(&match1, 0, sizeof(match1));
+    of_match_populate(&match1, OF_VERSION_1_0, 1);
+    wire_v1 = of_match_v1_new(OF_VERSION_1_0);
+    TEST_ASSERT(wire_v1 != NULL);
+    wire_v3 = of_match_v3_new(OF_VERSION_1_2);
+    TEST_ASSERT(wire_v3 != NULL);
+    TEST_OK(of_match_to_wire_match_v1(&match1, wire_v1));
+    TEST_OK(of_match_to_wire_match_v3(&match1, wire_v3));
+    TEST_OK(of_match_v1_to_match(wire_v1, &match2));
+    TEST_OK(of_match_v3_to_match(wire_v3, &match3));
+
+    TEST_ASSERT(!of_match_eq(&match2, &match3));
+    TEST_ASSERT(of_match_fields_eq(&match2, &match3));
+    TEST_ASSERT(of_match_hash(&match2) == of_match_hash(&match3));
+
+    /* Changing an active field changes the hash */
+    match3.fields.in_port++;
+    TEST_ASSERT(!of_match_fields_eq(&match2, &match3));
+    TEST_ASSERT(of_match_hash(&match2) != of_match_hash(&match3));
+
+    /* Inactive fields do not contribute */
+    MEMSET(&match2, 0, sizeof(match2));
+    MEMSET(&match3, 0, sizeof(match3));
+    match2.fields.in_port = 1;
+    TEST_ASSERT(of_match_hash(&match2) == of_match_hash(&match3));
+    match2.masks.in_port = 0xffffffff;
+    TEST_ASSERT(of_match_hash(&match2) != of_match_hash(&match3));
+
+    of_match_v1_delete(wire_v1);
+    of_match_v3_delete(wire_v3);
+
+    return TEST_PASS;
+}
@@ -0,0 +1,201 @@
+:: # Copyright 2013, Big Switch Networks, Inc.
+:: #
+:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+:: # the following special exception:
+:: #
+:: # LOXI Exception
+:: #
+:: # As a special exception to the terms of the EPL, you may distribute libraries
+:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+:: #
+:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+:: #
+:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+:: # a copy of the EPL at:
+:: #
+:: # http://www.eclipse.org/legal/epl-v10.html
+:: #
+:: # Unless required by applicable law or agreed to in writing, software
+:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+:: # EPL for the specific language governing permissions and limitations
+:: # under the EPL.
+::
+:: include('_copyright.c')
+
+/**
+ * Multi-threaded parse tests
+ *
+ * Parse a shared read-only message on several threads at once, checking
+ * that accessors return consistent results, that the per-thread logger and
+ * error state stay isolated, and report how parse throughput scales with
+ * the number of threads.
+ */
+
+#include <locitest/test_common.h>
+#include <pthread.h>
+#include <time.h>
+#include <unistd.h>
+
+#define THREAD_TEST_ENTRIES 16
+#define THREAD_TEST_ITERATIONS 20000
+#define THREAD_TEST_MAX_THREADS 8
+
+struct thread_test_arg {
+    uint8_t *buf;
+    int len;
+    int errors;
+    int log_count;
+    int last_error;
+};
+
+static LOCI_THREAD_LOCAL int thread_log_count;
+
+static int
+thread_test_logger(loci_log_level_t level,
+                   const char *fname, const char *file, int line,
+                   const char *format, ...)
+{
+    thread_log_count++;
+    return 0;
+}
+
+static void *
+thread_test_worker(void *cookie)
+{
+    struct thread_test_arg *arg = cookie;
+    of_object_storage_t storage;
+    of_object_t *obj;
+    of_list_flow_stats_entry_t list;
+    of_flow_stats_entry_t entry;
+    uint64_t cookie_val;
+    int i, rv, count;
+
+    loci_thread_logger_set(thread_test_logger);
+
+    /* A truncated message must fail and be reported on this thread only */
+    if (of_object_new_from_message_preallocated(&storage, arg->buf,
+                                                arg->len - 1) != NULL) {
+        arg->errors++;
+    }
+    arg->last_error = loci_last_error();
+    arg->log_count = thread_log_count;
+
+    for (i = 0; i < THREAD_TEST_ITERATIONS; i++) {
+        obj = of_object_new_from_message_preallocated(&storage, arg->buf,
+                                                      arg->len);
+        if (obj == NULL || obj->object_id != OF_FLOW_STATS_REPLY) {
+            arg->errors++;
+            continue;
+        }
+
+        count = 0;
+        of_flow_stats_reply_entries_bind(obj, &list);
+        OF_LIST_FLOW_STATS_ENTRY_ITER(&list, &entry, rv) {
+            of_flow_stats_entry_cookie_get(&entry, &cookie_val);
+            if (cookie_val != (uint64_t)count) {
+                arg->errors++;
+            }
+            count++;
+        }
+
+        if (count != THREAD_TEST_ENTRIES) {
+            arg->errors++;
+        }
+    }
+
+    loci_thread_logger_set(NULL);
+
+    return NULL;
+}
+
+static double
+thread_test_now(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static int
+test_parse_threads(void)
+{
+    of_flow_stats_reply_t *obj = of_flow_stats_reply_new(OF_VERSION_1_3);
+    of_flow_stats_entry_t *entry = of_flow_stats_entry_new(OF_VERSION_1_3);
+    of_list_flow_stats_entry_t list;
+    struct thread_test_arg args[THREAD_TEST_MAX_THREADS];
+    pthread_t threads[THREAD_TEST_MAX_THREADS];
+    double start, elapsed, base_rate = 0;
+    uint8_t *buf;
+    int len, i, nthreads, max_threads;
+
+    TEST_ASSERT(obj != NULL && entry != NULL);
+
+    of_flow_stats_reply_entries_bind(obj, &list);
+    for (i = 0; i < THREAD_TEST_ENTRIES; i++) {
+        of_flow_stats_entry_cookie_set(entry, i);
+        TEST_OK(of_list_flow_stats_entry_append(&list, entry));
+    }
+    of_flow_stats_entry_delete(entry);
+
+    len = obj->length;
+    buf = WBUF_BUF(OF_OBJECT_TO_WBUF(obj));
+
+    max_threads = sysconf(_SC_NPROCESSORS_ONLN);
+    if (max_threads > THREAD_TEST_MAX_THREADS) {
+        max_threads = THREAD_TEST_MAX_THREADS;
+    }
+    if (max_threads < 2) {
+        max_threads = 2;
+    }
+
+    fprintf(stderr, "\n");
+    for (nthreads = 1; nthreads <= max_threads; nthreads *= 2) {
+        double rate;
+
+        MEMSET(args, 0, sizeof(args));
+        start = thread_test_now();
+        for (i = 0; i < nthreads; i++) {
+            args[i].buf = buf;
+            args[i].len = len;
+            TEST_ASSERT(pthread_create(&threads[i], NULL,
+                                       thread_test_worker, &args[i]) == 0);
+        }
+        for (i = 0; i < nthreads; i++) {
+            TEST_ASSERT(pthread_join(threads[i], NULL) == 0);
+        }
+        elapsed = thread_test_now() - start;
+
+        for (i = 0; i < nthreads; i++) {
+            TEST_ASSERT(args[i].errors == 0);
+            TEST_ASSERT(args[i].last_error == OF_ERROR_PARSE);
+            TEST_ASSERT(args[i].log_count == args[0].log_count);
+            TEST_ASSERT(args[i].log_count > 0);
+        }
+
+        rate = nthreads * THREAD_TEST_ITERATIONS / elapsed;
+        if (base_rate == 0) {
+            base_rate = rate;
+        }
+        fprintf(stderr, "    threads=%d parses/sec=%.0f scaling=%.2fx\n",
+                nthreads, rate, rate / base_rate);
+    }
+
+    /* Nothing logged through the per-thread hook on the main thread */
+    TEST_ASSERT(thread_log_count == 0);
+
+    of_flow_stats_reply_delete(obj);
+    return TEST_PASS;
+}
+
+int
+run_thread_tests(void)
+{
+    RUN_TEST(parse_threads);
+
+    return TEST_PASS;
+}
@@ -162,13 +162,46 @@ test_of_object_new_from_message_preallocated(void)
     return TEST_PASS;
 }
 
+static int
+test_of_object_equal(void)
+{
+    of_flow_add_t *flow_add;
+    of_object_t *dup;
+
+    flow_add = of_flow_add_new(OF_VERSION_1_3);
+    TEST_ASSERT(flow_add != NULL);
+    of_flow_add_xid_set(flow_add, 0x12345678);
+    of_flow_add_priority_set(flow_add, 100);
+
+    dup = of_object_dup(flow_add);
+    TEST_ASSERT(dup != NULL);
+    TEST_ASSERT(of_object_equal(flow_add, dup));
+    TEST_ASSERT(of_object_hash(flow_add) == of_object_hash(dup));
+
+    of_flow_add_priority_set(dup, 101);
+    TEST_ASSERT(!of_object_equal(flow_add, dup));
+    TEST_ASSERT(of_object_hash(flow_add) != of_object_hash(dup));
+
+    /* The XID is part of the wire contents */
+    of_flow_add_priority_set(dup, 100);
+    of_flow_add_xid_set(dup, 0x12345679);
+    TEST_ASSERT(!of_object_equal(flow_add, dup));
+
+    of_object_delete(dup);
+    of_flow_add_delete(flow_add);
+
+    return TEST_PASS;
+}
+
 int
 run_utility_tests(void)
 {
     RUN_TEST(has_outport);
     RUN_TEST(of_object_new_from_message);
     RUN_TEST(of_object_new_from_message_preallocated);
+    RUN_TEST(of_object_equal);
     RUN_TEST(dump_objs);
+    RUN_TEST(show_objs);
 
     return TEST_PASS;
 }
@@ -39,6 +39,22 @@
 #include <loci/loci.h>
 #include <loci/loci_validator.h>
 
+/*
+ * Status of the most recent message parse on this thread.
+ *
+ * All other state touched by the parse and accessor paths is either const
+ * (init map, class metadata, length tables) or owned by the object being
+ * operated on, so distinct objects may be used concurrently from different
+ * threads without locking.
+ */
+static LOCI_THREAD_LOCAL int loci_thread_last_error;
+
+int
+loci_last_error(void)
+{
+    return loci_thread_last_error;
+}
+
 /**
  * Create a generic new object and possibly underlying wire buffer
  * @param bytes The number of bytes to allocate in the underlying buffer
@@ -128,6 +144,46 @@ of_object_dup(of_object_t *src)
     return dst;
 }
 
+/**
+ * Compare two objects for equality
+ * @param a An object
+ * @param b Another object
+ * @returns Boolean, true if the objects have the same type, version
+ * and wire contents
+ *
+ * Messages include their XID in the comparison.
+ */
+
+int
+of_object_equal(of_object_t *a, of_object_t *b)
+{
+    return a->object_id == b->object_id &&
+        a->version == b->version &&
+        a->length == b->length &&
+        MEMCMP(OF_OBJECT_BUFFER_INDEX(a, 0),
+               OF_OBJECT_BUFFER_INDEX(b, 0),
+               a->length) == 0;
+}
+
+/**
+ * Hash an object
+ * @param obj The object to hash
+ * @returns A hash of the object type, version and wire contents
+ *
+ * Objects which are of_object_equal have the same hash.
+ */
+
+uint32_t
+of_object_hash(of_object_t *obj)
+{
+    uint32_t hash;
+
+    hash = of_hash_mix(0, ((uint32_t)obj->object_id << 8) | obj->version);
+    hash = of_hash_bytes(hash, OF_OBJECT_BUFFER_INDEX(obj, 0), obj->length);
+
+    return of_hash_finish(hash);
+}
+
 /**
  * Generic new from message call
  */
@@ -141,21 +197,25 @@ of_object_new_from_message(of_message_t msg, int len)
 
     version = of_message_version_get(msg);
     if (!OF_VERSION_OKAY(version)) {
+        loci_thread_last_error = OF_ERROR_VERSION;
         return NULL;
     }
 
     if (of_validate_message(msg, len) != 0) {
         LOCI_LOG_ERROR("message validation failed\n");
+        loci_thread_last_error = OF_ERROR_PARSE;
         return NULL;
     }
 
     if ((obj = of_object_new(-1)) == NULL) {
+        loci_thread_last_error = OF_ERROR_RESOURCE;
         return NULL;
     }
 
     if (of_object_buffer_bind(obj, OF_MESSAGE_TO_BUFFER(msg), len, 
                               OF_MESSAGE_FREE_FUNCTION) < 0) {
         FREE(obj);
+        loci_thread_last_error = OF_ERROR_RESOURCE;
         return NULL;
     }
     obj->version = version;
@@ -163,6 +223,7 @@ of_object_new_from_message(of_message_t msg, int len)
     of_header_wire_object_id_get(obj, &object_id);
     of_object_init_map[object_id](obj, version, len, 0);
 
+    loci_thread_last_error = OF_ERROR_NONE;
     return obj;
 }
 
@@ -192,11 +253,13 @@ of_object_new_from_message_preallocated(of_object_storage_t *storage,
 
     version = of_message_version_get(msg);
     if (!OF_VERSION_OKAY(version)) {
+        loci_thread_last_error = OF_ERROR_VERSION;
         return NULL;
     }
 
     if (of_validate_message(msg, len) != 0) {
         LOCI_LOG_ERROR("message validation failed\n");
+        loci_thread_last_error = OF_ERROR_PARSE;
         return NULL;
     }
 
@@ -209,6 +272,7 @@ of_object_new_from_message_preallocated(of_object_storage_t *storage,
     of_header_wire_object_id_get(obj, &object_id);
     of_object_init_map[object_id](obj, version, len, 0);
 
+    loci_thread_last_error = OF_ERROR_NONE;
     return obj;
 }
 
@@ -66,6 +66,8 @@ extern int of_list_append(of_object_t *list, of_object_t *item);
 
 extern of_object_t *of_object_new(int bytes);
 extern of_object_t *of_object_dup(of_object_t *src);
+extern int of_object_equal(of_object_t *a, of_object_t *b);
+extern uint32_t of_object_hash(of_object_t *obj);
 
 extern int of_object_xid_set(of_object_t *obj, uint32_t xid);
 extern int of_object_xid_get(of_object_t *obj, uint32_t *xid);
@@ -33,7 +33,8 @@ import loxi_utils.loxi_utils as utils
 import template_utils as template_utils
 
 templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templates')
-template_path = [templates_dir, templates_dir + '/locitest']
+template_path = [templates_dir, templates_dir + '/locitest',
+                 templates_dir + '/locibench']
 
 def render_template(out, name, **context):
     template_utils.render_template(out, name, template_path, context)
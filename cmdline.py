@@ -35,6 +35,10 @@ options_default = {
     "lang"               : "c",
     "version-list"       : "1.0 1.1 1.2 1.3",
     "install-dir"        : "loxi_output",
+    "java-instrument"    : "trace",
+    "python-lazy"        : False,
+    "workload-scale"     : 1,
+    "workload-seed"      : 0,
 }
 
 def lang_normalize(lang):
@@ -76,7 +80,7 @@ def process_commandline(default_vals=options_default):
                       help="List output files generated")
     parser.add_option("-l", "--lang", "--language",
                       default=default_vals["lang"],
-                      help="Select the target language: c, python")
+                      help="Select the target language: c, python, java, wireshark, workload")
     parser.add_option("-i", "--install-dir",
                       default=default_vals["install-dir"],
                       help="Directory to install generated files to (default %s)" % default_vals["install-dir"])
@@ -88,6 +92,26 @@ def process_commandline(default_vals=options_default):
                       default=default_vals["version-list"],
                       help="Specify the versions to target as 1.0 1.1 etc")
 
+    parser.add_option("--java-instrument",
+                      type="choice", choices=["trace", "metrics", "none"],
+                      default=default_vals["java-instrument"],
+                      help="Instrumentation of generated openflowj readers and writers: " +
+                           "trace (trace logging), metrics (calls to OFMetricsListener) " +
+                           "or none (default %s)" % default_vals["java-instrument"])
+
+    parser.add_option("--python-lazy", action="store_true",
+                      default=default_vals["python-lazy"],
+                      help="Generate PyLoxi modules that create their classes on first use, " +
+                           "for faster imports")
+
+    parser.add_option("--workload-scale", type="int",
+                      default=default_vals["workload-scale"],
+                      help="Multiplier of the number of objects in each generated workload " +
+                           "(default %d, about 10000 objects per workload)" % default_vals["workload-scale"])
+    parser.add_option("--workload-seed", type="int",
+                      default=default_vals["workload-seed"],
+                      help="Random seed of the generated workloads (default %d)" % default_vals["workload-seed"])
+
     (options, args) = parser.parse_args()
 
     options.lang = lang_normalize(options.lang)
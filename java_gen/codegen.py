@@ -55,13 +55,17 @@ def gen_all_java(install_dir):
         shutil.rmtree(basedir)
     os.makedirs(basedir)
     copy_prewrite_tree(basedir)
-    gen = JavaGenerator(basedir, JavaGeneratorOptions(instrument=True))
+    instrument = loxi_globals.options.java_instrument if loxi_globals.options else "trace"
+    gen = JavaGenerator(basedir, JavaGeneratorOptions(instrument=(instrument == "trace"),
+                                                      metrics=(instrument == "metrics")))
     gen.create_of_interfaces()
     gen.create_of_classes()
     gen.create_of_const_enums()
     gen.create_of_factories()
 
-JavaGeneratorOptions = namedtuple("JavaGeneratorOptions", ("instrument",))
+# instrument: generate trace logging in readers
+# metrics: generate calls to the OFMetricsListener in readers and writers
+JavaGeneratorOptions = namedtuple("JavaGeneratorOptions", ("instrument", "metrics"))
 
 class JavaGenerator(object):
     templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templates')
@@ -151,6 +155,11 @@ class JavaGenerator(object):
                             version=unit_test.java_class.version,
                             test=unit_test, msg=unit_test.java_class,
                             test_data=unit_test.test_data)
+                    self.render_class(clazz=java_model.OFGenericClass(package=unit_test.package, name=unit_test.bench_name),
+                            template='benchmark.java', src_dir="bench/gen-src/main/java",
+                            version=unit_test.java_class.version,
+                            test=unit_test, msg=unit_test.java_class,
+                            test_data=unit_test.test_data)
 
     def create_of_factories(self):
         for factory in self.java_model.of_factories:
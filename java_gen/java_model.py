@@ -736,6 +736,11 @@ class JavaOFClass(object):
     def is_extension(self):
         return type_maps.message_is_extension(self.c_name, -1)
 
+    @property
+    def is_message(self):
+        """ true iff this class is an OpenFlow message (of_header or one of its subclasses) """
+        return self.ir_class.is_message
+
     @property
     def align(self):
         return int(self.ir_class.params['align']) if 'align' in self.ir_class.params else 0
@@ -1021,6 +1026,12 @@ class JavaUnitTest(object):
     @property
     def name(self):
         return self.test_class_name
+
+    @property
+    def bench_name(self):
+        if self.test_class_name.endswith("Test"):
+            return self.test_class_name[:-len("Test")] + "Bench"
+        return self.test_class_name + "Bench"
     
     @property
     def interface(self):
@@ -71,15 +71,16 @@ def format_primitive_literal(t, value):
 ANY = 0xFFFFFFFFFFFFFFFF
 
 class VersionOp:
-    def __init__(self, version=ANY, read=None, write=None, default=None, funnel=None):
+    def __init__(self, version=ANY, read=None, write=None, default=None, funnel=None, length=None):
         self.version = version
         self.read = read
         self.write = write
         self.default = default
         self.funnel = funnel
+        self.length = length
 
     def __str__(self):
-        return "[Version: %d, Read: '%s', Write: '%s', Default: '%s', Funnel: '%s' ]" % (self.version, self.read, self.write, self.default, self.funnel )
+        return "[Version: %d, Read: '%s', Write: '%s', Default: '%s', Funnel: '%s', Length: '%s' ]" % (self.version, self.read, self.write, self.default, self.funnel, self.length )
 
 ### FIXME: This class should really be cleaned up
 class JType(object):
@@ -99,7 +100,7 @@ class JType(object):
         self.priv_type = priv_type
         return self
 
-    def op(self, version=ANY, read=None, write=None, default=None, funnel=None, pub_type=ANY):
+    def op(self, version=ANY, read=None, write=None, default=None, funnel=None, length=None, pub_type=ANY):
         """
         define operations to be performed for reading and writing this type
         (when read_op, write_op is called). The operations 'read' and 'write'
@@ -111,11 +112,12 @@ class JType(object):
                                 private type(False) or both (ALL)
         @param read read expression (either string or callable)s
         @param write write expression (either string or callable)
+        @param length expression evaluating to the number of bytes written by 'write'
         """
 
         pub_types = [ pub_type ] if pub_type is not ANY else [ False, True ]
         for pub_type in pub_types:
-            self.ops[(version, pub_type)] = VersionOp(version, read, write, default, funnel)
+            self.ops[(version, pub_type)] = VersionOp(version, read, write, default, funnel, length)
         return self
 
     def format_value(self, value, pub_type=True):
@@ -211,6 +213,20 @@ class JType(object):
             Currently just delegates to read_op + throws away the result."""
         return self.read_op(version, length)
 
+    def length_op(self, version=None, name=None, pub_type=True):
+        """ return a Java expression that evaluates to the number of bytes write_op
+        writes for the value contained in Java expression 'name'. Used to compute
+        the length of variable length messages without serializing them.
+        @param name string containing Java expression that evaluates to the value to be measured
+        @param version int - OF wire version to generate expression for
+        @param pub_type boolean use this JTypes 'public' (True), or private (False) representation
+        @return string containing generated Java expression.
+        """
+        return self.get_op("length", version, pub_type,
+            default_value='$name.getLength()',
+            arguments=dict(name=name)
+            )
+
     def funnel_op(self, version=None, name=None, pub_type=True):
         t = self.pub_type if pub_type else self.priv_type
         return self.get_op("funnel", version, pub_type,
@@ -262,6 +278,7 @@ def gen_list_jtype(java_base_name):
         .op(
             read= 'ChannelUtils.readList(bb, $length, {}Ver$version.READER)'.format(java_base_name), \
             write='ChannelUtils.writeList(bb, $name)',
+            length='ChannelUtils.calcListLength($name)',
             default="ImmutableList.<{}>of()".format(java_base_name),
             funnel='FunnelUtils.putList($name, sink)'
             )
@@ -283,6 +300,7 @@ u8 =  JType('short', 'byte') \
 u8_list =  JType('List<U8>') \
         .op(read='ChannelUtils.readList(bb, $length, U8.READER)',
             write='ChannelUtils.writeList(bb, $name)',
+            length='ChannelUtils.calcListLength($name)',
             default='ImmutableList.<U8>of()',
             funnel='FunnelUtils.putList($name, sink)'
            )
@@ -296,12 +314,14 @@ u32_list = JType('List<U32>', 'int[]') \
         .op(
                 read='ChannelUtils.readList(bb, $length, U32.READER)',
                 write='ChannelUtils.writeList(bb, $name)',
+                length='ChannelUtils.calcListLength($name)',
                 default="ImmutableList.<U32>of()",
                 funnel="FunnelUtils.putList($name, sink)")
 u64_list = JType('List<U64>', 'int[]') \
         .op(
                 read='ChannelUtils.readList(bb, $length, U64.READER)',
                 write='ChannelUtils.writeList(bb, $name)',
+                length='ChannelUtils.calcListLength($name)',
                 default="ImmutableList.<U64>of()",
                 funnel="FunnelUtils.putList($name, sink)")
 u8obj = JType('U8', 'U8') \
@@ -334,6 +354,7 @@ port_desc = JType('OFPortDesc') \
 octets = JType('byte[]')\
         .op(read='ChannelUtils.readBytes(bb, $length)', \
             write='bb.writeBytes($name)', \
+            length='$name.length',
             default="new byte[0]",
             funnel="sink.putBytes($name)"
             );
@@ -509,6 +530,7 @@ error_cause_data = JType("OFErrorCauseData") \
 var_string = JType('String').op(
               read='ChannelUtils.readFixedLengthString(bb, $length)',
               write='ChannelUtils.writeFixedLengthString(bb, $name, $name.length())',
+              length='$name.length()',
               default='""',
               funnel='sink.putUnencodedChars($name)'
             )
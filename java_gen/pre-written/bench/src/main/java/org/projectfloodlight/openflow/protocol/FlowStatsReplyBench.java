@@ -0,0 +1,78 @@
+package org.projectfloodlight.openflow.protocol;
+
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.TimeUnit;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBuffers;
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.Setup;
+import org.openjdk.jmh.annotations.State;
+import org.projectfloodlight.openflow.protocol.action.OFAction;
+import org.projectfloodlight.openflow.protocol.instruction.OFInstruction;
+import org.projectfloodlight.openflow.protocol.match.MatchField;
+import org.projectfloodlight.openflow.types.EthType;
+import org.projectfloodlight.openflow.types.IpProtocol;
+import org.projectfloodlight.openflow.types.OFPort;
+import org.projectfloodlight.openflow.types.OFVlanVidMatch;
+import org.projectfloodlight.openflow.types.TableId;
+import org.projectfloodlight.openflow.types.TransportPort;
+import org.projectfloodlight.openflow.types.U64;
+
+/**
+ * Parses an OF1.3 flow stats reply with {@link #ENTRIES} typical entries.
+ * Run with '-prof gc' to see the allocation rate per parsed reply.
+ */
+@State(Scope.Thread)
+@BenchmarkMode(Mode.Throughput)
+@OutputTimeUnit(TimeUnit.MILLISECONDS)
+public class FlowStatsReplyBench {
+    /** about as many entries as fit into one reply */
+    static final int ENTRIES = 400;
+
+    OFMessageReader<OFMessage> reader;
+    ChannelBuffer input;
+
+    @Setup
+    public void setup() {
+        OFFactory factory = OFFactories.getFactory(OFVersion.OF_13);
+        List<OFFlowStatsEntry> entries = new ArrayList<OFFlowStatsEntry>(ENTRIES);
+        for (int i = 0; i < ENTRIES; i++) {
+            List<OFAction> actions =
+                    Collections.<OFAction>singletonList(factory.actions().output(OFPort.of(1 + i % 48), 0xffff));
+            List<OFInstruction> instructions =
+                    Collections.<OFInstruction>singletonList(factory.instructions().applyActions(actions));
+            entries.add(factory.buildFlowStatsEntry()
+                    .setTableId(TableId.of(i % 4))
+                    .setPriority(100 + i % 10)
+                    .setCookie(U64.of(i))
+                    .setPacketCount(U64.of(i * 10))
+                    .setByteCount(U64.of(i * 1000))
+                    .setMatch(factory.buildMatch()
+                            .setExact(MatchField.IN_PORT, OFPort.of(1 + i % 48))
+                            .setExact(MatchField.VLAN_VID, OFVlanVidMatch.ofVlan(1 + i % 100))
+                            .setExact(MatchField.ETH_TYPE, EthType.IPv4)
+                            .setExact(MatchField.IP_PROTO, IpProtocol.TCP)
+                            .setExact(MatchField.TCP_DST, TransportPort.of(1024 + i))
+                            .build())
+                    .setInstructions(instructions)
+                    .build());
+        }
+        OFFlowStatsReply reply = factory.buildFlowStatsReply().setEntries(entries).build();
+        input = ChannelBuffers.dynamicBuffer();
+        reply.writeTo(input);
+        reader = factory.getReader();
+    }
+
+    @Benchmark
+    public OFMessage read() throws Exception {
+        input.readerIndex(0);
+        return reader.readFrom(input);
+    }
+}
@@ -0,0 +1,79 @@
+package org.projectfloodlight.openflow.protocol;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.file.Files;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.TimeUnit;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBuffers;
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Param;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.Setup;
+import org.openjdk.jmh.annotations.State;
+import org.openjdk.jmh.infra.Blackhole;
+import org.projectfloodlight.openflow.exceptions.OFParseError;
+
+/**
+ * Parses and serializes all messages of a workload file, a concatenation of messages
+ * such as the ones written by loxigen --lang=workload. Select the files with
+ * '-p workload=workload/of13/packet_in_burst.bin,...'; without one, a stream of echo
+ * requests is used.
+ */
+@State(Scope.Thread)
+@BenchmarkMode(Mode.Throughput)
+@OutputTimeUnit(TimeUnit.MILLISECONDS)
+public class WorkloadBench {
+    /** not named 'corpus' like the parameter of the generated benchmarks, so both can be set */
+    @Param({""})
+    String workload;
+
+    OFMessageReader<OFMessage> reader;
+    ChannelBuffer input;
+    ChannelBuffer output;
+    List<OFMessage> messages;
+
+    @Setup
+    public void setup() throws IOException, OFParseError {
+        reader = OFFactories.getGenericReader();
+        if (workload.isEmpty()) {
+            input = ChannelBuffers.dynamicBuffer();
+            OFFactory factory = OFFactories.getFactory(OFVersion.OF_13);
+            for (int i = 0; i < 10000; i++)
+                factory.buildEchoRequest().setXid(i).setData(new byte[i % 64]).build().writeTo(input);
+        } else {
+            input = ChannelBuffers.wrappedBuffer(Files.readAllBytes(new File(workload).toPath()));
+        }
+
+        messages = new ArrayList<OFMessage>();
+        OFMessage message;
+        while ((message = reader.readFrom(input)) != null)
+            messages.add(message);
+        if (input.readable())
+            throw new IllegalArgumentException("Truncated message at offset " + input.readerIndex()
+                    + " of " + workload);
+        output = ChannelBuffers.buffer(input.writerIndex());
+    }
+
+    @Benchmark
+    public void read(Blackhole blackhole) throws OFParseError {
+        input.readerIndex(0);
+        OFMessage message;
+        while ((message = reader.readFrom(input)) != null)
+            blackhole.consume(message);
+    }
+
+    @Benchmark
+    public ChannelBuffer write() {
+        output.clear();
+        for (OFMessage message : messages)
+            message.writeTo(output);
+        return output;
+    }
+}
@@ -0,0 +1,38 @@
+package org.projectfloodlight.openflow.protocol;
+
+import java.util.concurrent.TimeUnit;
+
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Param;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.Setup;
+import org.openjdk.jmh.annotations.State;
+import org.openjdk.jmh.annotations.Threads;
+
+/**
+ * Contention of a single xid generator shared by many threads, as with the
+ * OFFactory instances. Compare e.g. '-t 1' and '-t 16'.
+ */
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.Throughput)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+@Threads(Threads.MAX)
+public class XidGeneratorBench {
+    @Param({"standard", "striped"})
+    String generator;
+
+    XidGenerator xidGenerator;
+
+    @Setup
+    public void setup() {
+        xidGenerator = generator.equals("striped") ? XidGenerators.createStriped() : XidGenerators.create();
+    }
+
+    @Benchmark
+    public long nextXid() {
+        return xidGenerator.nextXid();
+    }
+}
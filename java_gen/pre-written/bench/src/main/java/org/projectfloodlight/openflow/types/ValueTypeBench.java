@@ -0,0 +1,67 @@
+package org.projectfloodlight.openflow.types;
+
+import java.util.concurrent.TimeUnit;
+
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.State;
+import org.openjdk.jmh.infra.Blackhole;
+
+/**
+ * Factory method throughput of the interned value types. Run with '-prof gc'
+ * to see the allocation rate: interned types should report ~0 B/op.
+ */
+@State(Scope.Thread)
+@BenchmarkMode(Mode.Throughput)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+public class ValueTypeBench {
+    int next;
+
+    private int nextValue() {
+        return next++;
+    }
+
+    @Benchmark
+    public void tableId(Blackhole bh) {
+        bh.consume(TableId.of(nextValue() & 0xFE));
+    }
+
+    @Benchmark
+    public void ipProtocol(Blackhole bh) {
+        bh.consume(IpProtocol.of((short) (nextValue() % 0xFF)));
+    }
+
+    @Benchmark
+    public void vlanVid(Blackhole bh) {
+        bh.consume(VlanVid.ofVlan(nextValue() & 0xFFF));
+    }
+
+    @Benchmark
+    public void vlanVidMatch(Blackhole bh) {
+        bh.consume(OFVlanVidMatch.ofVlan(nextValue() & 0xFFF));
+    }
+
+    @Benchmark
+    public void u16(Blackhole bh) {
+        bh.consume(U16.of(nextValue() & 0x3FF));
+    }
+
+    @Benchmark
+    public void ethType(Blackhole bh) {
+        bh.consume(EthType.of(0x8800 + (nextValue() & 0xFF)));
+    }
+
+    @Benchmark
+    public void port(Blackhole bh) {
+        bh.consume(OFPort.of(1 + (nextValue() & 0x1FF)));
+    }
+
+    /** not interned: baseline for the allocation rate of a wide-domain type */
+    @Benchmark
+    public void macAddress(Blackhole bh) {
+        bh.consume(MacAddress.of(nextValue() & 0xFFFF));
+    }
+}
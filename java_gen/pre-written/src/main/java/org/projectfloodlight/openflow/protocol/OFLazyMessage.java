@@ -0,0 +1,20 @@
+package org.projectfloodlight.openflow.protocol;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+
+/** Implemented by the message views returned from {@link OFFactory#getLazyReader()}.
+ *
+ *  A view keeps a slice of the buffer it was read from and decodes fields only when
+ *  their getters are called. The slice shares its content with the input buffer, so that
+ *  buffer must not be modified or reused while the view is in use. Malformed fields are
+ *  only detected on access and are reported as an {@link IllegalStateException}.
+ */
+public interface OFLazyMessage {
+    /** @return a slice with the wire bytes of this message. Shares content with the input buffer. */
+    ChannelBuffer getWireBuffer();
+
+    /** @return a slice with the trailing octets of this message (e.g., packet-in data),
+     *          without copying them, or null if the message does not end with an octets field.
+     */
+    ChannelBuffer getPayloadBuffer();
+}
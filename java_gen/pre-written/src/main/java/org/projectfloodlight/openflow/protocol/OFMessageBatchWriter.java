@@ -0,0 +1,60 @@
+package org.projectfloodlight.openflow.protocol;
+
+import java.util.List;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBufferFactory;
+import org.jboss.netty.buffer.HeapChannelBufferFactory;
+
+/** Serializes a batch of messages back to back into a single buffer.
+ *
+ *  The exact size of the batch is computed up front from {@link Writeable#getLength()},
+ *  so the target buffer is allocated (or grown) once instead of being reallocated while
+ *  the messages are written. Use a {@link org.jboss.netty.buffer.DirectChannelBufferFactory}
+ *  or a pooling factory to control where the buffer is allocated.
+ */
+public class OFMessageBatchWriter {
+    private final ChannelBufferFactory bufferFactory;
+
+    /** create a batch writer that allocates heap buffers */
+    public OFMessageBatchWriter() {
+        this(HeapChannelBufferFactory.getInstance());
+    }
+
+    /** create a batch writer that allocates its buffers from the given factory */
+    public OFMessageBatchWriter(ChannelBufferFactory bufferFactory) {
+        this.bufferFactory = bufferFactory;
+    }
+
+    /** @return the number of bytes the given messages serialize to */
+    public static int calcLength(List<? extends OFMessage> messages) {
+        int length = 0;
+        for(OFMessage m: messages)
+            length += m.getLength();
+        return length;
+    }
+
+    /** @return a new buffer of exactly the right size containing the serialized messages */
+    public ChannelBuffer write(List<? extends OFMessage> messages) {
+        int length = calcLength(messages);
+        ChannelBuffer bb = bufferFactory.getBuffer(length);
+        writeMessages(bb, messages, length);
+        return bb;
+    }
+
+    /** append the serialized messages to bb, growing it (if dynamic) at most once */
+    public static void writeTo(ChannelBuffer bb, List<? extends OFMessage> messages) {
+        int length = calcLength(messages);
+        bb.ensureWritableBytes(length);
+        writeMessages(bb, messages, length);
+    }
+
+    private static void writeMessages(ChannelBuffer bb, List<? extends OFMessage> messages, int length) {
+        int start = bb.writerIndex();
+        for(OFMessage m: messages)
+            m.writeTo(bb);
+        if(bb.writerIndex() - start != length)
+            throw new IllegalStateException("Batch length mismatch: expected=" + length +
+                    ", written=" + (bb.writerIndex() - start));
+    }
+}
@@ -0,0 +1,118 @@
+package org.projectfloodlight.openflow.protocol;
+
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.AtomicLongArray;
+
+import org.projectfloodlight.openflow.exceptions.OFParseError;
+
+import com.google.common.collect.ImmutableMap;
+
+/** Holder for the {@link OFMetricsListener} called by generated readers and writers.
+ *  No listener is installed by default; the generated code then only pays for a
+ *  volatile read per message.
+ */
+public class OFMetrics {
+    private static volatile OFMetricsListener listener = null;
+
+    private OFMetrics() { }
+
+    /** @return the installed listener, or null if metrics are disabled */
+    public static OFMetricsListener getListener() {
+        return listener;
+    }
+
+    /** install a listener, or disable metrics by passing null */
+    public static void setListener(OFMetricsListener newListener) {
+        listener = newListener;
+    }
+
+    /** Per class statistics collected by a {@link Collector} */
+    public static class ClassStats {
+        /** number of buckets of the parse time histogram */
+        public final static int HISTOGRAM_BUCKETS = 32;
+
+        private final AtomicLong parsed = new AtomicLong();
+        private final AtomicLong parsedBytes = new AtomicLong();
+        private final AtomicLong serialized = new AtomicLong();
+        private final AtomicLong serializedBytes = new AtomicLong();
+        private final AtomicLong errors = new AtomicLong();
+        private final AtomicLongArray parseNanos = new AtomicLongArray(HISTOGRAM_BUCKETS);
+
+        public long getParsed() {
+            return parsed.get();
+        }
+
+        public long getParsedBytes() {
+            return parsedBytes.get();
+        }
+
+        public long getSerialized() {
+            return serialized.get();
+        }
+
+        public long getSerializedBytes() {
+            return serializedBytes.get();
+        }
+
+        public long getErrors() {
+            return errors.get();
+        }
+
+        /** @return the number of parses that took [2^(i-1), 2^i) nanoseconds; the
+         *          last bucket also counts all longer parses
+         */
+        public long getParseTimeBucket(int i) {
+            return parseNanos.get(i);
+        }
+
+        static int bucket(long nanos) {
+            int bucket = 64 - Long.numberOfLeadingZeros(nanos);
+            return bucket < HISTOGRAM_BUCKETS ? bucket : HISTOGRAM_BUCKETS - 1;
+        }
+    }
+
+    /** A listener that keeps counters and a log2 parse time histogram per class */
+    public static class Collector implements OFMetricsListener {
+        private final ConcurrentMap<Class<?>, ClassStats> stats =
+                new ConcurrentHashMap<Class<?>, ClassStats>();
+
+        private ClassStats statsFor(Class<?> clazz) {
+            ClassStats s = stats.get(clazz);
+            if(s == null) {
+                s = new ClassStats();
+                ClassStats existing = stats.putIfAbsent(clazz, s);
+                if(existing != null)
+                    s = existing;
+            }
+            return s;
+        }
+
+        @Override
+        public void parsed(Class<?> clazz, int bytes, long nanos) {
+            ClassStats s = statsFor(clazz);
+            s.parsed.incrementAndGet();
+            s.parsedBytes.addAndGet(bytes);
+            s.parseNanos.incrementAndGet(ClassStats.bucket(nanos));
+        }
+
+        @Override
+        public void serialized(Class<?> clazz, int bytes) {
+            ClassStats s = statsFor(clazz);
+            s.serialized.incrementAndGet();
+            s.serializedBytes.addAndGet(bytes);
+        }
+
+        @Override
+        public void parseError(Class<?> clazz, OFParseError error) {
+            statsFor(clazz).errors.incrementAndGet();
+        }
+
+        /** @return a snapshot of the classes seen so far and their (live) statistics */
+        public Map<Class<?>, ClassStats> getStats() {
+            return ImmutableMap.copyOf(stats);
+        }
+    }
+}
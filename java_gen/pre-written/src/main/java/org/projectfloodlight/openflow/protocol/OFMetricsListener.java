@@ -0,0 +1,18 @@
+package org.projectfloodlight.openflow.protocol;
+
+import org.projectfloodlight.openflow.exceptions.OFParseError;
+
+/** Receives parse and serialize events from openflowj code generated with
+ *  metrics instrumentation. Install an instance with {@link OFMetrics#setListener}.
+ *  Called from the I/O threads - implementations must be thread safe and cheap.
+ */
+public interface OFMetricsListener {
+    /** an instance of class clazz has been read from 'bytes' bytes in 'nanos' nanoseconds */
+    void parsed(Class<?> clazz, int bytes, long nanos);
+
+    /** an instance of class clazz has been written as 'bytes' bytes */
+    void serialized(Class<?> clazz, int bytes);
+
+    /** reading an instance of class clazz has failed with the given error */
+    void parseError(Class<?> clazz, OFParseError error);
+}
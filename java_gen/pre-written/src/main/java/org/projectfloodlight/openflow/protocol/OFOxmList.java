@@ -1,5 +1,6 @@
 package org.projectfloodlight.openflow.protocol;
 
+import java.util.Arrays;
 import java.util.EnumMap;
 import java.util.Iterator;
 import java.util.Map;
@@ -16,85 +17,129 @@ import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
 import com.google.common.base.Objects;
-import com.google.common.collect.ImmutableMap;
+import com.google.common.collect.Iterators;
 import com.google.common.hash.PrimitiveSink;
 
 public class OFOxmList implements Iterable<OFOxm<?>>, Writeable, PrimitiveSinkable {
     private static final Logger logger = LoggerFactory.getLogger(OFOxmList.class);
 
-    private final Map<MatchFields, OFOxm<?>> oxmMap;
+    private static final MatchFields[] ALL_FIELDS = MatchFields.values();
+    static {
+        // the presence of the fields is tracked in a single long
+        if(ALL_FIELDS.length > 64)
+            throw new IllegalStateException("OFOxmList supports at most 64 MatchFields, found " + ALL_FIELDS.length);
+    }
+
+    /** bit i is set iff an oxm for the MatchFields with ordinal i is present */
+    private final long fieldBits;
+    /** the present oxms, ordered by MatchFields ordinal */
+    private final OFOxm<?>[] oxms;
 
-    public final static OFOxmList EMPTY = new OFOxmList(ImmutableMap.<MatchFields, OFOxm<?>>of());
+    public final static OFOxmList EMPTY = new OFOxmList(0L, new OFOxm<?>[0]);
 
-    private OFOxmList(Map<MatchFields, OFOxm<?>> oxmMap) {
-        this.oxmMap = oxmMap;
+    private OFOxmList(long fieldBits, OFOxm<?>[] oxms) {
+        this.fieldBits = fieldBits;
+        this.oxms = oxms;
+    }
+
+    /** compact an array of oxms indexed by MatchFields ordinal (with nulls for absent fields) */
+    private static OFOxmList fromSlots(OFOxm<?>[] slots) {
+        long fieldBits = 0;
+        int count = 0;
+        for (int i = 0; i < slots.length; i++) {
+            if (slots[i] != null) {
+                fieldBits |= 1L << i;
+                count++;
+            }
+        }
+        if (count == 0)
+            return EMPTY;
+
+        OFOxm<?>[] oxms = new OFOxm<?>[count];
+        int j = 0;
+        for (int i = 0; i < slots.length; i++) {
+            if (slots[i] != null)
+                oxms[j++] = slots[i];
+        }
+        return new OFOxmList(fieldBits, oxms);
     }
 
     @SuppressWarnings("unchecked")
     public <T extends OFValueType<T>> OFOxm<T> get(MatchField<T> matchField) {
-        return (OFOxm<T>) oxmMap.get(matchField.id);
+        long bit = 1L << matchField.id.ordinal();
+        if ((fieldBits & bit) == 0)
+            return null;
+        // index = number of present fields with a lower ordinal
+        return (OFOxm<T>) oxms[Long.bitCount(fieldBits & (bit - 1))];
     }
 
     public static class Builder {
-        private final Map<MatchFields, OFOxm<?>> oxmMap;
+        /** oxms indexed by MatchFields ordinal */
+        private final OFOxm<?>[] slots;
 
         public Builder() {
-            oxmMap = new EnumMap<MatchFields, OFOxm<?>>(MatchFields.class);
+            slots = new OFOxm<?>[ALL_FIELDS.length];
         }
 
         public Builder(EnumMap<MatchFields, OFOxm<?>> oxmMap) {
-            this.oxmMap = oxmMap;
+            this();
+            for (Map.Entry<MatchFields, OFOxm<?>> e : oxmMap.entrySet())
+                slots[e.getKey().ordinal()] = e.getValue();
+        }
+
+        private Builder(OFOxmList list) {
+            this();
+            int j = 0;
+            for (int i = 0; i < slots.length; i++) {
+                if ((list.fieldBits & (1L << i)) != 0)
+                    slots[i] = list.oxms[j++];
+            }
         }
 
         public <T extends OFValueType<T>> void set(OFOxm<T> oxm) {
-            oxmMap.put(oxm.getMatchField().id, oxm);
+            slots[oxm.getMatchField().id.ordinal()] = oxm;
         }
 
         public <T extends OFValueType<T>> void unset(MatchField<T> matchField) {
-            oxmMap.remove(matchField.id);
+            slots[matchField.id.ordinal()] = null;
         }
 
         public OFOxmList build() {
-            return OFOxmList.ofList(oxmMap.values());
+            OFOxm<?>[] canonical = new OFOxm<?>[slots.length];
+            for (int i = 0; i < slots.length; i++) {
+                if (slots[i] != null)
+                    canonical[i] = canonicalize(slots[i]);
+            }
+            return fromSlots(canonical);
         }
     }
 
     @Override
     public Iterator<OFOxm<?>> iterator() {
-        return oxmMap.values().iterator();
+        return Iterators.forArray(oxms);
     }
 
-    public static OFOxmList ofList(Iterable<OFOxm<?>> oxmList) {
-        Map<MatchFields, OFOxm<?>> map = new EnumMap<MatchFields, OFOxm<?>>(
-                MatchFields.class);
-        for (OFOxm<?> o : oxmList) {
-            OFOxm<?> canonical = o.getCanonical();
+    private static OFOxm<?> canonicalize(OFOxm<?> o) {
+        OFOxm<?> canonical = o.getCanonical();
 
-            if(logger.isDebugEnabled() && !Objects.equal(o, canonical)) {
-                logger.debug("OFOxmList: normalized non-canonical OXM {} to {}", o, canonical);
-            }
+        if(logger.isDebugEnabled() && !Objects.equal(o, canonical)) {
+            logger.debug("OFOxmList: normalized non-canonical OXM {} to {}", o, canonical);
+        }
+        return canonical;
+    }
 
+    public static OFOxmList ofList(Iterable<OFOxm<?>> oxmList) {
+        OFOxm<?>[] slots = new OFOxm<?>[ALL_FIELDS.length];
+        for (OFOxm<?> o : oxmList) {
+            OFOxm<?> canonical = canonicalize(o);
             if(canonical != null)
-                map.put(canonical.getMatchField().id, canonical);
-
+                slots[canonical.getMatchField().id.ordinal()] = canonical;
         }
-        return new OFOxmList(map);
+        return fromSlots(slots);
     }
 
     public static OFOxmList of(OFOxm<?>... oxms) {
-        Map<MatchFields, OFOxm<?>> map = new EnumMap<MatchFields, OFOxm<?>>(
-                MatchFields.class);
-        for (OFOxm<?> o : oxms) {
-            OFOxm<?> canonical = o.getCanonical();
-
-            if(logger.isDebugEnabled() && !Objects.equal(o, canonical)) {
-                logger.debug("OFOxmList: normalized non-canonical OXM {} to {}", o, canonical);
-            }
-
-            if(canonical != null)
-                map.put(canonical.getMatchField().id, canonical);
-        }
-        return new OFOxmList(map);
+        return ofList(Arrays.asList(oxms));
     }
 
     public static OFOxmList readFrom(ChannelBuffer bb, int length,
@@ -104,20 +149,30 @@ public class OFOxmList implements Iterable<OFOxm<?>>, Writeable, PrimitiveSinkab
 
     @Override
     public void writeTo(ChannelBuffer bb) {
-        for (OFOxm<?> o : this) {
+        for (OFOxm<?> o : oxms) {
             o.writeTo(bb);
         }
     }
 
+    @Override
+    public int getLength() {
+        int length = 0;
+        for (OFOxm<?> o : oxms) {
+            length += o.getLength();
+        }
+        return length;
+    }
+
     public OFOxmList.Builder createBuilder() {
-        return new OFOxmList.Builder(new EnumMap<MatchFields, OFOxm<?>>(oxmMap));
+        return new OFOxmList.Builder(this);
     }
 
     @Override
     public int hashCode() {
         final int prime = 31;
         int result = 1;
-        result = prime * result + ((oxmMap == null) ? 0 : oxmMap.hashCode());
+        result = prime * result + (int) (fieldBits ^ (fieldBits >>> 32));
+        result = prime * result + Arrays.hashCode(oxms);
         return result;
     }
 
@@ -130,22 +185,28 @@ public class OFOxmList implements Iterable<OFOxm<?>>, Writeable, PrimitiveSinkab
         if (getClass() != obj.getClass())
             return false;
         OFOxmList other = (OFOxmList) obj;
-        if (oxmMap == null) {
-            if (other.oxmMap != null)
-                return false;
-        } else if (!oxmMap.equals(other.oxmMap))
+        if (fieldBits != other.fieldBits)
+            return false;
+        if (!Arrays.equals(oxms, other.oxms))
             return false;
         return true;
     }
 
     @Override
     public String toString() {
-        return "OFOxmList" + oxmMap;
+        StringBuilder b = new StringBuilder("OFOxmList{");
+        for (int i = 0; i < oxms.length; i++) {
+            if (i > 0)
+                b.append(", ");
+            b.append(oxms[i].getMatchField().id).append('=').append(oxms[i]);
+        }
+        b.append('}');
+        return b.toString();
     }
 
     @Override
     public void putTo(PrimitiveSink sink) {
-        for (OFOxm<?> o : this) {
+        for (OFOxm<?> o : oxms) {
             o.putTo(sink);
         }
     }
@@ -4,4 +4,7 @@ import org.jboss.netty.buffer.ChannelBuffer;
 
 public interface Writeable {
     void writeTo(ChannelBuffer bb);
+
+    /** @return the number of bytes {@link #writeTo(ChannelBuffer)} writes for this object */
+    int getLength();
 }
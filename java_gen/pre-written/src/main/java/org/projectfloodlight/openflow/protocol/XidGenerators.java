@@ -3,12 +3,29 @@ package org.projectfloodlight.openflow.protocol;
 import java.util.concurrent.atomic.AtomicLong;
 
 public class XidGenerators {
-    private static final XidGenerator GLOBAL_XID_GENERATOR = new StandardXidGenerator();
+    private static final XidGenerator GLOBAL_XID_GENERATOR = new StripedXidGenerator();
 
+    /** @return a new generator with a single counter. Its xids are handed out in strictly
+     *  increasing order (until they wrap around), at the cost of contention on the counter
+     *  when it is shared by many threads. */
     public static XidGenerator create() {
         return new StandardXidGenerator();
     }
 
+    /** @return a new generator that reserves blocks of xids per thread, e.g., for one
+     *  connection that is used by many threads. Xids are unique per generator until the
+     *  32 bit xid space wraps around, but only increasing per thread. */
+    public static XidGenerator createStriped() {
+        return new StripedXidGenerator();
+    }
+
+    /** @return a new striped generator that reserves <code>blockSize</code> xids at a time
+     *  per thread. <code>blockSize</code> must be a power of two between 1 and 2^16. */
+    public static XidGenerator createStriped(int blockSize) {
+        return new StripedXidGenerator(blockSize);
+    }
+
+    /** @return the striped generator shared by the OFFactory instances */
     public static XidGenerator global() {
         return GLOBAL_XID_GENERATOR;
     }
@@ -35,4 +52,56 @@ class StandardXidGenerator implements XidGenerator {
         return xid;
     }
 
-}
\ No newline at end of file
+}
+
+/** Hands out xids from per-thread blocks, so the shared counter is only touched once per
+ *  block. Like StandardXidGenerator, it never returns xid 0.
+ */
+class StripedXidGenerator implements XidGenerator {
+    static final int DEFAULT_BLOCK_SIZE = 1024;
+    static final long MAX_XID = 0xFFffFFffL;
+
+    private final AtomicLong nextBlock;
+    private final int blockSize;
+    private final ThreadLocal<Block> blocks = new ThreadLocal<Block>() {
+        @Override
+        protected Block initialValue() {
+            return new Block();
+        }
+    };
+
+    private static final class Block {
+        long next;
+        long end;
+    }
+
+    StripedXidGenerator() {
+        this(DEFAULT_BLOCK_SIZE);
+    }
+
+    StripedXidGenerator(int blockSize) {
+        this(blockSize, 0);
+    }
+
+    StripedXidGenerator(int blockSize, long firstBlock) {
+        if(blockSize < 1 || blockSize > 0x10000 || Integer.bitCount(blockSize) != 1)
+            throw new IllegalArgumentException("blockSize must be a power of two between 1 and 2^16, was: "
+                    + blockSize);
+        this.blockSize = blockSize;
+        this.nextBlock = new AtomicLong(firstBlock);
+    }
+
+    @Override
+    public long nextXid() {
+        Block block = blocks.get();
+        if(block.next == block.end) {
+            // blockSize divides the xid space, so blocks never straddle the wraparound
+            long start = (nextBlock.getAndIncrement() * blockSize) & MAX_XID;
+            block.next = start == 0 ? 1 : start;
+            block.end = start + blockSize;
+            if(block.next == block.end)
+                return nextXid();
+        }
+        return block.next++;
+    }
+}
@@ -14,6 +14,19 @@ import com.google.common.primitives.UnsignedInts;
 public class EthType implements OFValueType<EthType> {
     static final int LENGTH = 2;
 
+    /** bounded direct-mapped cache of recently used unnamed ethertypes */
+    private static final ValueCache<EthType> CACHE = new ValueCache<EthType>(1024) {
+        @Override
+        protected EthType create(int key) {
+            return new EthType(key);
+        }
+
+        @Override
+        protected int keyOf(EthType value) {
+            return value.rawValue;
+        }
+    };
+
     private final int rawValue;
 
     static final int VAL_IPv4              = 0x0800; // Internet Protocol version 4 (IPv4)
@@ -211,8 +224,7 @@ public class EthType implements OFValueType<EthType> {
             case VAL_LLT:
                 return LLT;
             default:
-                // TODO: What's here?
-                return new EthType(type);
+                return CACHE.get(type);
         }
     }
 
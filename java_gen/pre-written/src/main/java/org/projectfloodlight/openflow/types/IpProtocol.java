@@ -306,6 +306,19 @@ public class IpProtocol implements OFValueType<IpProtocol> {
     public static final IpProtocol NO_MASK = HOPOPT;
     public static final IpProtocol FULL_MASK = new IpProtocol((short)0x0000);
 
+    /** interned instances of the protocol numbers that have no named constant */
+    private static final ValueCache<IpProtocol> UNNAMED = new ValueCache<IpProtocol>(MAX_PROTO + 1) {
+        @Override
+        protected IpProtocol create(int key) {
+            return new IpProtocol((short) key);
+        }
+
+        @Override
+        protected int keyOf(IpProtocol value) {
+            return value.proto;
+        }
+    };
+
     private IpProtocol(short version) {
         this.proto = version;
     }
@@ -604,8 +617,10 @@ public class IpProtocol implements OFValueType<IpProtocol> {
                 if (proto >= MAX_PROTO) {
                     throw new IllegalArgumentException("Illegal IP protocol number: "
                             + proto);
-                } else {
+                } else if (proto < 0) {
                     return new IpProtocol(proto);
+                } else {
+                    return UNNAMED.get(proto);
                 }
         }
     }
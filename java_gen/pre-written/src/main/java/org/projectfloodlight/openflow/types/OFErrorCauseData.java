@@ -81,6 +81,11 @@ public class OFErrorCauseData implements Writeable, PrimitiveSinkable {
         bb.writeBytes(data);
     }
 
+    @Override
+    public int getLength() {
+        return data.length;
+    }
+
    @Override
    public String toString() {
       Optional<OFMessage> parsedMessage = getParsedMessage();
@@ -148,6 +148,25 @@ public class OFPort implements OFValueType<OFPort> {
         private final static OFPort p48 = new OFPort(48);
     }
 
+    /** bounded direct-mapped cache of the ports beyond PrecachedPort */
+    private static class CachedPort {
+        private final static ValueCache<OFPort> cache = new ValueCache<OFPort>(1024) {
+            @Override
+            protected OFPort create(int key) {
+                return new OFPort(key);
+            }
+
+            @Override
+            protected int keyOf(OFPort value) {
+                return value.portNumber;
+            }
+        };
+    }
+
+    private static OFPort cached(final int portNumber) {
+        return CachedPort.cache.get(portNumber);
+    }
+
     /** raw openflow port number as a signed 32 bit integer */
     private final int portNumber;
 
@@ -290,7 +309,7 @@ public class OFPort implements OFValueType<OFPort> {
                 if (portNumber < 0 && portNumber > OFPP_MAX_INT)
                     throw new IllegalArgumentException("Unknown special port number: "
                             + portNumber);
-                return new OFPort(portNumber);
+                return cached(portNumber);
         }
     }
 
@@ -434,7 +453,7 @@ public class OFPort implements OFValueType<OFPort> {
                 if (portNumber < 0 && portNumber > OFPP_MAX_SHORT)
                     throw new IllegalArgumentException("Unknown special port number: "
                             + portNumber);
-                return new OFPort(portNumber);
+                return cached(portNumber);
         }
     }
 
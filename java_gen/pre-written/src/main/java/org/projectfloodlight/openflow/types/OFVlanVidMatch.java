@@ -53,6 +53,19 @@ public class OFVlanVidMatch implements OFValueType<OFVlanVidMatch> {
         }
     };
 
+    /** interned vids; the 13 bit domain is small enough to keep all of them */
+    private static final ValueCache<OFVlanVidMatch> CACHE = new ValueCache<OFVlanVidMatch>(VALIDATION_MASK + 1) {
+        @Override
+        protected OFVlanVidMatch create(int key) {
+            return new OFVlanVidMatch((short) key);
+        }
+
+        @Override
+        protected int keyOf(OFVlanVidMatch value) {
+            return value.vid;
+        }
+    };
+
     private final short vid;
 
     private OFVlanVidMatch(short vid) {
@@ -70,7 +83,7 @@ public class OFVlanVidMatch implements OFValueType<OFVlanVidMatch> {
             return UNTAGGED;
         } else if ((vid & VALIDATION_MASK) != vid)
             throw new IllegalArgumentException(String.format("Illegal VLAN value: %x", vid));
-        return new OFVlanVidMatch(vid);
+        return CACHE.get(vid);
     }
 
     public static OFVlanVidMatch ofVlanVid(VlanVid vid) {
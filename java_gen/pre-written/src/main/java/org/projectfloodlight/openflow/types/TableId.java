@@ -19,6 +19,19 @@ public class TableId implements OFValueType<TableId>, Comparable<TableId> {
     public static final TableId ALL = new TableId(ALL_VAL);
     public static final TableId ZERO = NONE;
 
+    /** interned table ids; the domain is small enough to keep all of them */
+    private static final ValueCache<TableId> CACHE = new ValueCache<TableId>(VALIDATION_MASK + 1) {
+        @Override
+        protected TableId create(int key) {
+            return new TableId((short) key);
+        }
+
+        @Override
+        protected int keyOf(TableId value) {
+            return value.id;
+        }
+    };
+
     private final short id;
 
     private TableId(short id) {
@@ -34,7 +47,7 @@ public class TableId implements OFValueType<TableId>, Comparable<TableId> {
             default:
                 if ((id & VALIDATION_MASK) != id)
                     throw new IllegalArgumentException("Illegal Table id value: " + id);
-                return new TableId(id);
+                return CACHE.get(id);
         }
     }
 
@@ -41,6 +41,19 @@ public class U16 implements Writeable, OFValueType<U16> {
         return (short) l;
     }
 
+    /** bounded direct-mapped cache of recently used values */
+    private static final ValueCache<U16> CACHE = new ValueCache<U16>(1024) {
+        @Override
+        protected U16 create(int key) {
+            return new U16((short) key);
+        }
+
+        @Override
+        protected int keyOf(U16 value) {
+            return value.raw;
+        }
+    };
+
     private final short raw;
 
     private U16(short raw) {
@@ -54,7 +67,7 @@ public class U16 implements Writeable, OFValueType<U16> {
     public static final U16 ofRaw(short raw) {
         if(raw == ZERO_VAL)
             return ZERO;
-        return new U16(raw);
+        return CACHE.get(raw);
     }
 
     public int getValue() {
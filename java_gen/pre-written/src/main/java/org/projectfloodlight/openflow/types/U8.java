@@ -33,6 +33,19 @@ public class U8 implements Writeable, OFValueType<U8> {
     public static final U8 NO_MASK = new U8(NO_MASK_VAL);
     public static final U8 FULL_MASK = ZERO;
 
+    /** interned values; the domain is small enough to keep all of them */
+    private static final ValueCache<U8> CACHE = new ValueCache<U8>(256) {
+        @Override
+        protected U8 create(int key) {
+            return new U8((byte) key);
+        }
+
+        @Override
+        protected int keyOf(U8 value) {
+            return value.raw & 0xFF;
+        }
+    };
+
     private final byte raw;
 
     private U8(byte raw) {
@@ -45,11 +58,11 @@ public class U8 implements Writeable, OFValueType<U8> {
         if(value == NO_MASK_VAL)
             return NO_MASK;
 
-        return new U8(t(value));
+        return ofRaw(t(value));
     }
 
     public static final U8 ofRaw(byte value) {
-        return new U8(value);
+        return CACHE.get(value & 0xFF);
     }
 
     public short getValue() {
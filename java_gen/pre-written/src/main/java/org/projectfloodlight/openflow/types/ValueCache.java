@@ -0,0 +1,48 @@
+package org.projectfloodlight.openflow.types;
+
+/** Cache of interned instances of an immutable value type, keyed by an int.
+ *
+ *  <p>The cache has a power of two number of slots, and a key goes in the slot given by
+ *  its low bits. A new value replaces the value in its slot, so a cache smaller than the
+ *  domain of its keys is a bounded direct-mapped cache of recently used values, and a
+ *  cache as large as the domain interns all of them.
+ *
+ *  <p>Lookups and fills are not synchronized. Threads racing to fill a slot may each create
+ *  an instance, and only one of them stays cached. This is benign: the value types are
+ *  immutable, so their instances are safely published through their final fields, and
+ *  they are compared by value, so callers cannot tell the instances apart.
+ *
+ * @param <T> the value type
+ */
+abstract class ValueCache<T> {
+    private final Object[] slots;
+    private final int mask;
+
+    /** @param size the number of slots, a power of two */
+    ValueCache(int size) {
+        if (Integer.bitCount(size) != 1)
+            throw new IllegalArgumentException("Cache size must be a power of two: " + size);
+        this.slots = new Object[size];
+        this.mask = size - 1;
+    }
+
+    /** @return the cached instance with the given key, created by {@link #create(int)}
+     *          if it is not cached
+     */
+    @SuppressWarnings("unchecked")
+    final T get(int key) {
+        int slot = key & mask;
+        T value = (T) slots[slot];
+        if (value == null || keyOf(value) != key) {
+            value = create(key);
+            slots[slot] = value;
+        }
+        return value;
+    }
+
+    /** @return a new instance with the given key */
+    protected abstract T create(int key);
+
+    /** @return the key of value, as passed to {@link #create(int)} */
+    protected abstract int keyOf(T value);
+}
@@ -26,6 +26,19 @@ public class VlanVid implements OFValueType<VlanVid> {
     public static final VlanVid NO_MASK = new VlanVid((short)0xFFFF);
     public static final VlanVid FULL_MASK = ZERO;
 
+    /** interned vids; the 12 bit domain is small enough to keep all of them */
+    private static final ValueCache<VlanVid> CACHE = new ValueCache<VlanVid>(VALIDATION_MASK + 1) {
+        @Override
+        protected VlanVid create(int key) {
+            return new VlanVid((short) key);
+        }
+
+        @Override
+        protected int keyOf(VlanVid value) {
+            return value.vid;
+        }
+    };
+
     private final short vid;
 
     private VlanVid(short vid) {
@@ -37,7 +50,7 @@ public class VlanVid implements OFValueType<VlanVid> {
             return NO_MASK;
         if ((vid & VALIDATION_MASK) != vid)
             throw new IllegalArgumentException(String.format("Illegal VLAN value: %x", vid));
-        return new VlanVid((short) vid);
+        return CACHE.get(vid);
     }
 
     /** @return the actual VLAN tag this vid identifies */
@@ -0,0 +1,69 @@
+package org.projectfloodlight.openflow.util;
+
+import java.nio.BufferOverflowException;
+import java.nio.ByteBuffer;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBuffers;
+import org.projectfloodlight.openflow.exceptions.OFParseError;
+import org.projectfloodlight.openflow.protocol.OFMessageReader;
+import org.projectfloodlight.openflow.protocol.Writeable;
+
+/**
+ * Reads and writes OpenFlow objects directly from / to {@link ByteBuffer}s, including
+ * direct and memory-mapped buffers, without copying.
+ *
+ * The generated readers and writers work against the {@link ChannelBuffer} interface; the
+ * buffers are wrapped in a zero-copy ChannelBuffer view of their remaining bytes, and the
+ * position of the ByteBuffer is advanced by the number of bytes read or written, like the
+ * relative get/put methods of ByteBuffer itself. Objects read lazily (e.g., through
+ * {@link org.projectfloodlight.openflow.protocol.OFFactory#getLazyReader()}) keep
+ * referencing the ByteBuffer's memory.
+ */
+public final class ByteBufferUtils {
+
+    private ByteBufferUtils() {}
+
+    /** @return a big-endian ChannelBuffer view of the remaining bytes of <code>buffer</code>.
+     *  The view shares the content of <code>buffer</code> but has its own indexes, and is
+     *  readable from index 0 to <code>buffer.remaining()</code>.
+     */
+    public static ChannelBuffer wrap(ByteBuffer buffer) {
+        // slice() is always big-endian, as OpenFlow is
+        return ChannelBuffers.wrappedBuffer(buffer.slice());
+    }
+
+    /** read one object from the remaining bytes of <code>buffer</code>.
+     *
+     * @return the object read, with the position of <code>buffer</code> advanced past it, or
+     *     null if <code>buffer</code> does not contain the complete object yet, in which
+     *     case the position is not changed.
+     * @throws OFParseError if the data is malformed
+     */
+    public static <T> T readFrom(OFMessageReader<T> reader, ByteBuffer buffer) throws OFParseError {
+        ChannelBuffer bb = wrap(buffer);
+        T result = reader.readFrom(bb);
+        if(result != null)
+            buffer.position(buffer.position() + bb.readerIndex());
+        return result;
+    }
+
+    /** write <code>writeable</code> into <code>buffer</code> at its current position, and
+     *  advance the position past it.
+     *
+     * @throws BufferOverflowException if the remaining space in <code>buffer</code> is
+     *     smaller than {@link Writeable#getLength()}. Nothing is written in that case.
+     */
+    public static void writeTo(Writeable writeable, ByteBuffer buffer) {
+        int length = writeable.getLength();
+        if(buffer.remaining() < length)
+            throw new BufferOverflowException();
+        ChannelBuffer bb = wrap(buffer);
+        bb.clear();
+        writeable.writeTo(bb);
+        if(bb.writerIndex() != length)
+            throw new IllegalStateException(String.format("Wrote %d bytes for %s, but getLength() is %d",
+                    bb.writerIndex(), writeable, length));
+        buffer.position(buffer.position() + length);
+    }
+}
@@ -59,11 +59,13 @@ public class ChannelUtils {
     public static <T> List<T> readList(ChannelBuffer bb, int length, OFMessageReader<T> reader) throws OFParseError {
         int end = bb.readerIndex() + length;
         Builder<T> builder = ImmutableList.<T>builder();
-        if(logger.isTraceEnabled())
+        // checked once per list instead of once per element
+        boolean trace = logger.isTraceEnabled();
+        if(trace)
             logger.trace("readList(length={}, reader={})", length, reader.getClass());
         while(bb.readerIndex() < end) {
             T read = reader.readFrom(bb);
-            if(logger.isTraceEnabled())
+            if(trace)
                 logger.trace("readList: read={}, left={}", read, end - bb.readerIndex());
             builder.add(read);
         }
@@ -77,4 +79,12 @@ public class ChannelUtils {
         for(Writeable w: writeables)
             w.writeTo(bb);
     }
+
+    /** @return the number of bytes {@link #writeList(ChannelBuffer, List)} writes for the given list */
+    public static int calcListLength(List<? extends Writeable> writeables) {
+        int length = 0;
+        for(Writeable w: writeables)
+            length += w.getLength();
+        return length;
+    }
 }
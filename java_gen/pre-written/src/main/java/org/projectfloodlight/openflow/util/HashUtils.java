@@ -0,0 +1,20 @@
+package org.projectfloodlight.openflow.util;
+
+/** Helpers for the hashCode() implementations of the generated OF classes. */
+public class HashUtils {
+    private HashUtils() { }
+
+    /** Spread the bits of a polynomial (31 * h + x) hash code across the whole int,
+     *  using the MurmurHash3 32 bit finalizer. Hash codes of messages that only differ
+     *  in a single field (e.g., cookie or a counter) then end up far apart, instead of
+     *  colliding in the low bits used by HashMap bucket selection.
+     */
+    public static int mix(int h) {
+        h ^= h >>> 16;
+        h *= 0x85ebca6b;
+        h ^= h >>> 13;
+        h *= 0xc2b2ae35;
+        h ^= h >>> 16;
+        return h;
+    }
+}
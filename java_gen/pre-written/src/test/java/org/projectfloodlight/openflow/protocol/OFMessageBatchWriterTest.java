@@ -0,0 +1,78 @@
+package org.projectfloodlight.openflow.protocol;
+
+import static org.hamcrest.CoreMatchers.equalTo;
+import static org.junit.Assert.assertThat;
+
+import java.util.List;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBuffers;
+import org.jboss.netty.buffer.DirectChannelBufferFactory;
+import org.junit.Test;
+import org.projectfloodlight.openflow.protocol.action.OFAction;
+import org.projectfloodlight.openflow.protocol.match.MatchField;
+import org.projectfloodlight.openflow.types.OFPort;
+import org.projectfloodlight.openflow.types.U64;
+
+import com.google.common.collect.ImmutableList;
+
+public class OFMessageBatchWriterTest {
+    private final OFFactory factory = OFFactories.getFactory(OFVersion.OF_13);
+
+    private List<OFMessage> createMessages() {
+        ImmutableList.Builder<OFMessage> messages = ImmutableList.builder();
+        for(int i=0; i < 10; i++) {
+            List<OFAction> actions = ImmutableList.<OFAction>of(
+                    factory.actions().output(OFPort.of(i + 1), 0xffff));
+            messages.add(factory.buildFlowAdd()
+                    .setXid(i)
+                    .setCookie(U64.of(i))
+                    .setMatch(factory.buildMatch().setExact(MatchField.IN_PORT, OFPort.of(i)).build())
+                    .setActions(actions)
+                    .build());
+        }
+        messages.add(factory.barrierRequest());
+        return messages.build();
+    }
+
+    private byte[] writeOneByOne(List<OFMessage> messages) {
+        ChannelBuffer bb = ChannelBuffers.dynamicBuffer();
+        for(OFMessage m: messages)
+            m.writeTo(bb);
+        byte[] bytes = new byte[bb.readableBytes()];
+        bb.readBytes(bytes);
+        return bytes;
+    }
+
+    @Test
+    public void testWrite() {
+        List<OFMessage> messages = createMessages();
+        byte[] expected = writeOneByOne(messages);
+
+        ChannelBuffer bb = new OFMessageBatchWriter().write(messages);
+        assertThat(bb.capacity(), equalTo(expected.length));
+        byte[] written = new byte[bb.readableBytes()];
+        bb.readBytes(written);
+        assertThat(written, equalTo(expected));
+    }
+
+    @Test
+    public void testWriteDirect() {
+        List<OFMessage> messages = createMessages();
+        ChannelBuffer bb = new OFMessageBatchWriter(DirectChannelBufferFactory.getInstance()).write(messages);
+        assertThat(bb.isDirect(), equalTo(true));
+        assertThat(bb.readableBytes(), equalTo(OFMessageBatchWriter.calcLength(messages)));
+    }
+
+    @Test
+    public void testWriteTo() {
+        List<OFMessage> messages = createMessages();
+        byte[] expected = writeOneByOne(messages);
+
+        ChannelBuffer bb = ChannelBuffers.dynamicBuffer(16);
+        OFMessageBatchWriter.writeTo(bb, messages);
+        byte[] written = new byte[bb.readableBytes()];
+        bb.readBytes(written);
+        assertThat(written, equalTo(expected));
+    }
+}
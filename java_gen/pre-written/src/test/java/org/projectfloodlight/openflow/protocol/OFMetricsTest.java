@@ -0,0 +1,37 @@
+package org.projectfloodlight.openflow.protocol;
+
+import static org.hamcrest.CoreMatchers.equalTo;
+import static org.junit.Assert.assertThat;
+
+import org.junit.Test;
+import org.projectfloodlight.openflow.exceptions.OFParseError;
+
+public class OFMetricsTest {
+
+    @Test
+    public void testCollector() {
+        OFMetrics.Collector collector = new OFMetrics.Collector();
+        collector.parsed(String.class, 8, 0);
+        collector.parsed(String.class, 16, 1000);
+        collector.serialized(String.class, 32);
+        collector.parseError(Integer.class, new OFParseError("test"));
+
+        OFMetrics.ClassStats stats = collector.getStats().get(String.class);
+        assertThat(stats.getParsed(), equalTo(2L));
+        assertThat(stats.getParsedBytes(), equalTo(24L));
+        assertThat(stats.getSerialized(), equalTo(1L));
+        assertThat(stats.getSerializedBytes(), equalTo(32L));
+        assertThat(stats.getErrors(), equalTo(0L));
+        assertThat(stats.getParseTimeBucket(0), equalTo(1L));
+        // 1000ns is in [512, 1024)
+        assertThat(stats.getParseTimeBucket(10), equalTo(1L));
+
+        assertThat(collector.getStats().get(Integer.class).getErrors(), equalTo(1L));
+    }
+
+    @Test
+    public void testHistogramBucketsAreCapped() {
+        assertThat(OFMetrics.ClassStats.bucket(Long.MAX_VALUE),
+                equalTo(OFMetrics.ClassStats.HISTOGRAM_BUCKETS - 1));
+    }
+}
@@ -0,0 +1,86 @@
+package org.projectfloodlight.openflow.protocol;
+
+import static org.hamcrest.CoreMatchers.equalTo;
+import static org.junit.Assert.assertThat;
+import static org.junit.Assert.assertTrue;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Set;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+import org.junit.Test;
+
+import com.google.common.collect.Sets;
+
+public class XidGeneratorsTest {
+
+    @Test
+    public void testStripedUniqueAcrossThreads() throws Exception {
+        final XidGenerator generator = XidGenerators.createStriped(64);
+        final int threads = 8;
+        final int perThread = 10000;
+        final Set<Long> xids = Sets.newSetFromMap(new ConcurrentHashMap<Long, Boolean>());
+        final CountDownLatch start = new CountDownLatch(1);
+        ExecutorService executor = Executors.newFixedThreadPool(threads);
+        try {
+            List<Future<Boolean>> workers = new ArrayList<Future<Boolean>>();
+            for(int t=0; t < threads; t++) {
+                workers.add(executor.submit(new Callable<Boolean>() {
+                    /** @return whether the xids were increasing in this thread */
+                    @Override
+                    public Boolean call() throws InterruptedException {
+                        start.await();
+                        boolean increasing = true;
+                        long last = 0;
+                        for(int i=0; i < perThread; i++) {
+                            long xid = generator.nextXid();
+                            if(xid <= last)
+                                increasing = false;
+                            last = xid;
+                            xids.add(xid);
+                        }
+                        return increasing;
+                    }
+                }));
+            }
+            start.countDown();
+            // assert on this thread: a failure in a worker would not fail the test
+            for(Future<Boolean> worker: workers)
+                assertTrue("xids not increasing per thread", worker.get());
+        } finally {
+            executor.shutdownNow();
+        }
+        assertThat(xids.size(), equalTo(threads * perThread));
+    }
+
+    @Test
+    public void testStripedWrapAround() {
+        long blocks = (StripedXidGenerator.MAX_XID + 1) / 4;
+        XidGenerator generator = new StripedXidGenerator(4, blocks - 1);
+        assertThat(generator.nextXid(), equalTo(0xFFFFFFFCL));
+        assertThat(generator.nextXid(), equalTo(0xFFFFFFFDL));
+        assertThat(generator.nextXid(), equalTo(0xFFFFFFFEL));
+        assertThat(generator.nextXid(), equalTo(0xFFFFFFFFL));
+        // xid 0 is skipped after the wraparound
+        assertThat(generator.nextXid(), equalTo(1L));
+        assertThat(generator.nextXid(), equalTo(2L));
+    }
+
+    @Test(expected = IllegalArgumentException.class)
+    public void testStripedInvalidBlockSize() {
+        XidGenerators.createStriped(1000);
+    }
+
+    @Test
+    public void testStandardSequential() {
+        XidGenerator generator = XidGenerators.create();
+        assertThat(generator.nextXid(), equalTo(1L));
+        assertThat(generator.nextXid(), equalTo(2L));
+    }
+}
@@ -0,0 +1,101 @@
+package org.projectfloodlight.openflow.types;
+
+import static org.hamcrest.CoreMatchers.equalTo;
+import static org.hamcrest.CoreMatchers.not;
+import static org.hamcrest.CoreMatchers.sameInstance;
+import static org.junit.Assert.assertThat;
+
+import org.jboss.netty.buffer.ChannelBuffer;
+import org.jboss.netty.buffer.ChannelBuffers;
+import org.junit.Test;
+
+/** Checks that the factory methods of small-domain value types return interned instances */
+public class InterningTest {
+    @Test
+    public void testTableId() {
+        assertThat(TableId.of(17), sameInstance(TableId.of(17)));
+        assertThat(TableId.of(0xFF), sameInstance(TableId.ALL));
+        assertThat(TableId.of(17).getValue(), equalTo((short) 17));
+    }
+
+    @Test
+    public void testU8() {
+        assertThat(U8.of((short) 200), sameInstance(U8.of((short) 200)));
+        assertThat(U8.ofRaw((byte) 200), sameInstance(U8.of((short) 200)));
+        assertThat(U8.of((short) 200).getValue(), equalTo((short) 200));
+    }
+
+    @Test
+    public void testIpProtocol() {
+        assertThat(IpProtocol.of((short) 0xFD), sameInstance(IpProtocol.of((short) 0xFD)));
+        assertThat(IpProtocol.of((short) 6), sameInstance(IpProtocol.TCP));
+    }
+
+    @Test
+    public void testVlanVid() {
+        assertThat(VlanVid.ofVlan(42), sameInstance(VlanVid.ofVlan(42)));
+        assertThat(OFVlanVidMatch.ofVlan(42), sameInstance(OFVlanVidMatch.ofVlan(42)));
+        assertThat(OFVlanVidMatch.ofRawVid((short) 0), sameInstance(OFVlanVidMatch.UNTAGGED));
+        assertThat(OFVlanVidMatch.ofRawVid((short) 0x1000), sameInstance(OFVlanVidMatch.PRESENT));
+    }
+
+    @Test
+    public void testBoundedCaches() {
+        assertThat(U16.of(4000), sameInstance(U16.of(4000)));
+        assertThat(EthType.of(0x1234), sameInstance(EthType.of(0x1234)));
+        assertThat(OFPort.of(4000), sameInstance(OFPort.of(4000)));
+        assertThat(OFPort.ofShort((short) 4000), sameInstance(OFPort.of(4000)));
+
+        // colliding values evict each other, but never alias
+        U16 a = U16.of(0x0401);
+        U16 b = U16.of(0x0801);
+        assertThat(a, not(equalTo(b)));
+        assertThat(U16.of(0x0401).getValue(), equalTo(0x0401));
+        assertThat(OFPort.of(0x10001).getPortNumber(), equalTo(0x10001));
+        assertThat(OFPort.of(1).getPortNumber(), equalTo(1));
+    }
+
+    @Test
+    public void testValueCache() {
+        ValueCache<Integer> cache = new ValueCache<Integer>(4) {
+            @Override
+            protected Integer create(int key) {
+                return new Integer(key);
+            }
+
+            @Override
+            protected int keyOf(Integer value) {
+                return value;
+            }
+        };
+        Integer one = cache.get(1);
+        assertThat(cache.get(1), sameInstance(one));
+        // 5 takes the slot of 1
+        assertThat(cache.get(5), equalTo(5));
+        assertThat(cache.get(1), not(sameInstance(one)));
+        assertThat(cache.get(-3), equalTo(-3));
+    }
+
+    @Test(expected = IllegalArgumentException.class)
+    public void testValueCacheSize() {
+        new ValueCache<Integer>(3) {
+            @Override
+            protected Integer create(int key) {
+                return key;
+            }
+
+            @Override
+            protected int keyOf(Integer value) {
+                return value;
+            }
+        };
+    }
+
+    @Test
+    public void testReadersIntern() throws Exception {
+        ChannelBuffer bb = ChannelBuffers.wrappedBuffer(new byte[] { 0x12, 0x34, 0x12, 0x34 });
+        assertThat(EthType.read2Bytes(bb), sameInstance(EthType.read2Bytes(bb)));
+        bb = ChannelBuffers.wrappedBuffer(new byte[] { 0x0F, (byte) 0xA0, 0x0F, (byte) 0xA0 });
+        assertThat(OFPort.read2Bytes(bb), sameInstance(OFPort.read2Bytes(bb)));
+    }
+}
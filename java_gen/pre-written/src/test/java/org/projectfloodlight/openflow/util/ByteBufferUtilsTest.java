@@ -0,0 +1,78 @@
+package org.projectfloodlight.openflow.util;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertNull;
+import static org.junit.Assert.fail;
+
+import java.nio.BufferOverflowException;
+import java.nio.ByteBuffer;
+
+import org.junit.Before;
+import org.junit.Test;
+import org.projectfloodlight.openflow.protocol.OFEchoRequest;
+import org.projectfloodlight.openflow.protocol.OFFactories;
+import org.projectfloodlight.openflow.protocol.OFFactory;
+import org.projectfloodlight.openflow.protocol.OFMessage;
+import org.projectfloodlight.openflow.protocol.OFVersion;
+
+public class ByteBufferUtilsTest {
+    private OFFactory factory;
+    private OFEchoRequest echo;
+
+    @Before
+    public void setup() {
+        factory = OFFactories.getFactory(OFVersion.OF_13);
+        echo = factory.buildEchoRequest().setXid(0x1234).setData(new byte[] { 1, 2, 3 }).build();
+    }
+
+    private void roundTrip(ByteBuffer buffer) throws Exception {
+        buffer.position(5);
+        ByteBufferUtils.writeTo(echo, buffer);
+        ByteBufferUtils.writeTo(echo, buffer);
+        assertEquals(5 + 2 * echo.getLength(), buffer.position());
+
+        buffer.flip();
+        buffer.position(5);
+        OFMessage first = ByteBufferUtils.readFrom(factory.getReader(), buffer);
+        OFMessage second = ByteBufferUtils.readFrom(factory.getLazyReader(), buffer);
+        assertEquals(echo, first);
+        assertEquals(echo.getXid(), second.getXid());
+        // lazily and eagerly read messages are interchangeable
+        assertEquals(echo, second);
+        assertEquals(second, echo);
+        assertEquals(echo.hashCode(), second.hashCode());
+        assertEquals(0, buffer.remaining());
+    }
+
+    @Test
+    public void testHeapRoundTrip() throws Exception {
+        roundTrip(ByteBuffer.allocate(64));
+    }
+
+    @Test
+    public void testDirectRoundTrip() throws Exception {
+        roundTrip(ByteBuffer.allocateDirect(64));
+    }
+
+    @Test
+    public void testIncomplete() throws Exception {
+        ByteBuffer buffer = ByteBuffer.allocateDirect(64);
+        ByteBufferUtils.writeTo(echo, buffer);
+        buffer.flip();
+        buffer.limit(echo.getLength() - 1);
+        assertNull(ByteBufferUtils.readFrom(factory.getReader(), buffer));
+        assertEquals(0, buffer.position());
+    }
+
+    @Test
+    public void testOverflow() {
+        ByteBuffer buffer = ByteBuffer.allocateDirect(echo.getLength() - 1);
+        try {
+            ByteBufferUtils.writeTo(echo, buffer);
+            fail("Expected BufferOverflowException");
+        } catch (BufferOverflowException e) {
+            // expected
+        }
+        assertEquals(0, buffer.position());
+    }
+}
@@ -0,0 +1,31 @@
+package org.projectfloodlight.openflow.util;
+
+import static org.hamcrest.CoreMatchers.equalTo;
+import static org.hamcrest.CoreMatchers.not;
+import static org.junit.Assert.assertThat;
+
+import java.util.HashSet;
+import java.util.Set;
+
+import org.junit.Test;
+
+public class HashUtilsTest {
+
+    @Test
+    public void testMixIsDeterministic() {
+        assertThat(HashUtils.mix(0x12345678), equalTo(HashUtils.mix(0x12345678)));
+        assertThat(HashUtils.mix(0), equalTo(0));
+    }
+
+    @Test
+    public void testMixSpreadsLowBits() {
+        // polynomial hash codes that differ by one in the last field
+        // must not collide in the low bits HashMap uses for bucket selection
+        Set<Integer> buckets = new HashSet<Integer>();
+        for(int i=0; i < 256; i++) {
+            buckets.add(HashUtils.mix(31 * 1000 + i) & 0xFF);
+        }
+        assertThat(buckets.size() > 128, equalTo(true));
+        assertThat(HashUtils.mix(1), not(equalTo(HashUtils.mix(2))));
+    }
+}
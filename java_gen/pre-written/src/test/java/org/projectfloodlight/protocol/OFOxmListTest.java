@@ -1,8 +1,11 @@
 package org.projectfloodlight.protocol;
 
+import static org.junit.Assert.assertEquals;
 import static org.junit.Assert.assertFalse;
 import static org.junit.Assert.assertThat;
 
+import java.util.Iterator;
+
 import org.hamcrest.CoreMatchers;
 import org.junit.Before;
 import org.junit.Test;
@@ -10,10 +13,14 @@ import org.projectfloodlight.openflow.protocol.OFFactories;
 import org.projectfloodlight.openflow.protocol.OFOxmList;
 import org.projectfloodlight.openflow.protocol.OFVersion;
 import org.projectfloodlight.openflow.protocol.match.MatchField;
+import org.projectfloodlight.openflow.protocol.oxm.OFOxm;
 import org.projectfloodlight.openflow.protocol.oxm.OFOxmIpv6DstMasked;
 import org.projectfloodlight.openflow.protocol.oxm.OFOxmIpv6SrcMasked;
 import org.projectfloodlight.openflow.protocol.oxm.OFOxms;
+import org.projectfloodlight.openflow.types.EthType;
 import org.projectfloodlight.openflow.types.IPv6AddressWithMask;
+import org.projectfloodlight.openflow.types.IpProtocol;
+import org.projectfloodlight.openflow.types.OFPort;
 
 public class OFOxmListTest {
     private OFOxms oxms;
@@ -38,4 +45,42 @@ public class OFOxmListTest {
         assertThat(list.get(MatchField.IPV6_DST), CoreMatchers.nullValue());
         assertFalse(list.get(MatchField.IPV6_SRC).isMasked());
     }
+
+    @Test
+    public void testGetAndOrder() {
+        // added out of spec order
+        OFOxmList list = OFOxmList.of(oxms.ipProto(IpProtocol.TCP),
+                oxms.inPort(OFPort.of(1)),
+                oxms.ethType(EthType.IPv4));
+
+        assertEquals(OFPort.of(1), list.get(MatchField.IN_PORT).getValue());
+        assertEquals(EthType.IPv4, list.get(MatchField.ETH_TYPE).getValue());
+        assertEquals(IpProtocol.TCP, list.get(MatchField.IP_PROTO).getValue());
+        assertThat(list.get(MatchField.ETH_DST), CoreMatchers.nullValue());
+        assertThat(list.get(MatchField.BSN_VLAN_XLATE_PORT_GROUP_ID), CoreMatchers.nullValue());
+
+        // iteration is in MatchFields order
+        Iterator<OFOxm<?>> it = list.iterator();
+        assertEquals(MatchField.IN_PORT, it.next().getMatchField());
+        assertEquals(MatchField.ETH_TYPE, it.next().getMatchField());
+        assertEquals(MatchField.IP_PROTO, it.next().getMatchField());
+        assertFalse(it.hasNext());
+    }
+
+    @Test
+    public void testBuilderRoundTrip() {
+        OFOxmList list = OFOxmList.of(oxms.inPort(OFPort.of(1)), oxms.ethType(EthType.IPv4));
+
+        OFOxmList.Builder builder = list.createBuilder();
+        builder.unset(MatchField.IN_PORT);
+        OFOxmList changed = builder.build();
+        assertThat(changed.get(MatchField.IN_PORT), CoreMatchers.nullValue());
+        assertEquals(EthType.IPv4, changed.get(MatchField.ETH_TYPE).getValue());
+        // the original list is unchanged
+        assertEquals(OFPort.of(1), list.get(MatchField.IN_PORT).getValue());
+
+        assertEquals(list, list.createBuilder().build());
+        assertEquals(list.hashCode(), list.createBuilder().build().hashCode());
+        assertEquals(OFOxmList.EMPTY, new OFOxmList.Builder().build());
+    }
 }
@@ -15,10 +15,7 @@
 //::    if version_prop.is_fixed_value:
         return ${version_prop.enum_value};
 //::    elif version_prop.is_length_value:
-        // FIXME: Hacky and inperformant way to determine a message length. Should be replaced with something better
-        ChannelBuffer c = new LengthCountingPseudoChannelBuffer();
-        WRITER.write(c, ${ "this" if not builder else "({0}) this.getMessage()".format(msg.name) });
-        return c.writerIndex();
+        return ${ "getLength()" if not builder else "build().getLength()" };
 //::    else:
         return ${version_prop.name};
 //::    #endif
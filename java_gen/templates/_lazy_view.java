@@ -0,0 +1,251 @@
+//:: import os
+//:: length_prop = [ prop for prop in msg.members if prop.is_length_value ]
+//:: if not length_prop:
+//::     raise Exception("Message class %s has no length member - cannot generate lazy view" % msg.name)
+//:: #endif
+//:: length_prop = length_prop[0]
+//:: field_length_fields = set(prop.member.field_name for prop in msg.members if prop.is_field_length_value)
+//:: trailing_member = msg.ir_model_members[-1]
+//:: # wire offsets of the members that can be decoded straight from the wire slice:
+//:: # fixed length members at a fixed offset, and the last member of the message (its
+//:: # length is the remaining length; its offset is found on first use if it follows
+//:: # variable length members)
+//:: member_offsets = dict((prop.name, str(prop.member.offset)) for prop in msg.data_members
+//::                       if prop.member.offset is not None and prop.member.is_fixed_length)
+//:: trailing_is_direct = trailing_member.is_data and not msg.align and trailing_member.c_name not in field_length_fields
+//:: if trailing_is_direct:
+//::     member_offsets[trailing_member.name] = str(trailing_member.member.offset) if trailing_member.member.offset is not None else "trailingOffset()"
+//:: #endif
+//:: payload_member = trailing_member if trailing_is_direct and trailing_member.member.oftype == "of_octets_t" else None
+    final static LazyReader LAZY_READER = new LazyReader();
+    static class LazyReader implements OFMessageReader<${msg.interface.name}> {
+        @Override
+        public ${msg.interface.name} readFrom(ChannelBuffer bb) throws OFParseError {
+//:: if msg.is_fixed_length:
+            if(bb.readableBytes() < LENGTH)
+//:: else:
+            if(bb.readableBytes() < MINIMUM_LENGTH)
+//:: #endif
+                return null;
+            int start = bb.readerIndex();
+//:: for prop in msg.members:
+//::     if prop.is_virtual or prop.member.offset is None or not (prop.is_length_value or prop.is_fixed_value):
+//::         continue
+//::     #endif
+            bb.readerIndex(start + ${prop.member.offset});
+//::     if prop.is_length_value:
+            ${prop.java_type.public_type} ${prop.name} = ${prop.java_type.read_op(version, pub_type=True)};
+            //:: if prop.is_fixed_value:
+            if(${prop.name} != ${prop.value})
+                throw new OFParseError("Wrong ${prop.name}: Expected=${prop.enum_value}(${prop.value}), got="+${prop.name});
+            //:: else:
+            if(${prop.name} < MINIMUM_LENGTH)
+                throw new OFParseError("Wrong ${prop.name}: Expected to be >= " + MINIMUM_LENGTH + ", was: " + ${prop.name});
+            //:: #endif
+//::     else:
+            // fixed value property ${prop.name} == ${prop.value}
+            ${prop.java_type.priv_type} ${prop.name} = ${prop.java_type.read_op(version, pub_type=False)};
+            if(${prop.name} != ${prop.priv_value})
+                throw new OFParseError("Wrong ${prop.name}: Expected=${prop.enum_value}(${prop.value}), got="+${prop.name});
+//::     #endif
+//:: #endfor
+            if(bb.readableBytes() + (bb.readerIndex() - start) < ${length_prop.name}) {
+                // Buffer does not have all data yet
+                bb.readerIndex(start);
+                return null;
+            }
+            ChannelBuffer wire = bb.slice(start, ${length_prop.name});
+            bb.readerIndex(start + ${length_prop.name});
+            return new LazyView(wire);
+        }
+    }
+
+    /** View of a ${msg.interface.name} that decodes its fields from the wire on access */
+    static class LazyView implements ${msg.interface.inherited_declaration()}, OFLazyMessage {
+        private final ChannelBuffer wire;
+        private volatile ${impl_class} decoded;
+
+        LazyView(ChannelBuffer wire) {
+            this.wire = wire;
+        }
+
+        private ${impl_class} decode() {
+            ${impl_class} message = decoded;
+            if(message == null) {
+                try {
+                    message = (${impl_class}) READER.readFrom(wire.duplicate());
+                } catch (OFParseError e) {
+                    throw new IllegalStateException("Error decoding ${msg.name}: " + e.getMessage(), e);
+                }
+                decoded = message;
+            }
+            return message;
+        }
+
+//:: if trailing_is_direct and trailing_member.member.offset is None:
+        // offset of ${trailing_member.name}, found on first use by skipping the members before it
+        private int trailingOffset = -1;
+
+        private int trailingOffset() throws OFParseError {
+            int offset = trailingOffset;
+            if(offset < 0) {
+                ChannelBuffer bb = wire.duplicate();
+                int start = bb.readerIndex();
+//::    # pos: wire offset bb has been advanced to, while it is still known statically
+//::    pos = 0
+//::    skip_to = 0
+//::    for prop in msg.members:
+//::        if prop is trailing_member:
+//::            break
+//::        elif prop.is_virtual:
+//::            continue
+//::        elif prop.member.offset is not None and prop.member.is_fixed_length and not prop.is_field_length_value:
+//::            skip_to = prop.member.offset + prop.member.base_length
+//::            continue
+//::        #endif
+//::        if pos is not None and skip_to > pos:
+                bb.skipBytes(${skip_to - pos});
+//::            pos = skip_to
+//::        #endif
+//::        if prop.is_field_length_value:
+                ${prop.java_type.public_type} ${prop.name} = ${prop.java_type.read_op(version, pub_type=True)};
+//::        elif prop.c_name in field_length_fields:
+                bb.skipBytes(${ [ m.name for m in msg.members if m.is_field_length_value and m.member.field_name == prop.c_name ][0] });
+//::        elif prop.is_pad:
+                bb.skipBytes(${prop.length});
+//::        elif prop.member.is_fixed_length:
+                bb.skipBytes(${prop.member.base_length});
+//::        else:
+                ${prop.java_type.skip_op(version)};
+//::        #endif
+//::        if pos is not None and prop.member.offset is not None and prop.member.is_fixed_length:
+//::            pos = skip_to = prop.member.offset + prop.member.base_length
+//::        else:
+//::            pos = None
+//::        #endif
+//::    #endfor
+//::    if pos is not None and skip_to > pos:
+                bb.skipBytes(${skip_to - pos});
+//::    #endif
+                offset = bb.readerIndex() - start;
+                trailingOffset = offset;
+            }
+            return offset;
+        }
+
+//:: #endif
+//:: for prop in msg.interface.members:
+//::    if hasattr(prop, "custom_template") and prop.custom_template != None:
+//::        custom_getter = True
+//::    else:
+//::        custom_getter = os.path.exists("%s/custom/%s_%s.java" % (template_dir, msg.name, prop.getter_name))
+//::    #endif
+//::    version_prop = msg.member_by_name(prop.name) if prop in msg.members else None
+//::    # the readers of object types and trailingOffset() may throw OFParseError, those of
+//::    # primitives never do
+//::    checked_read = not custom_getter and version_prop is not None and not version_prop.is_fixed_value \
+//::                   and version_prop.name in member_offsets \
+//::                   and (not version_prop.java_type.is_primitive or member_offsets[version_prop.name] == "trailingOffset()")
+//::    if checked_read:
+//::        read_method = "read" + prop.name[0].upper() + prop.name[1:]
+        private ${prop.java_type.public_type} ${read_method}() throws OFParseError {
+            ChannelBuffer bb = wire.duplicate();
+            bb.readerIndex(${member_offsets[version_prop.name]});
+            return ${version_prop.java_type.read_op(version, pub_type=True, length="bb.readableBytes()")};
+        }
+
+//::    #endif
+        @Override
+        public ${prop.java_type.public_type} ${prop.getter_name}()${ "" if prop in msg.members else " throws UnsupportedOperationException"} {
+//:: if custom_getter:
+            return decode().${prop.getter_name}();
+//:: elif checked_read:
+            try {
+                return ${read_method}();
+            } catch (OFParseError e) {
+                throw new IllegalStateException("Error decoding ${msg.name}.${prop.name}: " + e.getMessage(), e);
+            }
+//:: elif prop in msg.members:
+//::    if version_prop.is_fixed_value:
+            return ${version_prop.enum_value};
+//::    elif version_prop.name in member_offsets:
+            ChannelBuffer bb = wire.duplicate();
+            bb.readerIndex(${member_offsets[version_prop.name]});
+            return ${version_prop.java_type.read_op(version, pub_type=True, length="bb.readableBytes()")};
+//::    else:
+            return decode().${prop.getter_name}();
+//::    #endif
+//:: else:
+            throw new UnsupportedOperationException("Property ${prop.name} not supported in version #{version}");
+//:: #endif
+        }
+
+//:: #endfor
+        @Override
+        public ChannelBuffer getWireBuffer() {
+            return wire.duplicate();
+        }
+
+        @Override
+        public ChannelBuffer getPayloadBuffer() {
+//:: if payload_member and member_offsets[payload_member.name] == "trailingOffset()":
+            int offset;
+            try {
+                offset = trailingOffset();
+            } catch (OFParseError e) {
+                throw new IllegalStateException("Error decoding ${msg.name}: " + e.getMessage(), e);
+            }
+            return wire.slice(offset, wire.readableBytes() - offset);
+//:: elif payload_member:
+            int offset = ${member_offsets[payload_member.name]};
+            return wire.slice(offset, wire.readableBytes() - offset);
+//:: else:
+            return null;
+//:: #endif
+        }
+
+        @Override
+        public ${msg.interface.name}.Builder createBuilder() {
+            return decode().createBuilder();
+        }
+
+        @Override
+        public void writeTo(ChannelBuffer bb) {
+            bb.writeBytes(wire, wire.readerIndex(), wire.readableBytes());
+        }
+
+        @Override
+        public int getLength() {
+            return wire.readableBytes();
+        }
+
+        @Override
+        public void putTo(PrimitiveSink sink) {
+            decode().putTo(sink);
+        }
+
+        @Override
+        public String toString() {
+            return decode().toString();
+        }
+
+        @Override
+        public boolean equals(Object obj) {
+            if (this == obj)
+                return true;
+            if (obj instanceof LazyView) {
+                LazyView other = (LazyView) obj;
+                // identical wire bytes always decode to equal messages
+                if (wire.equals(other.wire))
+                    return true;
+                return decode().equals(other.decode());
+            }
+            // equal to the eagerly read message with the same content
+            return decode().equals(obj);
+        }
+
+        @Override
+        public int hashCode() {
+            return decode().hashCode();
+        }
+    }
@@ -0,0 +1,137 @@
+//:: # Copyright 2013, Big Switch Networks, Inc.
+//:: #
+//:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+//:: # the following special exception:
+//:: #
+//:: # LOXI Exception
+//:: #
+//:: # As a special exception to the terms of the EPL, you may distribute libraries
+//:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+//:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+//:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+//:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+//:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+//:: #
+//:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+//:: #
+//:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+//:: # a copy of the EPL at:
+//:: #
+//:: # http::: #www.eclipse.org/legal/epl-v10.html
+//:: #
+//:: # Unless required by applicable law or agreed to in writing, software
+//:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+//:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+//:: # EPL for the specific language governing permissions and limitations
+//:: # under the EPL.
+//::
+//:: from loxi_ir import *
+//:: import java_gen.java_model as java_model
+//:: include('_copyright.java')
+
+//:: include('_autogen.java')
+
+package ${test.package};
+
+//:: include("_imports.java", msg=msg)
+import java.util.concurrent.TimeUnit;
+
+import org.openjdk.jmh.annotations.Benchmark;
+import org.openjdk.jmh.annotations.BenchmarkMode;
+import org.openjdk.jmh.annotations.Mode;
+import org.openjdk.jmh.annotations.OutputTimeUnit;
+import org.openjdk.jmh.annotations.Param;
+import org.openjdk.jmh.annotations.Scope;
+import org.openjdk.jmh.annotations.Setup;
+import org.openjdk.jmh.annotations.State;
+
+/** JMH throughput benchmarks for ${msg.name}, built from the ${test.data_file_name} test vector */
+@State(Scope.Thread)
+@BenchmarkMode(Mode.Throughput)
+@OutputTimeUnit(TimeUnit.MICROSECONDS)
+public class ${test.bench_name} {
+    //:: factory = java_model.model.factory_of(test.interface)
+    //:: var_type = msg.interface.name
+    //:: var_name = msg.interface.variable_name
+    //:: use_builder = len(msg.data_members) > 0
+    //:: factory_method = factory.method_name(msg.interface, builder=use_builder)
+    //:: factory_impl = java_model.model.factory_of(test.interface).of_version(test.java_class.version).name
+    /** the input and its class, reported with the JMH results */
+    @Param("${test.data_file_name}")
+    String corpus;
+
+    @Param("${msg.c_name}")
+    String ofClass;
+
+    ${factory.name if factory.name is not None else "OFFactory"} factory;
+
+    final static byte[] ${msg.constant_name}_SERIALIZED =
+        new byte[] { ${", ".join("%s0x%x" % (("" if ord(c)<128 else "(byte) "),  ord(c)) for c in test_data["binary"] ) } };
+
+    ChannelBuffer input;
+    ChannelBuffer output;
+    ${var_type} ${var_name};
+    ${var_type} ${var_name}Copy;
+
+    @Setup
+    public void setup() throws Exception {
+        factory = ${factory_impl + ".INSTANCE" if factory_impl is not None else "OFFactories.getFactory(OFVersion." + version.constant_version + ")"};
+        input = ChannelBuffers.copiedBuffer(${msg.constant_name}_SERIALIZED);
+        output = ChannelBuffers.buffer(${msg.constant_name}_SERIALIZED.length);
+        ${var_name} = ${msg.name}.READER.readFrom(ChannelBuffers.copiedBuffer(${msg.constant_name}_SERIALIZED));
+        // a separately parsed instance, so equals() compares field by field
+        ${var_name}Copy = ${msg.name}.READER.readFrom(ChannelBuffers.copiedBuffer(${msg.constant_name}_SERIALIZED));
+    }
+
+    @Benchmark
+    public ${var_type} read() throws Exception {
+        input.readerIndex(0);
+        return ${msg.name}.READER.readFrom(input);
+    }
+
+    @Benchmark
+    public ChannelBuffer write() {
+        output.clear();
+        ${var_name}.writeTo(output);
+        return output;
+    }
+
+    /** getLength() is cached per instance; measure it on a freshly parsed message */
+    @Benchmark
+    public int readGetLength() throws Exception {
+        input.readerIndex(0);
+        return ${msg.name}.READER.readFrom(input).getLength();
+    }
+
+    /** hashCode() is cached per instance; measure it on a freshly parsed message */
+    @Benchmark
+    public int readHashCode() throws Exception {
+        input.readerIndex(0);
+        return ${msg.name}.READER.readFrom(input).hashCode();
+    }
+
+    @Benchmark
+    public boolean equalsCopy() {
+        return ${var_name}.equals(${var_name}Copy);
+    }
+
+    //:: if "java" in test_data:
+    @Benchmark
+    public ${var_type} build() {
+        //:: if use_builder:
+        ${var_type}.Builder builder = factory.${factory_method}();
+        ${test_data["java"]};
+        return builder.build();
+        //:: else:
+        return factory.${factory_method}();
+        //:: #endif
+    }
+    //:: #endif
+
+    //:: if use_builder:
+    @Benchmark
+    public ${var_type} rebuild() {
+        return ${var_name}.createBuilder().build();
+    }
+    //:: #endif
+}
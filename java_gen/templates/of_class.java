@@ -191,6 +191,25 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
     static class Reader implements OFMessageReader<${msg.interface.name}> {
         @Override
         public ${msg.interface.name} readFrom(ChannelBuffer bb) throws OFParseError {
+//:: if genopts.metrics:
+            OFMetricsListener metrics = OFMetrics.getListener();
+            if(metrics == null)
+                return readFields(bb);
+            int readerIndex = bb.readerIndex();
+            long startTime = System.nanoTime();
+            try {
+                ${msg.interface.name} read = readFields(bb);
+                if(read != null)
+                    metrics.parsed(${impl_class}.class, bb.readerIndex() - readerIndex, System.nanoTime() - startTime);
+                return read;
+            } catch (OFParseError e) {
+                metrics.parseError(${impl_class}.class, e);
+                throw e;
+            }
+        }
+
+        private ${msg.interface.name} readFields(ChannelBuffer bb) throws OFParseError {
+//:: #endif
 //:: for prop in msg.members:
 //:: if not prop.is_virtual and (prop.is_length_value or prop.is_field_length_value):
             int start = bb.readerIndex();
@@ -270,6 +289,10 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
         }
     }
 
+    //:: if msg.is_message:
+    //:: include("_lazy_view.java", msg=msg)
+
+    //:: #endif
     public void putTo(PrimitiveSink sink) {
         FUNNEL.funnel(this, sink);
     }
@@ -301,10 +324,52 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
         WRITER.write(bb, this);
     }
 
+//:: if msg.is_fixed_length:
+    @Override
+    public int getLength() {
+        return LENGTH;
+    }
+//:: else:
+    // wire length, computed on first use from the variable length members
+    private int cachedLength = -1;
+
+    @Override
+    public int getLength() {
+        int length = cachedLength;
+        if(length < 0) {
+            length = MINIMUM_LENGTH;
+//:: for prop in msg.data_members:
+//::     if not prop.member.is_fixed_length:
+            length += ${prop.java_type.length_op(version, prop.name, pub_type=True)}${" - %d" % prop.member.base_length if prop.member.base_length else ""};
+//::     #endif
+//:: #endfor
+//:: if msg.align:
+            // align message to ${msg.align} bytes
+            length = ((length + ${msg.align-1})/${msg.align} * ${msg.align});
+//:: #endif
+            cachedLength = length;
+        }
+        return length;
+    }
+//:: #endif
+
     final static Writer WRITER = new Writer();
     static class Writer implements OFMessageWriter<${impl_class}> {
         @Override
         public void write(ChannelBuffer bb, ${impl_class} message) {
+//:: if genopts.metrics:
+            OFMetricsListener metrics = OFMetrics.getListener();
+            if(metrics == null) {
+                writeFields(bb, message);
+                return;
+            }
+            int writerIndex = bb.writerIndex();
+            writeFields(bb, message);
+            metrics.serialized(${impl_class}.class, bb.writerIndex() - writerIndex);
+        }
+
+        private void writeFields(ChannelBuffer bb, ${impl_class} message) {
+//:: #endif
 //:: if not msg.is_fixed_length:
             int startIndex = bb.writerIndex();
 //:: #endif
@@ -386,6 +451,10 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
             return true;
         if (obj == null)
             return false;
+        //:: if msg.is_message:
+        if (obj instanceof LazyView)
+            obj = ((LazyView) obj).decode();
+        //:: #endif
         if (getClass() != obj.getClass())
             return false;
         //:: if len(msg.data_members) > 0:
@@ -410,16 +479,24 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
         return true;
     }
 
+    //:: if len(msg.data_members) > 0:
+    // hash code, computed on first use (0: not yet computed)
+    private int cachedHashCode;
+
+    //:: #endif
     @Override
     public int hashCode() {
         //:: if len(msg.data_members) > 0:
+        int result = cachedHashCode;
+        if(result != 0)
+            return result;
+
         final int prime = 31;
-        //:: #endif
-        int result = 1;
+        result = 1;
 
         //:: for prop in msg.data_members:
         //:: if prop.java_type.pub_type == 'long':
-        result = prime *  (int) (${prop.name} ^ (${prop.name} >>> 32));
+        result = prime * result + (int) (${prop.name} ^ (${prop.name} >>> 32));
         //:: elif prop.java_type.pub_type == 'boolean':
         result = prime * result + (${prop.name} ? 1231 : 1237);
         //:: elif prop.java_type.is_primitive:
@@ -430,7 +507,12 @@ class ${impl_class} implements ${msg.interface.inherited_declaration()} {
         result = prime * result + ((${prop.name} == null) ? 0 : ${prop.name}.hashCode());
         //:: #endif
         //:: #endfor
+        result = HashUtils.mix(result);
+        cachedHashCode = result;
         return result;
+        //:: else:
+        return 1;
+        //:: #endif
     }
 
 }
@@ -104,6 +104,16 @@ public class ${factory.name} implements ${factory.interface.name} {
         throw new UnsupportedOperationException("Reader<${factory.base_class}> not supported in version ${factory.version}");
 //:: #endif
     }
+//:: if factory.interface.name == 'OFFactory':
+
+    public OFMessageReader<${factory.base_class}> getLazyReader() {
+//:: if factory.versioned_base_class:
+        return ${factory.versioned_base_class.name}.LAZY_READER;
+//:: else:
+        throw new UnsupportedOperationException("LazyReader<${factory.base_class}> not supported in version ${factory.version}");
+//:: #endif
+    }
+//:: #endif
 
 //:: if factory.interface.name == 'OFOxms':
     @SuppressWarnings("unchecked")
@@ -58,6 +58,10 @@ public interface ${factory.name}${" extends XidGenerator" if factory.xid_generat
 //:: #endif
 
     OFMessageReader<${factory.base_class}> getReader();
+//:: if factory.name == 'OFFactory':
+    /** @return a reader that returns {@link OFLazyMessage} views, which decode fields on access */
+    OFMessageReader<${factory.base_class}> getLazyReader();
+//:: #endif
     OFVersion getVersion();
 //:: if factory.name == 'OFOxms':
 
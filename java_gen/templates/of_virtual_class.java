@@ -46,9 +46,14 @@ abstract class ${msg.name} {
 //:: #endif
 
 
-    public final static ${msg.name}.Reader READER = new Reader();
+//:: readers = [ ("Reader", "READER") ]
+//:: if msg.is_message:
+//::     readers.append(("LazyReader", "LAZY_READER"))
+//:: #endif
+//:: for reader_class, reader_field in readers:
+    public final static ${msg.name}.${reader_class} ${reader_field} = new ${reader_class}();
 
-    static class Reader implements OFMessageReader<${msg.interface.inherited_declaration()}> {
+    static class ${reader_class} implements OFMessageReader<${msg.interface.inherited_declaration()}> {
         @Override
         public ${msg.interface.inherited_declaration()} readFrom(ChannelBuffer bb) throws OFParseError {
 //:: if msg.is_fixed_length:
@@ -93,7 +98,7 @@ abstract class ${msg.name} {
 //::           #endif
                case ${m.priv_value}:
                    // discriminator value ${m.enum_value}=${m.value} for class ${sub.name}
-                   return ${sub.name}.READER.readFrom(bb);
+                   return ${sub.name}.${reader_field}.readFrom(bb);
 //:: #endif    # generate_class
 //:: #endfor
                default:
@@ -104,4 +109,5 @@ abstract class ${msg.name} {
 //:: #endfor
         }
     }
+//:: #endfor
 }
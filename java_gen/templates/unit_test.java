@@ -114,6 +114,35 @@ public class ${test.name} {
        bb.readBytes(written);
 
        assertThat(written, CoreMatchers.equalTo(${msg.constant_name}_SERIALIZED));
+       assertEquals(${msg.constant_name}_SERIALIZED.length, ${var_name}.getLength());
    }
 
+   //:: if msg.is_message:
+   @Test
+   public void testLazyReadWrite() throws Exception {
+       ChannelBuffer input = ChannelBuffers.copiedBuffer(${msg.constant_name}_SERIALIZED);
+       ${var_type} ${var_name}Lazy = ${msg.name}.LAZY_READER.readFrom(input);
+       assertEquals(${msg.constant_name}_SERIALIZED.length, input.readerIndex());
+       assertEquals(${msg.constant_name}_SERIALIZED.length, ${var_name}Lazy.getLength());
+
+       // the view must decode to the same message as the eager reader
+       ${var_type} ${var_name}Read = ${msg.name}.READER.readFrom(ChannelBuffers.copiedBuffer(${msg.constant_name}_SERIALIZED));
+       //:: for prop in msg.data_members:
+       //:: if prop.java_type.is_array:
+       assertArrayEquals(${var_name}Read.${prop.getter_name}(), ${var_name}Lazy.${prop.getter_name}());
+       //:: else:
+       assertEquals(${var_name}Read.${prop.getter_name}(), ${var_name}Lazy.${prop.getter_name}());
+       //:: #endif
+       //:: #endfor
+
+       // write message again
+       ChannelBuffer bb = ChannelBuffers.dynamicBuffer();
+       ${var_name}Lazy.writeTo(bb);
+       byte[] written = new byte[bb.readableBytes()];
+       bb.readBytes(written);
+
+       assertThat(written, CoreMatchers.equalTo(${msg.constant_name}_SERIALIZED));
+   }
+   //:: #endif
+
 }
@@ -39,6 +39,7 @@ import c_gen.c_code_gen as c_code_gen
 import c_gen.c_test_gen as c_test_gen
 import c_gen.c_dump_gen as c_dump_gen
 import c_gen.c_show_gen as c_show_gen
+import c_gen.c_bench_gen as c_bench_gen
 import c_gen.util
 import c_gen.codegen
 import c_gen.match
@@ -75,6 +76,7 @@ targets = {
     'loci/src/of_match.c': c_code_gen.match_c_gen,
     'loci/src/loci_obj_dump.c': c_dump_gen.gen_obj_dump_c,
     'loci/src/loci_obj_show.c': c_show_gen.gen_obj_show_c,
+    'loci/src/loci_obj_show_buf.c': c_show_gen.gen_obj_show_buf_c,
     'loci/src/loci_validator.c': static,
 
     # Static LOCI code
@@ -107,9 +109,19 @@ targets = {
     'locitest/src/test_list_limits.c': static,
     'locitest/src/test_match_utils.c': static,
     'locitest/src/test_utils.c': static,
+    'locitest/src/test_threads.c': static,
     'locitest/src/test_validator.c': static,
     'locitest/src/main.c': static,
     'locitest/Makefile': static,
+
+    # locibench code
+    'locibench/src/bench_classes.c': c_bench_gen.gen_bench_classes,
+    'locibench/src/bench_data.c': c_bench_gen.gen_bench_data,
+    'locibench/Makefile': c_bench_gen.gen_makefile,
+
+    # Static locibench code
+    'locibench/inc/locibench/locibench.h': static,
+    'locibench/src/locibench.c': static,
 }
 
 def generate(install_dir):
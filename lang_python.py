@@ -38,6 +38,7 @@ Target directory structure:
     pyloxi:
         loxi:
             __init__.py
+            aio.py              # asyncio connections
             of10:
                 __init__.py
                 action.py       # Action classes
@@ -99,6 +100,7 @@ targets = {
     prefix+'/__init__.py': static('toplevel_init.py'),
     prefix+'/pp.py': static('pp.py'),
     prefix+'/generic_util.py': static('generic_util.py'),
+    prefix+'/aio.py': static('aio.py'),
 }
 
 for version, subdir in versions.items():
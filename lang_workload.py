@@ -0,0 +1,48 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Synthetic workload backend for LOXI
+
+Generates reproducible, large OpenFlow message streams from the IR, to be
+used as benchmark inputs for the other backends. The size and the random
+seed are set with --workload-scale and --workload-seed.
+
+Target directory structure:
+    workload:
+        manifest.json           # workloads, versions, message counts
+        of10:
+            flow_stats_reply.bin    # concatenated messages
+            flow_stats_reply.pcap   # the same messages in a TCP capture
+            ...
+        of13: ...
+"""
+
+import workload_gen
+
+def generate(install_dir):
+    workload_gen.generate(install_dir)
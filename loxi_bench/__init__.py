@@ -0,0 +1,46 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Cross-backend benchmark harness
+
+Runs the parse and serialize loops of the generated C (locibench), Python
+(pyloxi) and Java (openflowj-bench, JMH) libraries over the same inputs and
+merges their results into one report:
+
+  - the test_data vectors, compiled into locibench and the generated JMH
+    benchmarks, and read directly for Python
+  - the synthetic workload files written by --lang=workload
+
+Each result is identified by backend, operation and corpus (the test_data
+file name or the workload file relative to the install directory) and
+records the messages and bytes processed per operation, so that the report
+can give msgs/sec and bytes/sec for every message class. LOCI doesn't decode
+messages up front, so locibench reports 'wrap' (wrapping the message buffer
+in an object) instead of 'parse', and has no serialize. See loxibench.py
+for the command line.
+"""
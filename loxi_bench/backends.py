@@ -0,0 +1,296 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Benchmark runners for each backend
+
+Each runner returns a list of Result. ns_per_op is the time of one
+operation, which processes 'messages' messages of 'bytes' bytes in total
+(one test_data vector, or all of a workload file). Allocations are counted
+where the backend can: malloc calls for C (allocs_per_op), bytes allocated
+on the heap for Java with the JMH gc profiler (alloc_bytes_per_op).
+"""
+
+from collections import namedtuple
+import compileall
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from loxi_bench import corpus
+import py_gen.codegen
+
+logger = logging.getLogger(__name__)
+
+class Result(namedtuple('Result', ['backend', 'op', 'corpus', 'cls', 'version',
+                                   'messages', 'bytes', 'ns_per_op',
+                                   'allocs_per_op', 'alloc_bytes_per_op'])):
+    @property
+    def msgs_per_sec(self):
+        return self.messages * 1e9 / self.ns_per_op
+
+    @property
+    def bytes_per_sec(self):
+        return self.bytes * 1e9 / self.ns_per_op
+
+def time_loop(loop, min_time):
+    """
+    Return the time per iteration of loop(iterations) in ns
+
+    Like locibench, the iteration count doubles until one run takes at
+    least min_time seconds.
+    """
+    iterations = 1
+    while True:
+        start = time.time()
+        loop(iterations)
+        elapsed = time.time() - start
+        if elapsed >= min_time or iterations >= (1 << 30):
+            break
+        iterations *= 2
+    return elapsed * 1e9 / iterations
+
+### Python
+
+# Map from pyloxi module to the name of its root class
+python_roots = { module: root for root, module in py_gen.codegen.roots.items() }
+
+def python_class_name(klass):
+    """ Return the LOXI class name of a generated Python class """
+    module = klass.__module__.rsplit('.', 1)[-1]
+    name = klass.__name__
+    if module in ('message', 'common') or name == module:
+        return 'of_' + name
+    return python_roots[module] + '_' + name
+
+def _python_vector(loxi, vector, min_time):
+    from loxi.generic_util import OFReader
+    ofp = loxi.protocol(vector.version)
+    code = compile(vector.python, vector.name, 'eval')
+    obj = eval(code, { 'ofp': ofp })
+    klass = type(obj)
+    binary = vector.binary
+
+    def parse(iterations):
+        for _ in xrange(iterations):
+            klass.unpack(OFReader(binary))
+
+    def serialize(iterations):
+        for _ in xrange(iterations):
+            obj.pack()
+
+    def build(iterations):
+        env = { 'ofp': ofp }
+        for _ in xrange(iterations):
+            eval(code, env)
+
+    return [ Result('python', op, vector.name, python_class_name(klass), vector.version,
+                    1, len(binary), time_loop(loop, min_time), None, None)
+             for op, loop in (('parse', parse), ('serialize', serialize), ('build', build)) ]
+
+def _python_workload(loxi, workload, min_time):
+    with open(workload.path, 'rb') as f:
+        messages = corpus.split_messages(f.read())
+    if not messages:
+        return []
+    parse_message = loxi.protocol(workload.version).message.parse_message
+    objs = [ parse_message(buf) for buf in messages ]
+
+    def parse(iterations):
+        for _ in xrange(iterations):
+            for buf in messages:
+                parse_message(buf)
+
+    def serialize(iterations):
+        for _ in xrange(iterations):
+            for obj in objs:
+                obj.pack()
+
+    return [ Result('python', op, workload.name, python_class_name(type(objs[0])),
+                    workload.version, len(messages), workload.bytes,
+                    time_loop(loop, min_time), None, None)
+             for op, loop in (('parse', parse), ('serialize', serialize)) ]
+
+_import_script = """
+import sys, time
+sys.path.insert(0, %r)
+start = time.time()
+import loxi.%s
+print (time.time() - start) * 1e9
+"""
+
+def _python_import(pyloxi_dir, module, version, min_time):
+    """
+    Time 'import loxi.<module>' in new interpreters, the best of as many
+    runs as fit in min_time and at least 3
+    """
+    script = _import_script % (pyloxi_dir, module)
+    times = []
+    start = time.time()
+    while len(times) < 3 or time.time() - start < min_time:
+        times.append(float(subprocess.check_output([sys.executable, '-c', script])))
+    return Result('python', 'import', 'loxi.' + module, 'loxi.' + module, version,
+                  1, 0, min(times), None, None)
+
+def run_python_import(pyloxi_dir, min_time, filter=None):
+    """
+    Benchmark the import time of each version of the generated Python library
+
+    The library is byte-compiled first, so that the results don't include
+    compiling it, like an installed package.
+    """
+    compileall.compile_dir(pyloxi_dir, quiet=1)
+    results = []
+    for module, version in sorted(corpus.version_dirs.items()):
+        if filter and filter not in 'loxi.' + module:
+            continue
+        if os.path.isdir(os.path.join(pyloxi_dir, 'loxi', module)):
+            logger.info("python: import loxi.%s", module)
+            results.append(_python_import(pyloxi_dir, module, version, min_time))
+    return results
+
+def run_python(pyloxi_dir, vectors, workloads, min_time):
+    """ Benchmark the generated Python library in pyloxi_dir, in this process """
+    sys.path.insert(0, pyloxi_dir)
+    import loxi
+
+    results = []
+    for vector in vectors:
+        if not vector.python:
+            continue
+        logger.info("python: %s", vector.name)
+        results.extend(_python_vector(loxi, vector, min_time))
+    for workload in workloads:
+        logger.info("python: %s", workload.name)
+        results.extend(_python_workload(loxi, workload, min_time))
+    return results
+
+### C
+
+def run_c(locibench, install_dir, workloads, min_time, filter=None):
+    """ Run locibench and convert its results """
+    fd, output = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        cmd = [ locibench, '-o', output, '-t', str(min_time) ]
+        if filter:
+            cmd += [ '-f', filter ]
+        for workload in workloads:
+            # run from install_dir so that the results are named by workload.name
+            cmd += [ '-w', workload.name ]
+        logger.info("Running %s", ' '.join(cmd))
+        subprocess.check_call(cmd, cwd=install_dir)
+        with open(output) as f:
+            return parse_locibench(json.load(f))
+    finally:
+        os.unlink(output)
+
+def parse_locibench(data):
+    # the corpus benchmarks; new_delete and accessors are per class. 'wrap'
+    # is LOCI's counterpart of parse but doesn't read any members, so it
+    # keeps its own name rather than being compared with the others' parse
+    return [ Result('c', r['op'], r['name'], r['class'], r['version'],
+                    r['messages'], r['bytes'], r['ns_per_op'], r['allocs_per_op'], None)
+             for r in data['results'] if r['messages'] > 0 ]
+
+### Java
+
+# JMH benchmark methods of the generated benchmarks and of WorkloadBench,
+# by the operation they measure
+java_ops = { 'read': 'parse', 'write': 'serialize', 'build': 'build' }
+
+# JMH reports scores in ops per unit; to nanoseconds
+jmh_time_units = { 'ns': 1, 'us': 1e3, 'ms': 1e6, 's': 1e9 }
+
+def run_java(benchmarks_jar, vectors, workloads, java_args, include=None, java='java'):
+    """
+    Run the openflowj JMH benchmarks with the gc profiler
+
+    The generated benchmarks (one per test_data vector) and WorkloadBench
+    run separately, since JMH's -p applies to every benchmark with that
+    parameter. java_args are passed to JMH as is (iterations, forks...).
+    """
+    runs = [ [ include or r'Ver1[0-3].*Bench\.(read|write|build)$' ] ]
+    if workloads:
+        runs.append([ r'WorkloadBench\.(read|write)$',
+                      '-p', 'workload=' + ','.join(w.path for w in workloads) ])
+
+    results = []
+    for args in runs:
+        fd, output = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            cmd = [ java, '-jar', benchmarks_jar, '-prof', 'gc', '-rf', 'json', '-rff', output ] + \
+                    java_args + args
+            logger.info("Running %s", ' '.join(cmd))
+            subprocess.check_call(cmd)
+            with open(output) as f:
+                results.extend(parse_jmh(json.load(f), vectors, workloads))
+        finally:
+            os.unlink(output)
+    return results
+
+def parse_jmh(data, vectors, workloads):
+    vectors = { v.name: v for v in vectors }
+    workloads = { w.path: w for w in workloads }
+    results = []
+    for r in data:
+        method = r['benchmark'].rsplit('.', 1)[-1]
+        if method not in java_ops:
+            continue
+        params = r.get('params', {})
+        if 'workload' in params:
+            workload = workloads.get(params['workload'])
+            if workload is None:
+                continue
+            name, cls, version = workload.name, None, workload.version
+            messages, bytes = workload.messages, workload.bytes
+        elif 'corpus' in params:
+            vector = vectors.get(params['corpus'])
+            if vector is None:
+                continue
+            name, cls, version = vector.name, params.get('ofClass'), vector.version
+            messages, bytes = 1, len(vector.binary)
+        else:
+            continue
+
+        metric = r['primaryMetric']
+        unit = metric['scoreUnit'].split('/')[1]
+        ns_per_op = jmh_time_units[unit] / metric['score']
+
+        alloc_bytes = None
+        for key, secondary in r.get('secondaryMetrics', {}).items():
+            if key.endswith('gc.alloc.rate.norm'):
+                alloc_bytes = secondary['score']
+
+        results.append(Result('java', java_ops[method], name, cls, version,
+                              messages, bytes, ns_per_op, None, alloc_bytes))
+    return results
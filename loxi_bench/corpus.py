@@ -0,0 +1,101 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Benchmark inputs shared by all backends
+"""
+
+import json
+import os
+import struct
+
+import test_data
+
+# test_data directory of each wire version
+version_dirs = { 'of10': 1, 'of11': 2, 'of12': 3, 'of13': 4 }
+
+class Vector(object):
+    """ A test_data file with a binary section """
+    def __init__(self, name, version, data):
+        self.name = name
+        self.version = version
+        self.binary = data['binary']
+        self.python = data.get('python')
+
+def test_vectors(filter=None):
+    """ Return the versioned test_data files with a binary section """
+    vectors = []
+    for name in test_data.list_files():
+        if filter and filter not in name:
+            continue
+        version = version_dirs.get(name.split('/')[0])
+        if version is None:
+            continue
+        data = test_data.read(name)
+        if 'binary' in data:
+            vectors.append(Vector(name, version, data))
+    return vectors
+
+class Workload(object):
+    """ A workload file written by --lang=workload """
+    def __init__(self, name, path, version, messages, bytes):
+        self.name = name
+        self.path = path
+        self.version = version
+        self.messages = messages
+        self.bytes = bytes
+
+def workloads(install_dir, filter=None):
+    """ Return the workload files listed in the manifest in install_dir, if any """
+    manifest_path = os.path.join(install_dir, "workload", "manifest.json")
+    if not os.path.exists(manifest_path):
+        return []
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    result = []
+    for entry in manifest["files"]:
+        name = entry["name"] + ".bin"
+        if filter and filter not in name:
+            continue
+        result.append(Workload(name, os.path.join(install_dir, name),
+                               version_dirs["of" + entry["version"].replace(".", "")],
+                               entry["messages"], entry["bytes"]))
+    return result
+
+def split_messages(buf):
+    """ Split a concatenation of OpenFlow messages """
+    messages = []
+    offset = 0
+    while offset < len(buf):
+        if len(buf) - offset < 8:
+            raise ValueError("truncated message header at offset %d" % offset)
+        length, = struct.unpack_from("!H", buf, offset + 2)
+        if length < 8 or offset + length > len(buf):
+            raise ValueError("bad message length %d at offset %d" % (length, offset))
+        messages.append(buf[offset:offset+length])
+        offset += length
+    return messages
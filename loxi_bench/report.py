@@ -0,0 +1,127 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Merged benchmark reports and regression checks
+"""
+
+from collections import defaultdict
+import json
+
+from loxi_bench.backends import Result
+
+backends = [ 'c', 'python', 'java' ]
+
+def fill_classes(results):
+    """
+    Fill in the class of results whose backend doesn't report it, from
+    another backend's result for the same corpus
+    """
+    classes = {}
+    for r in results:
+        if r.cls:
+            classes.setdefault(r.corpus, r.cls)
+    return [ r if r.cls else r._replace(cls=classes.get(r.corpus)) for r in results ]
+
+def to_json(results):
+    entries = []
+    for r in results:
+        entry = r._asdict()
+        entry['msgs_per_sec'] = r.msgs_per_sec
+        entry['bytes_per_sec'] = r.bytes_per_sec
+        entries.append(entry)
+    return { 'results': entries }
+
+def from_json(data):
+    return [ Result(**{ field: entry.get(field) for field in Result._fields })
+             for entry in data['results'] ]
+
+def write(results, filename):
+    with open(filename, 'w') as f:
+        json.dump(to_json(results), f, indent=2, sort_keys=True)
+
+def read(filename):
+    with open(filename) as f:
+        return from_json(json.load(f))
+
+def _format_rate(value):
+    for limit, suffix in ((1e9, 'G'), (1e6, 'M'), (1e3, 'k')):
+        if value >= limit:
+            return "%.1f%s" % (value / limit, suffix)
+    return "%.1f" % value
+
+def format_table(results):
+    """
+    Return a text table of the results, one section per message class and
+    version, with a column of msgs/sec, bytes/sec and allocations per
+    backend for each corpus and operation
+    """
+    by_class = defaultdict(dict)
+    for r in results:
+        by_class[(r.cls or '?', r.version)][(r.corpus, r.op, r.backend)] = r
+
+    present = [ b for b in backends if any(r.backend == b for r in results) ]
+    header = "%-44s %-10s" % ("corpus", "op") + \
+            "".join(" %24s" % ("%s msgs/s B/s allocs" % b) for b in present)
+
+    lines = []
+    for (cls, version), entries in sorted(by_class.items()):
+        lines.append("%s (wire version %s)" % (cls, version))
+        lines.append(header)
+        for corpus, op in sorted(set((c, o) for c, o, _ in entries)):
+            line = "%-44s %-10s" % (corpus, op)
+            for backend in present:
+                r = entries.get((corpus, op, backend))
+                if r is None:
+                    line += " %24s" % '-'
+                    continue
+                if r.allocs_per_op is not None:
+                    allocs = "%.1f" % r.allocs_per_op
+                elif r.alloc_bytes_per_op is not None:
+                    allocs = "%.0fB" % r.alloc_bytes_per_op
+                else:
+                    allocs = '-'
+                line += " %24s" % ("%s %s %s" % (_format_rate(r.msgs_per_sec),
+                                                  _format_rate(r.bytes_per_sec), allocs))
+            lines.append(line)
+        lines.append("")
+    return "\n".join(lines)
+
+def compare(baseline, results, threshold):
+    """
+    Return the results whose msgs/sec dropped by more than 'threshold'
+    (a fraction) from the baseline result with the same backend, operation
+    and corpus, as (baseline, result) pairs. Results missing from either
+    side are not compared.
+    """
+    baseline = { (r.backend, r.op, r.corpus): r for r in baseline }
+    regressions = []
+    for r in results:
+        old = baseline.get((r.backend, r.op, r.corpus))
+        if old is not None and r.msgs_per_sec < old.msgs_per_sec * (1 - threshold):
+            regressions.append((old, r))
+    return regressions
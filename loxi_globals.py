@@ -71,3 +71,6 @@ class OFVersions:
 
 # map OFVersion -> OFProtocol
 ir = OrderedDict()
+
+# Command line options of the current loxigen run (set by loxigen.py)
+options = None
@@ -178,6 +178,26 @@ def lookup_ir_wiretype(oftype, version):
     else:
         return oftype
 
+# Types whose wire encoding depends on the version, mapped to the type they
+# are encoded as by wire version (None: all other versions)
+versioned_wiretypes = {
+    'of_port_no_t': { 1: 'uint16_t', None: 'uint32_t' },
+    'of_fm_cmd_t': { 1: 'uint16_t', None: 'uint8_t' },
+    'of_wc_bmap_t': { 1: 'uint32_t', 2: 'uint32_t', None: 'uint64_t' },
+    'of_match_t': { 1: 'of_match_v1_t', 2: 'of_match_v2_t', None: 'of_match_v3_t' },
+}
+
+@memoize
+def lookup_versioned_wiretype(oftype, version):
+    """ Resolve oftype like lookup_ir_wiretype, then to the type it is
+        encoded as in version if that depends on the version, e.g.
+        of_port_no_t to uint16_t in OpenFlow 1.0 """
+    oftype = lookup_ir_wiretype(oftype, version)
+    if oftype in versioned_wiretypes:
+        wiretypes = versioned_wiretypes[oftype]
+        return wiretypes.get(version.wire_version, wiretypes[None])
+    return oftype
+
 def oftype_is_list(oftype):
     return (oftype.find("list(") == 0)
 
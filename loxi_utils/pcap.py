@@ -0,0 +1,73 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Minimal pcap writer for OpenFlow captures
+
+Each OpenFlow payload is wrapped in an Ethernet/IPv4/TCP frame of a single
+TCP connection to the OpenFlow port, so that Wireshark dispatches it to the
+OpenFlow dissector. Checksums are left zero, which Wireshark does not
+validate by default.
+"""
+
+import struct
+
+LINKTYPE_ETHERNET = 1
+OPENFLOW_PORT = 6653
+
+class PcapWriter(object):
+    """
+    Write TCP segments carrying OpenFlow payloads to a pcap file
+    """
+
+    def __init__(self, out, src_port=40000, dst_port=OPENFLOW_PORT):
+        self.out = out
+        self.src_port = src_port
+        self.dst_port = dst_port
+        self.seq = 1
+        self.timestamp = 0
+        # magic, version 2.4, GMT offset, sigfigs, snaplen, link type
+        out.write(struct.pack("<IHHiIII", 0xa1b2c3d4, 2, 4, 0, 0, 65535, LINKTYPE_ETHERNET))
+
+    def write(self, payload):
+        """
+        Write one TCP segment with the given payload
+
+        Payloads longer than a jumbo frame are not split; keep them (or
+        the messages batched into one payload) below 64KB.
+        """
+        tcp = struct.pack("!HHIIBBHHH", self.src_port, self.dst_port, self.seq, 0,
+                          5 << 4, 0x18, 0xffff, 0, 0)
+        ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp) + len(payload), 0, 0,
+                         64, 6, 0, "\x0a\x00\x00\x01", "\x0a\x00\x00\x02")
+        eth = "\x00\x00\x00\x00\x00\x02" + "\x00\x00\x00\x00\x00\x01" + "\x08\x00"
+        frame = eth + ip + tcp + payload
+        self.out.write(struct.pack("<IIII", self.timestamp // 1000000, self.timestamp % 1000000,
+                                   len(frame), len(frame)))
+        self.out.write(frame)
+        self.seq = (self.seq + len(payload)) & 0xffffffff
+        self.timestamp += 1
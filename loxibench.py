@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Compare the performance of the C, Python and Java backends
+
+Runs each backend's parse/serialize benchmarks over the test_data vectors
+and the workload files in the install directory (see --lang=workload), and
+writes one report with msgs/sec, bytes/sec and allocations per message
+class and backend. The python backend also reports the time of importing
+each version of PyLoxi, as the 'import' operation of corpus loxi.ofXX, in
+imports/sec:
+
+    ./loxigen.py --lang=c && ./loxigen.py --lang=python && \
+        ./loxigen.py --lang=java && ./loxigen.py --lang=workload
+    ./loxibench.py --build -o bench.json
+
+With --baseline, the run fails if any result is slower than the same
+result of the baseline report by more than --threshold, for CI:
+
+    ./loxibench.py -o new.json --baseline bench.json --threshold 0.15
+"""
+
+import logging
+from optparse import OptionParser
+import os
+import subprocess
+import sys
+
+from loxi_bench import backends, corpus, report
+
+def build(install_dir, selected):
+    if 'c' in selected:
+        subprocess.check_call(['make', '-j4', '-C', os.path.join(install_dir, 'locibench')])
+    if 'java' in selected:
+        openflowj = os.path.join(install_dir, 'openflowj')
+        subprocess.check_call(['mvn', '-q', '-DskipTests', 'install'], cwd=openflowj)
+        subprocess.check_call(['mvn', '-q', 'package'], cwd=os.path.join(openflowj, 'bench'))
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-i", "--install-dir", default="loxi_output",
+                      help="Directory of the generated backends (default %default)")
+    parser.add_option("-b", "--backends", default="c,python,java",
+                      help="Comma separated backends to run (default %default)")
+    parser.add_option("--build", action="store_true", default=False,
+                      help="Build locibench and the openflowj benchmarks first")
+    parser.add_option("-t", "--min-time", type="float", default=0.01,
+                      help="Minimum time of each C and Python measurement in seconds (default %default)")
+    parser.add_option("-f", "--filter",
+                      help="Only run the test_data vectors and workloads whose name contains FILTER")
+    parser.add_option("--java-include",
+                      help="JMH regex of the generated Java benchmarks to run " +
+                           "(default: read, write and build of all of them)")
+    parser.add_option("--java-args", default="-f 1 -wi 2 -w 1 -i 3 -r 1",
+                      help="Extra JMH arguments (default '%default')")
+    parser.add_option("-o", "--output",
+                      help="Write the merged results as JSON to OUTPUT")
+    parser.add_option("--baseline",
+                      help="JSON results of an earlier run to compare with")
+    parser.add_option("--threshold", type="float", default=0.10,
+                      help="Fail if msgs/sec drops by more than this fraction of the baseline (default %default)")
+    parser.add_option("-q", "--quiet", action="store_true", default=False,
+                      help="Don't print the report")
+    (options, args) = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    selected = options.backends.split(',')
+    install_dir = os.path.abspath(options.install_dir)
+
+    if options.build:
+        build(install_dir, selected)
+
+    vectors = corpus.test_vectors(options.filter)
+    workloads = corpus.workloads(install_dir, options.filter)
+
+    results = []
+    if 'c' in selected:
+        results.extend(backends.run_c(os.path.join(install_dir, 'locibench', 'locibench'),
+                                      install_dir, workloads, options.min_time, options.filter))
+    if 'python' in selected:
+        results.extend(backends.run_python(os.path.join(install_dir, 'pyloxi'),
+                                           vectors, workloads, options.min_time))
+        results.extend(backends.run_python_import(os.path.join(install_dir, 'pyloxi'),
+                                                  options.min_time, options.filter))
+    if 'java' in selected:
+        jar = os.path.join(install_dir, 'openflowj', 'bench', 'target', 'benchmarks.jar')
+        results.extend(backends.run_java(jar, vectors, workloads, options.java_args.split(),
+                                         include=options.java_include))
+    results = report.fill_classes(results)
+
+    if options.output:
+        report.write(results, options.output)
+    if not options.quiet:
+        print report.format_table(results)
+
+    if options.baseline:
+        regressions = report.compare(report.read(options.baseline), results, options.threshold)
+        for old, new in regressions:
+            print "REGRESSION %s %s %s: %.0f -> %.0f msgs/sec (%+.1f%%)" % \
+                (new.backend, new.op, new.corpus, old.msgs_per_sec, new.msgs_per_sec,
+                 (new.msgs_per_sec / old.msgs_per_sec - 1) * 100)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
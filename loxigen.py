@@ -169,6 +169,7 @@ if __name__ == '__main__':
     log("\nGenerating files for target language %s\n" % options.lang)
 
     loxi_globals.OFVersions.target_versions = target_versions
+    loxi_globals.options = options
     inputs = read_input()
     build_ir(inputs)
     lang_module.generate(options.install_dir)
@@ -66,31 +66,62 @@ def build_ofclasses(version):
     modules = defaultdict(list)
     for ofclass in loxi_globals.ir[version].classes:
         module_name, ofclass.pyname = generate_pyname(ofclass)
+        ofclass.dtype_fields = None
+        ofclass.template_fields, ofclass.template_matches = [], []
+        ofclass.retainable = module_name == 'message' and not ofclass.virtual
+        ofclass.container_members = [m.name for m in ofclass.members
+                                     if type(m) == OFDataMember and oftype.is_container(m.oftype, version)]
+        if module_name in ('message', 'oxm') and not ofclass.virtual:
+            ofclass.template_fields, ofclass.template_matches = \
+                oftype.gen_template_fields(ofclass, version)
         modules[module_name].append(ofclass)
+    build_array_classes(version)
     return modules
 
+# Set dtype_fields on the fixed-length classes that are the elements of a
+# list member, and array_members on the classes with such members, to
+# generate unpack_array and unpack_with_arrays
+def build_array_classes(version):
+    ofproto = loxi_globals.ir[version]
+    for ofclass in ofproto.classes:
+        ofclass.array_members = []
+        for m in ofclass.members:
+            if type(m) != OFDataMember or not oftype.oftype_is_list(m.oftype):
+                continue
+            elem_class = ofproto.class_by_name(oftype.oftype_list_elem(m.oftype))
+            if elem_class is None:
+                continue
+            if elem_class.dtype_fields is None:
+                elem_class.dtype_fields = oftype.gen_dtype_fields(elem_class, version)
+            if elem_class.dtype_fields:
+                ofclass.array_members.append(m)
+
+def lazy_modules():
+    """ Whether to generate modules that create their classes on first use (--python-lazy) """
+    return bool(getattr(loxi_globals.options, 'python_lazy', False))
+
 def generate_init(out, name, version):
-    util.render_template(out, 'init.py', version=version)
+    util.render_template(out, 'init.py', version=version, lazy=lazy_modules())
 
 def generate_action(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['action'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_action_id(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['action_id'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_oxm(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['oxm'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_common(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['common'],
-                         version=version,
+                         version=version, lazy=lazy_modules(),
                          extra_template='_common_extra.py')
 
 def generate_const(out, name, version):
@@ -100,23 +131,23 @@ def generate_const(out, name, version):
 def generate_instruction(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['instruction'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_instruction_id(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['instruction_id'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_message(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['message'],
-                         version=version,
+                         version=version, lazy=lazy_modules(),
                          extra_template='_message_extra.py')
 
 def generate_meter_band(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['meter_band'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def generate_util(out, name, version):
     util.render_template(out, 'util.py', version=version)
@@ -124,7 +155,7 @@ def generate_util(out, name, version):
 def generate_bsn_tlv(out, name, version):
     util.render_template(out, 'module.py',
                          ofclasses=modules_by_version[version]['bsn_tlv'],
-                         version=version)
+                         version=version, lazy=lazy_modules())
 
 def init():
     for version in loxi_globals.OFVersions.target_versions:
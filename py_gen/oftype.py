@@ -27,6 +27,7 @@
 
 from collections import namedtuple
 
+from loxi_ir import *
 import loxi_utils.loxi_utils as loxi_utils
 import py_gen.codegen
 import loxi_globals
@@ -151,6 +152,154 @@ for (cls, pyclass) in embedded_structs.items():
         pack='%s.pack()',
         unpack='%s.unpack(%%s)' % pyclass)
 
+# Whether values of the given oftype are objects or lists, which
+# loxi.generic_util.retain_wire tracks the changes of
+def is_container(oftype, version):
+    wiretype = loxi_utils.lookup_ir_wiretype(oftype, version)
+    return loxi_utils.oftype_is_list(wiretype) or wiretype in embedded_structs \
+        or wiretype in ('of_oxm_t', 'of_mac_addr_t')
+
+## NumPy dtypes
+
+# Map from LOXI type name to the format of a NumPy structured array field,
+# for the types whose wire format is a fixed-length big-endian value or a
+# byte array, after loxi_utils.lookup_versioned_wiretype. See gen_dtype_fields.
+dtype_formats = {
+    'char': 'u1',
+    'uint8_t': 'u1',
+    'uint16_t': '>u2',
+    'uint32_t': '>u4',
+    'uint64_t': '>u8',
+    'of_match_bmap_t': '>u8',
+    'of_ipv4_t': '>u4',
+    'of_ipv6_t': '(16,)u1',
+    'of_mac_addr_t': '(6,)u1',
+    'of_bitmap_128_t': '(2,)>u8',
+    'of_checksum_128_t': '(2,)>u8',
+}
+
+for (cls, length) in fixed_length_strings.items():
+    dtype_formats[cls] = 'S%d' % length
+
+def lookup_dtype_format(oftype, version):
+    return dtype_formats.get(loxi_utils.lookup_versioned_wiretype(oftype, version))
+
+# Return the (name, format, offset) fields of a NumPy structured dtype
+# matching the wire format of ofclass, or None if its instances can't be
+# read as an array (variable length, padded by alignment, or a member of
+# a type without a NumPy format). Pad members are left out.
+def gen_dtype_fields(ofclass, version):
+    if ofclass.virtual or not ofclass.is_fixed_length:
+        return None
+    if ofclass.base_length % int(ofclass.params.get('align', 1)) != 0:
+        return None
+    fields = []
+    for m in ofclass.members:
+        if isinstance(m, OFPadMember):
+            continue
+        fmt = lookup_dtype_format(m.oftype, version)
+        if fmt is None:
+            return None
+        fields.append((m.name, fmt, m.offset))
+    return tuple(fields)
+
+## Patchable fields
+
+# Map from LOXI type name to the struct format of its wire encoding, for the
+# fixed-length types that can be patched in a compiled template, after
+# loxi_utils.lookup_versioned_wiretype.
+struct_formats = {
+    'char': '!B',
+    'uint8_t': '!B',
+    'uint16_t': '!H',
+    'uint32_t': '!L',
+    'uint64_t': '!Q',
+    'of_match_bmap_t': '!Q',
+    'of_ipv4_t': '!L',
+    'of_ipv6_t': '!16s',
+    'of_mac_addr_t': '!6B',
+}
+
+for (cls, length) in fixed_length_strings.items():
+    struct_formats[cls] = '!%ds' % length
+
+def lookup_struct_format(oftype, version):
+    return struct_formats.get(loxi_utils.lookup_versioned_wiretype(oftype, version))
+
+def lookup_embedded_class(oftype, version):
+    wiretype = loxi_utils.lookup_versioned_wiretype(oftype, version)
+    if not wiretype.endswith('_t'):
+        return None
+    return loxi_globals.ir[version].class_by_name(wiretype[:-2])
+
+# Return the fields of ofclass that can be patched in a compiled template,
+# as (path, offset, struct format), and the offsets of its OXM matches, as
+# (name, offset). Only data members at a fixed offset and of a fixed-length
+# type are patchable, including the members of fixed-length embedded structs
+# ("match.ipv4_src" in OpenFlow 1.0). Type, length and field length members
+# and variable length data members are not: changing them would change the
+# length or the layout of the message.
+def gen_template_fields(ofclass, version, prefix='', base_offset=0):
+    fields = []
+    matches = []
+    for m in ofclass.members:
+        if type(m) != OFDataMember or m.offset is None:
+            continue
+        offset = base_offset + m.offset
+        fmt = lookup_struct_format(m.oftype, version)
+        if fmt:
+            fields.append((prefix + m.name, offset, fmt))
+            continue
+        embedded = lookup_embedded_class(m.oftype, version)
+        if embedded is None:
+            continue
+        if embedded.name == 'of_match_v3':
+            if not prefix:
+                matches.append((m.name, offset))
+        elif embedded.is_fixed_length and not embedded.virtual:
+            nested_fields, _ = gen_template_fields(embedded, version, prefix + m.name + '.', offset)
+            fields.extend(nested_fields)
+    return fields, matches
+
+# Return the format string and the argument expressions of the one line
+# repr of ofclass, "name(member=value, ...)". Values are formatted like in
+# pretty_print, without the layout engine: MAC and IPv4 addresses, ports and
+# OpenFlow 1.0/1.1 wildcards with the util.pretty_* helpers, other integers in
+# hex, and members of a bitmask enum type as flag names with
+# util.pretty_flags. Members of other enum types show the name of their
+# value, or the value in hex if it has none, with util.pretty_enum.
+def gen_repr_format(ofclass, version):
+    enums = dict((enum.name, enum) for enum in loxi_globals.ir[version].enums)
+    fields = []
+    args = []
+    for m in ofclass.members:
+        if type(m) != OFDataMember:
+            continue
+        value = 'self.' + m.name
+        enum = enums.get(m.oftype)
+        if m.name == 'xid':
+            fmt, arg = '%s', "%s is None and 'None' or '%%#x' %% %s" % (value, value)
+        elif m.oftype == 'of_mac_addr_t':
+            fmt, arg = '%s', 'util.pretty_mac(%s)' % value
+        elif m.oftype == 'of_ipv4_t':
+            fmt, arg = '%s', 'util.pretty_ipv4(%s)' % value
+        elif m.oftype == 'of_wc_bmap_t' and version.wire_version in (1, 2):
+            fmt, arg = '%s', 'util.pretty_wildcards(%s)' % value
+        elif m.oftype == 'of_port_no_t':
+            fmt, arg = '%s', 'util.pretty_port(%s)' % value
+        elif enum and enum.is_bitmask:
+            flag_names = tuple([name for name, _ in enum.values])
+            fmt, arg = '%s', 'util.pretty_flags(%s, %r)' % (value, flag_names)
+        elif enum:
+            fmt, arg = '%s', 'util.pretty_enum(%s, const.%s_map)' % (value, enum.name)
+        elif loxi_utils.lookup_ir_wiretype(m.oftype, version=version).startswith("uint"):
+            fmt, arg = '%#x', value
+        else:
+            fmt, arg = '%r', value
+        fields.append('%s=%s' % (m.name, fmt))
+        args.append(arg)
+    return '%s(%s)' % (ofclass.pyname, ', '.join(fields)), args
+
 ## Public interface
 
 def lookup_type_data(oftype, version):
@@ -183,7 +332,10 @@ def gen_pack_expr(oftype, value_expr, version):
 #
 # 'reader_expr' is a string of Python code which will evaluate to
 # the OFReader instance used for deserialization.
-def gen_unpack_expr(oftype, reader_expr, version):
+#
+# With 'arrays', lists of classes that have a NumPy dtype are unpacked
+# into a structured array instead of a list of objects.
+def gen_unpack_expr(oftype, reader_expr, version, arrays=False):
     type_data = lookup_type_data(oftype, version)
     if type_data and type_data.unpack:
         return type_data.unpack % reader_expr
@@ -191,6 +343,8 @@ def gen_unpack_expr(oftype, reader_expr, version):
         ofproto = loxi_globals.ir[version]
         ofclass = ofproto.class_by_name(oftype_list_elem(oftype))
         module_name, class_name = py_gen.codegen.generate_pyname(ofclass)
+        if arrays and getattr(ofclass, 'dtype_fields', None):
+            return '%s.%s.unpack_array(%s)' % (module_name, class_name, reader_expr)
         return 'loxi.generic_util.unpack_list(%s, %s.%s.unpack)' % \
             (reader_expr, module_name, class_name)
     else:
@@ -27,12 +27,18 @@
 ::
 :: from loxi_globals import OFVersions
 :: if version == OFVersions.VERSION_1_0:
-match = match_v1
+:: match_class = 'match_v1'
 :: elif version == OFVersions.VERSION_1_1:
-match = match_v2
+:: match_class = 'match_v2'
 :: elif version == OFVersions.VERSION_1_2:
-match = match_v3
+:: match_class = 'match_v3'
 :: elif version == OFVersions.VERSION_1_3:
 :: # HACK
-match = match_v3
+:: match_class = 'match_v3'
+:: #endif
+:: if lazy:
+def _make_match():
+    return _lazy.${match_class}
+:: else:
+match = ${match_class}
 :: #endif
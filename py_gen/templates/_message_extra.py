@@ -30,10 +30,25 @@ def parse_header(buf):
         raise loxi.ProtocolError("too short to be an OpenFlow message")
     return struct.unpack_from("!BBHL", buf)
 
-def parse_message(buf):
+def parse_message(buf, retain=False):
+    """
+    Parse one message from buf, which holds exactly that message
+
+    With retain, the message keeps a reference to buf, and its pack()
+    returns buf with the current xid until the message, one of its lists or
+    an object in it is changed (see loxi.generic_util.retain_wire), which
+    makes forwarding it cheap.
+    """
     msg_ver, msg_type, msg_len, msg_xid = parse_header(buf)
     if msg_ver != const.OFP_VERSION and msg_type != const.OFPT_HELLO:
         raise loxi.ProtocolError("wrong OpenFlow version (expected %d, got %d)" % (const.OFP_VERSION, msg_ver))
     if len(buf) != msg_len:
         raise loxi.ProtocolError("incorrect message size")
-    return message.unpack(loxi.generic_util.OFReader(buf))
+:: if lazy:
+    msg = _lazy.message.unpack(loxi.generic_util.OFReader(buf))
+:: else:
+    msg = message.unpack(loxi.generic_util.OFReader(buf))
+:: #endif
+    if retain:
+        loxi.generic_util.retain_wire(msg, buf)
+    return msg
@@ -10,13 +10,36 @@
 :: discriminator_fmt = discriminator_fmts[ofclass.discriminator.length]
 :: #endif
 class ${ofclass.pyname}(${superclass_pyname}):
-:: if ofclass.virtual:
+:: if ofclass.virtual and lazy:
+    subtypes = loxi.generic_util.LazySubtypes(_lazy, {
+:: for subclass in subclasses:
+        ${subclass.member_by_name(ofclass.discriminator.name).value}: ${repr(subclass.pyname)},
+:: #endfor
+    })
+:: elif ofclass.virtual:
     subtypes = {}
 
 :: #endif
 :: for m in type_members:
     ${m.name} = ${m.value}
 :: #endfor
+:: if ofclass.template_fields:
+
+    # Offset and struct format of the fields that compile_template can patch
+    template_fields = {
+:: for path, offset, fmt in ofclass.template_fields:
+        ${repr(path)}: (${offset}, ${repr(fmt)}),
+:: #endfor
+    }
+:: #endif
+:: if ofclass.template_matches:
+    template_matches = { ${', '.join(['%r: %d' % x for x in ofclass.template_matches])} }
+:: #endif
+:: if ofclass.container_members:
+
+    # Members holding objects or lists, see loxi.generic_util.retain_wire
+    _container_members = (${''.join(['%r, ' % name for name in ofclass.container_members]).rstrip()})
+:: #endif
 
     def __init__(${', '.join(['self'] + ["%s=None" % m.name for m in normal_members])}):
 :: for m in normal_members:
@@ -33,6 +56,12 @@ class ${ofclass.pyname}(${superclass_pyname}):
         return
 
     def pack(self):
+:: if ofclass.retainable:
+        if self._wire is not None:
+            buf = loxi.generic_util.pack_retained(self)
+            if buf is not None:
+                return buf
+:: #endif
         packed = []
 :: include("_pack.py", ofclass=ofclass)
         return ''.join(packed)
@@ -47,21 +76,61 @@ class ${ofclass.pyname}(${superclass_pyname}):
 
 :: #endif
         obj = ${ofclass.pyname}()
-:: include("_unpack.py", ofclass=ofclass)
+:: include("_unpack.py", ofclass=ofclass, arrays=False)
         return obj
+:: if ofclass.dtype_fields:
+
+    # Wire format as a NumPy structured dtype: (itemsize, ((name, format, offset), ...))
+    dtype_spec = (${ofclass.base_length}, ${repr(ofclass.dtype_fields)})
+
+    @staticmethod
+    def unpack_array(reader, native=False):
+        """
+        Unpack the rest of reader as a NumPy structured array of ${ofclass.pyname}
+
+        The array is a read-only view of the reader's buffer in network byte
+        order, or a native byte order copy if 'native' is set. Requires NumPy.
+        """
+        return loxi.generic_util.unpack_array(reader, ${ofclass.pyname}.dtype_spec, native)
+:: #endif
+:: if ofclass.array_members:
+
+    @staticmethod
+    def unpack_with_arrays(reader):
+:: array_lists = ', '.join(['%s (%s)' % (m.name, ofclass.protocol.class_by_name(m.oftype[5:-3]).pyname) for m in ofclass.array_members])
+        """
+        Like unpack, but ${array_lists} is a NumPy structured array (see unpack_array)
+        """
+        obj = ${ofclass.pyname}()
+:: include("_unpack.py", ofclass=ofclass, arrays=True)
+        return obj
+:: #endif
 
     def __eq__(self, other):
-        if type(self) != type(other): return False
+        if type(self) != type(other):
+            if not loxi.generic_util.same_class(self, other): return False
 :: for m in normal_members:
         if self.${m.name} != other.${m.name}: return False
 :: #endfor
         return True
 
+    def __repr__(self):
+:: repr_format, repr_args = py_gen.oftype.gen_repr_format(ofclass, version)
+:: if repr_args:
+        return ${repr(repr_format)} % (
+:: for arg in repr_args:
+            ${arg},
+:: #endfor
+        )
+:: else:
+        return ${repr(repr_format)}
+:: #endif
+
     def pretty_print(self, q):
 :: include('_pretty_print.py', ofclass=ofclass)
 
-:: # Register with our superclass
-:: if ofclass.superclass:
+:: # Register with our superclass, a LazySubtypes of lazy modules already knows us
+:: if ofclass.superclass and not lazy:
 :: type_field_name = ofclass.superclass.discriminator.name
 :: type_value = ofclass.member_by_name(type_field_name).value
 ${superclass_pyname}.subtypes[${type_value}] = ${ofclass.pyname}
@@ -48,7 +48,7 @@
 ::         else:
 ::             reader_expr = 'reader'
 ::         #endif
-        obj.${m.name} = ${gen_unpack_expr(m.oftype, reader_expr, version=version)}
+        obj.${m.name} = ${gen_unpack_expr(m.oftype, reader_expr, version=version, arrays=arrays)}
 ::     #endif
 :: #endfor
 :: if ofclass.has_external_alignment:
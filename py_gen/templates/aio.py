@@ -0,0 +1,284 @@
+:: # Copyright 2013, Big Switch Networks, Inc.
+:: #
+:: # LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+:: # the following special exception:
+:: #
+:: # LOXI Exception
+:: #
+:: # As a special exception to the terms of the EPL, you may distribute libraries
+:: # generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+:: # that copyright and licensing notices generated by LoxiGen are not altered or removed
+:: # from the LoxiGen Libraries and the notice provided below is (i) included in
+:: # the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+:: # documentation for the LoxiGen Libraries, if distributed in binary form.
+:: #
+:: # Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+:: #
+:: # You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+:: # a copy of the EPL at:
+:: #
+:: # http://www.eclipse.org/legal/epl-v10.html
+:: #
+:: # Unless required by applicable law or agreed to in writing, software
+:: # distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+:: # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+:: # EPL for the specific language governing permissions and limitations
+:: # under the EPL.
+::
+:: include('_copyright.py')
+"""
+asyncio OpenFlow connections
+
+OFProtocol is an asyncio Protocol that frames the byte stream into
+messages, allocates xids, matches replies to the requests that caused
+them, aggregates multipart (stats) replies and answers echo requests.
+Messages sent during one event loop iteration are written to the
+transport with a single write.
+
+Uses asyncio where available and its Python 2 backport, trollius,
+otherwise. Only futures and callbacks are used, no coroutines, so that the
+same code works with both:
+
+    import loxi.of13 as ofp
+    loop = asyncio.get_event_loop()
+    transport, conn = loop.run_until_complete(loxi.aio.connect(ofp, "127.0.0.1"))
+    reply = loop.run_until_complete(conn.request(ofp.message.echo_request()))
+"""
+
+:: include('_autogen.py')
+
+import collections
+import functools
+import logging
+import struct
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+import loxi
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+OFP_TCP_PORT = 6653
+
+class ErrorReply(Exception):
+    """
+    Raised by the future of a request that the switch answered with an
+    error message, available as the 'msg' attribute
+    """
+    def __init__(self, msg):
+        Exception.__init__(self, "%s (type %d, code %d)" % \
+                           (type(msg).__name__, msg.err_type, msg.code))
+        self.msg = msg
+
+class ConnectionLost(Exception):
+    """
+    Raised by the futures of the requests still waiting for a reply when
+    the connection closes
+    """
+    pass
+
+class _Request(object):
+    def __init__(self, future, expect_reply, multipart):
+        self.future = future
+        self.expect_reply = expect_reply
+        self.multipart = multipart
+        self.replies = []
+
+    # The future may already be cancelled, e.g. by asyncio.wait_for timing out
+
+    def set_result(self, result):
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def set_exception(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+class OFProtocol(asyncio.Protocol):
+    """
+    One OpenFlow connection
+
+    ofp is the protocol module to speak (e.g. loxi.of13): the connection
+    starts by sending its hello. Received messages are parsed with the
+    protocol module of their version.
+
+    Messages that are not replies to a request made on this connection
+    (packet-ins, port status, replies to messages sent with send()...) go
+    to message_received, which subclasses override.
+    """
+
+    def __init__(self, ofp, loop=None):
+        self.ofp = ofp
+        self.loop = loop or asyncio.get_event_loop()
+        self.transport = None
+        self.peer_version = None
+        self._buf = ''
+        self._wbuf = []
+        self._next_xid = 1
+        # By xid, in the order they were sent
+        self._requests = collections.OrderedDict()
+
+    def message_received(self, msg):
+        """ Called with each message that is not a reply to a request """
+        pass
+
+    # Sending
+
+    def send(self, msg):
+        """
+        Queue msg to be written at the end of this loop iteration
+
+        Allocates an xid for msg if it has none, and returns the xid.
+        """
+        if msg.xid is None:
+            msg.xid = self._alloc_xid()
+        if not self._wbuf:
+            self.loop.call_soon(self._flush)
+        self._wbuf.append(msg.pack())
+        return msg.xid
+
+    def request(self, msg, expect_reply=True):
+        """
+        Send msg and return a future of its reply
+
+        The result is the reply message, or the list of all parts of a
+        multipart (stats) reply. The future raises ErrorReply if the switch
+        answers with an error message.
+
+        For messages that have no reply, like flow mods, pass
+        expect_reply=False: the future completes with None when a later
+        barrier reply shows that the switch processed the message.
+
+        Cancelling the future forgets the request: a reply arriving later
+        goes to message_received.
+        """
+        future = asyncio.Future(loop=self.loop)
+        if self.transport is None:
+            future.set_exception(ConnectionLost("not connected"))
+            return future
+        multipart = isinstance(msg, loxi.protocol(msg.version).message.stats_request)
+        xid = self.send(msg)
+        self._requests[xid] = _Request(future, expect_reply, multipart)
+        future.add_done_callback(functools.partial(self._request_done, xid))
+        return future
+
+    def barrier(self):
+        """
+        Send a barrier request and return a future of its reply
+
+        Completes the requests sent before it with expect_reply=False.
+        """
+        return self.request(self.ofp.message.barrier_request())
+
+    def _request_done(self, xid, future):
+        request = self._requests.get(xid)
+        if request is not None and request.future is future:
+            del self._requests[xid]
+
+    def _alloc_xid(self):
+        xid = self._next_xid
+        self._next_xid = xid % 0xffffffff + 1
+        return xid
+
+    def _flush(self):
+        if self._wbuf and self.transport is not None:
+            self.transport.write(''.join(self._wbuf))
+        self._wbuf = []
+
+    # asyncio.Protocol
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.send(self.ofp.message.hello())
+
+    def data_received(self, data):
+        buf = self._buf + data if self._buf else data
+        offset = 0
+        while len(buf) - offset >= 8:
+            length, = struct.unpack_from("!H", buf, offset + 2)
+            if length < 8:
+                logger.error("Invalid OpenFlow message length %d, closing the connection", length)
+                self._buf = ''
+                self.transport.close()
+                return
+            if len(buf) - offset < length:
+                break
+            self._frame_received(buf[offset:offset+length])
+            offset += length
+        self._buf = buf[offset:]
+
+    def connection_lost(self, exc):
+        self.transport = None
+        self._wbuf = []
+        requests = self._requests.values()
+        self._requests.clear()
+        for request in requests:
+            request.set_exception(ConnectionLost(str(exc) if exc else "connection closed"))
+
+    # Receiving
+
+    def _frame_received(self, buf):
+        try:
+            ofp = loxi.protocol(ord(buf[0]))
+            msg = ofp.message.parse_message(buf)
+        except (ValueError, loxi.ProtocolError) as e:
+            logger.warning("Dropping unparseable OpenFlow message: %s", e)
+            return
+
+        if msg.type == ofp.OFPT_HELLO:
+            self.peer_version = msg.version
+        elif msg.type == ofp.OFPT_ECHO_REQUEST:
+            self.send(ofp.message.echo_reply(xid=msg.xid, data=msg.data))
+            return
+
+        request = self._requests.get(msg.xid)
+        if request is None or msg.type == ofp.OFPT_HELLO:
+            self.message_received(msg)
+        elif msg.type == ofp.OFPT_ERROR:
+            del self._requests[msg.xid]
+            request.set_exception(ErrorReply(msg))
+        elif request.multipart:
+            request.replies.append(msg)
+            if not msg.flags & ofp.OFPSF_REPLY_MORE:
+                del self._requests[msg.xid]
+                request.set_result(request.replies)
+        else:
+            if msg.type == ofp.OFPT_BARRIER_REPLY:
+                self._complete_before(msg.xid)
+            del self._requests[msg.xid]
+            request.set_result(msg)
+
+    def _complete_before(self, barrier_xid):
+        # The switch processed everything sent before the barrier, so the
+        # requests without a reply sent before it succeeded
+        done = []
+        for xid, request in self._requests.items():
+            if xid == barrier_xid:
+                break
+            if not request.expect_reply:
+                done.append(xid)
+        for xid in done:
+            self._requests.pop(xid).set_result(None)
+
+def connect(ofp, host, port=OFP_TCP_PORT, loop=None, protocol_factory=OFProtocol):
+    """
+    Connect to a switch (or controller)
+
+    Returns a future of (transport, protocol), like loop.create_connection.
+    """
+    loop = loop or asyncio.get_event_loop()
+    return loop.create_connection(lambda: protocol_factory(ofp, loop=loop), host, port)
+
+def listen(ofp, host=None, port=OFP_TCP_PORT, loop=None, protocol_factory=OFProtocol):
+    """
+    Accept connections from switches
+
+    Returns a future of the asyncio Server, like loop.create_server.
+    protocol_factory(ofp, loop=loop) creates the protocol of each connection.
+    """
+    loop = loop or asyncio.get_event_loop()
+    return loop.create_server(lambda: protocol_factory(ofp, loop=loop), host, port)
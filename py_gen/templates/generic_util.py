@@ -34,6 +34,7 @@ Utility functions independent of the protocol version
 
 import loxi
 import struct
+import types
 
 def pack_list(values):
     return "".join([x.pack() for x in values])
@@ -47,6 +48,340 @@ def unpack_list(reader, deserializer):
         entries.append(deserializer(reader))
     return entries
 
+# NumPy dtypes by the dtype_spec of the generated classes
+_dtypes = {}
+
+def unpack_array(reader, dtype_spec, native=False):
+    """
+    Unpack the rest of the reader as a NumPy structured array, in one
+    vectorized call instead of one object per entry.
+
+    dtype_spec is the dtype_spec attribute of a fixed-length class. The
+    array is a read-only view of the reader's buffer in network byte
+    order, or a native byte order copy if 'native' is set.
+    """
+    import numpy
+    dtype = _dtypes.get(dtype_spec)
+    if dtype is None:
+        itemsize, fields = dtype_spec
+        dtype = _dtypes[dtype_spec] = numpy.dtype(dict(
+            names=[f[0] for f in fields],
+            formats=[f[1] for f in fields],
+            offsets=[f[2] for f in fields],
+            itemsize=itemsize))
+    length = reader.length - reader.offset
+    if length % dtype.itemsize != 0:
+        raise loxi.ProtocolError("%d bytes is not a whole number of %d byte entries" % \
+                                 (length, dtype.itemsize))
+    array = numpy.frombuffer(reader.buf, dtype, length / dtype.itemsize,
+                             reader.start + reader.offset)
+    reader.offset = reader.length
+    if native:
+        array = array.astype(dtype.newbyteorder('='))
+    return array
+
+class PackedTemplate(object):
+    """
+    A serialized object with fields that can be patched in place
+
+    Created by OFObject.compile_template. pack() copies the serialized
+    prototype and writes the new field values at the offsets recorded
+    when compiling, so it costs a copy and one struct.pack_into per
+    field instead of a full pack().
+
+    fields: the patchable field paths, in the order given to compile_template
+    """
+    def __init__(self, obj, fields):
+        self.buf = obj.pack()
+        self.fields = tuple(fields)
+        self._locations = [ _template_location(obj, name) for name in self.fields ]
+        self._by_name = dict(zip(self.fields, self._locations))
+
+    def pack(self, *args, **kwargs):
+        """
+        Return a copy of the prototype with the given fields changed
+
+        Positional arguments are values of the fields in the order they
+        were compiled; keyword arguments are values by field path (use
+        **{'match.ipv4_dst': value} for dotted paths). Fields not given
+        keep the prototype's value.
+        """
+        if len(args) > len(self.fields):
+            raise TypeError("%d values given for %d fields" % (len(args), len(self.fields)))
+        buf = bytearray(self.buf)
+        for (offset, st), value in zip(self._locations, args):
+            _patch(buf, offset, st, value)
+        for name, value in kwargs.items():
+            if name not in self._by_name:
+                raise TypeError("%s was not compiled into this template" % name)
+            offset, st = self._by_name[name]
+            _patch(buf, offset, st, value)
+        return str(buf)
+
+def _patch(buf, offset, st, value):
+    if isinstance(value, (list, tuple)):
+        st.pack_into(buf, offset, *value)
+    else:
+        st.pack_into(buf, offset, value)
+
+def _template_location(obj, name):
+    """
+    Return the (offset, struct.Struct) of field 'name' in obj.pack()
+    """
+    klass = type(obj)
+    if name in klass.template_fields:
+        offset, fmt = klass.template_fields[name]
+        return offset, struct.Struct(fmt)
+
+    # An OXM of an OpenFlow 1.2+ match: match.<oxm>[.<member>]
+    parts = name.split('.')
+    if len(parts) in (2, 3) and parts[0] in klass.template_matches:
+        member = len(parts) == 3 and parts[2] or 'value'
+        # skip the match type and length
+        offset = klass.template_matches[parts[0]] + 4
+        for oxm in getattr(obj, parts[0]).oxm_list:
+            if type(oxm).__name__ == parts[1]:
+                if member in type(oxm).template_fields:
+                    oxm_offset, fmt = type(oxm).template_fields[member]
+                    return offset + oxm_offset, struct.Struct(fmt)
+                break
+            offset += len(oxm.pack())
+        else:
+            raise ValueError("%s: the %s of this %s has no %s OXM" % \
+                             (name, parts[0], klass.__name__, parts[1]))
+
+    # type, length and variable length members are never in template_fields
+    raise ValueError("%s is not a patchable field of %s (patchable: %s)" % \
+                     (name, klass.__name__, ', '.join(sorted(klass.template_fields)) or 'none'))
+
+def retain_wire(msg, buf, offset=0, length=None):
+    """
+    Make pack() of msg return buf[offset:offset+length], the bytes msg was
+    parsed from, instead of serializing it again
+
+    Only the xid is patched into the retained bytes. Assigning any other
+    attribute of msg or of the objects it contains, or changing one of its
+    lists, makes the next pack() serialize it as usual and drop the
+    retained bytes. Changes inside the sets of 128-bit bitmap members are
+    not noticed: call release_wire(msg) after making them.
+
+    To notice the changes without comparing the whole message on pack(),
+    msg is switched to a subclass that records assignments (compared equal
+    to its class, see same_class). The objects and lists it contains get
+    the same treatment, lists being replaced with copies that record
+    changes, when they are first read.
+    """
+    if length is None:
+        length = len(buf) - offset
+    # [buf, offset, length, xid], buf set to None by any change
+    state = [buf, offset, length, msg.xid]
+    _track(msg, state)
+    msg.__dict__['_wire'] = state
+
+def release_wire(msg):
+    """ Drop the bytes retained by retain_wire """
+    state = msg._wire
+    if state is not None:
+        state[0] = None
+        msg._wire = None
+
+def pack_retained(msg):
+    """
+    Return the bytes retained by msg with its current xid, or None, after
+    dropping them, if anything else changed since retain_wire
+    """
+    buf, offset, length, xid = msg._wire
+    if buf is None:
+        msg._wire = None
+        return None
+    if msg.xid == xid:
+        if offset == 0 and length == len(buf) and type(buf) == str:
+            return buf
+        return str(buf[offset:offset+length])
+    return ''.join((str(buf[offset:offset+4]), struct.pack("!L", msg.xid),
+                    str(buf[offset+8:offset+length])))
+
+def same_class(a, b):
+    """
+    Whether a and b are instances of the same class, ignoring the
+    subclasses that retain_wire switches objects to
+    """
+    return getattr(type(a), '_tracked_base', type(a)) is getattr(type(b), '_tracked_base', type(b))
+
+# Attributes whose assignment keeps the retained bytes
+_untracked_attrs = frozenset(['xid', '_wire', '_wire_state', '_untracked'])
+
+def _tracked_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    if name not in _untracked_attrs:
+        self._wire_state[0] = None
+
+def _tracked_getattr(self, name):
+    # Only called for the members _track moved to _untracked
+    values = self.__dict__
+    untracked = values.get('_untracked')
+    if not untracked or name not in untracked:
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+    value = untracked.pop(name)
+    state = values['_wire_state']
+    if isinstance(value, list):
+        value = _TrackedList(value)
+        value._wire_state = state
+        # lists hold either objects or plain values (MAC addresses)
+        if value and isinstance(value[0], loxi.OFObject):
+            for x in value:
+                _track(x, state)
+    elif value is not None:
+        _track(value, state)
+    values[name] = value
+    return value
+
+def _new_object(cls):
+    return cls.__new__(cls)
+
+def _tracked_reduce_ex(self, protocol):
+    # Copies and pickles are plain objects of the original class
+    state = dict(self.__dict__)
+    state.update(state.pop('_untracked', {}))
+    for name in ('_wire', '_wire_state'):
+        state.pop(name, None)
+    for name, value in state.items():
+        if type(value) is _TrackedList:
+            state[name] = list(value)
+    return (_new_object, (type(self)._tracked_base,), state)
+
+# Subclasses that record assignments, by class
+_tracked_classes = {}
+
+def _tracked_class(cls):
+    tracked = _tracked_classes.get(cls)
+    if tracked is None:
+        tracked = _tracked_classes[cls] = type(cls.__name__, (cls,), {
+            '__module__': cls.__module__,
+            '__setattr__': _tracked_setattr,
+            '__getattr__': _tracked_getattr,
+            '__reduce_ex__': _tracked_reduce_ex,
+            '_tracked_base': cls,
+        })
+    return tracked
+
+class _TrackedList(list):
+    """ List of a retained object, whose changes drop the retained bytes """
+    __slots__ = ('_wire_state',)
+
+def _changing(name):
+    method = getattr(list, name)
+    def changing(self, *args, **kwargs):
+        self._wire_state[0] = None
+        return method(self, *args, **kwargs)
+    changing.__name__ = name
+    return changing
+
+for _name in ('__setitem__', '__delitem__', '__setslice__', '__delslice__',
+              '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop',
+              'remove', 'reverse', 'sort'):
+    setattr(_TrackedList, _name, _changing(_name))
+
+def _track(obj, state):
+    # Record the assignments to obj, and move its objects and lists away
+    # until _tracked_getattr tracks them on first use
+    cls = getattr(type(obj), '_tracked_base', type(obj))
+    values = obj.__dict__
+    untracked = values.pop('_untracked', None)
+    for name in cls._container_members:
+        if name in values:
+            if untracked is None:
+                untracked = {}
+            untracked[name] = values.pop(name)
+    values['_wire_state'] = state
+    if untracked:
+        values['_untracked'] = untracked
+    if type(obj) is cls:
+        obj.__class__ = _tracked_class(cls)
+
+class LazyModule(types.ModuleType):
+    """
+    Module whose classes are created on first access
+
+    Modules generated with --python-lazy replace themselves in sys.modules
+    with a LazyModule before their imports, and wrap each class definition
+    in a function named _make_<class>. Looking up a class as an attribute
+    of the module calls that function once and caches the class in both
+    the module globals and the LazyModule.
+
+    Attributes not found in the module globals or its classes are looked
+    up in the modules added with add_fallback, in order.
+    """
+
+    def __init__(self, module):
+        types.ModuleType.__init__(self, module.__name__, module.__doc__)
+        # Python 2 clears the globals of a module when it is freed
+        self.__dict__['_module'] = module
+        self.__dict__['_namespace'] = module.__dict__
+        self.__dict__['_fallbacks'] = []
+
+    def add_fallback(self, module):
+        self._fallbacks.append(module)
+
+    def __getattr__(self, name):
+        namespace = self.__dict__['_namespace']
+        if not name.startswith('_') and '_make_' + name in namespace:
+            # Comes first, as the root class of a module may be named like
+            # the module, which the module imports
+            value = namespace[name] = namespace['_make_' + name]()
+        elif name in namespace:
+            value = namespace[name]
+        else:
+            for module in self.__dict__['_fallbacks']:
+                try:
+                    value = getattr(module, name)
+                    break
+                except AttributeError:
+                    pass
+            else:
+                raise AttributeError("module %s has no attribute %s" % (self.__name__, name))
+        self.__dict__[name] = value
+        return value
+
+    def _names(self):
+        namespace = self._namespace
+        names = set(n for n in namespace if not n.startswith('_'))
+        names.update(n[6:] for n in namespace if n.startswith('_make_'))
+        for module in self._fallbacks:
+            names.update(n for n in dir(module) if not n.startswith('_'))
+        return sorted(names)
+
+    def __dir__(self):
+        return sorted(set(self._names()) | set(self.__dict__) | set(self._namespace))
+
+    @property
+    def __all__(self):
+        # 'from module import *' creates every class
+        return self._names()
+
+class LazySubtypes(dict):
+    """
+    Table of the subclasses of a class of a LazyModule by discriminator
+
+    Starts out empty, with the class names given as 'names', and creates
+    each subclass the first time its discriminator is looked up.
+    """
+
+    def __init__(self, module, names):
+        dict.__init__(self)
+        self.module = module
+        self.names = names
+
+    def __missing__(self, key):
+        subclass = self[key] = getattr(self.module, self.names[key])
+        return subclass
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 def pad_to(alignment, length):
     """
     Return a string of zero bytes that will pad a string of length 'length' to
@@ -29,6 +29,13 @@
 
 :: include('_autogen.py')
 
+:: if lazy:
+# Classes are created on first use, see loxi.generic_util.LazyModule
+import sys
+import loxi.generic_util
+_lazy = sys.modules[__name__] = loxi.generic_util.LazyModule(sys.modules[__name__])
+
+:: #endif
 import action, common, const, message
 :: if version >= 2:
 import instruction
@@ -41,5 +48,9 @@ import meter_band
 import bsn_tlv
 :: #endif
 from const import *
+:: if lazy:
+_lazy.add_fallback(common)
+:: else:
 from common import *
+:: #endif
 from loxi import ProtocolError
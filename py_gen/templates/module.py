@@ -27,10 +27,18 @@
 ::
 :: from loxi_globals import OFVersions
 :: import py_gen.oftype
+:: import py_gen.util as util
 :: include('_copyright.py')
 
 :: include('_autogen.py')
 
+:: if lazy:
+# Classes are created on first use, see loxi.generic_util.LazyModule
+import sys
+import loxi.generic_util
+_lazy = sys.modules[__name__] = loxi.generic_util.LazyModule(sys.modules[__name__])
+
+:: #endif
 import struct
 import loxi
 import const
@@ -52,7 +60,17 @@ import util
 import loxi.generic_util
 
 :: for ofclass in ofclasses:
-:: include('_ofclass.py', ofclass=ofclass)
+:: if lazy:
+:: subclasses = [c for c in ofclasses if c.superclass is ofclass]
+def _make_${ofclass.pyname}():
+:: if ofclass.superclass:
+    ${ofclass.superclass.pyname} = _lazy.${ofclass.superclass.pyname}
+:: #endif
+${util.render_indented('_ofclass.py', '    ', ofclass=ofclass, version=version, lazy=True, subclasses=subclasses)}
+    return ${ofclass.pyname}
+:: else:
+:: include('_ofclass.py', ofclass=ofclass, lazy=False)
+:: #endif
 
 :: #endfor
 
@@ -73,12 +73,48 @@ class OFObject(object):
     """
     Superclass of all OpenFlow classes
     """
+    # Fields that compile_template can patch, by path: (offset, struct format)
+    template_fields = {}
+
+    # Offsets of the OXM matches (OpenFlow 1.2+), by member name
+    template_matches = {}
+
+    # Wire bytes of a message parsed with retain=True, see
+    # loxi.generic_util.retain_wire
+    _wire = None
+
+    # Members holding objects or lists, tracked by retain_wire
+    _container_members = ()
+
     def __init__(self, *args):
         raise NotImplementedError("cannot instantiate abstract class")
 
+    def compile_template(self, *fields):
+        """
+        Serialize this object once and return a loxi.generic_util.PackedTemplate
+        that creates copies of it with the given fields changed, without
+        running pack() again:
+
+            template = flow_add.compile_template('xid', 'cookie', 'match.ipv4_dst')
+            buf = template.pack(1, 0x10, 0x0a000001)
+            buf = template.pack(xid=2, cookie=0x20)
+
+        Fields are the names of scalar members at a fixed offset (see the
+        class's template_fields), including those of fixed-length embedded
+        structs, and the OXMs of an OpenFlow 1.2+ match as 'match.<oxm>' or
+        'match.<oxm>.<member>'. Fields whose change would change the length
+        of the message raise ValueError.
+        """
+        import loxi.generic_util
+        return loxi.generic_util.PackedTemplate(self, fields)
+
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def show(self):
+        """
+        Return a multi-line pretty printed representation of this object.
+        repr() is a single line and much faster, for logging.
+        """
         import loxi.pp
         return loxi.pp.pp(self)
@@ -52,6 +52,12 @@ def pretty_mac(mac):
 def pretty_ipv4(v):
     return "%d.%d.%d.%d" % ((v >> 24) & 0xFF, (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
 
+def pretty_enum(v, names):
+    name = names.get(v)
+    if name is None:
+        return "%#x" % v
+    return name
+
 def pretty_flags(v, flag_names):
     set_flags = []
     for flag_name in flag_names:
@@ -76,12 +82,17 @@ def pretty_wildcards(v):
     return pretty_flags(v, flag_names)
 :: #endif
 
+# Names of the reserved ports by number, built on first use
+_port_names = None
+
 def pretty_port(v):
-    named_ports = [(k,v2) for (k,v2) in const.__dict__.iteritems() if k.startswith('OFPP_')]
-    for (k, v2) in named_ports:
-        if v == v2:
-            return k
-    return v
+    global _port_names
+    if _port_names is None:
+        _port_names = {}
+        for (k, v2) in const.__dict__.iteritems():
+            if k.startswith('OFPP_'):
+                _port_names.setdefault(v2, k)
+    return _port_names.get(v, v)
 
 def pack_port_no(value):
 :: if version == OFVersions.VERSION_1_0:
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+import unittest
+
+try:
+    import loxi
+    import loxi.of13 as ofp
+except ImportError:
+    exit("loxi package not found. Try setting PYTHONPATH.")
+
+try:
+    import loxi.aio
+    from loxi.aio import asyncio
+except ImportError:
+    asyncio = None
+
+class FakeTransport(object):
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def close(self):
+        self.closed = True
+
+class Recorder(loxi.aio.OFProtocol if asyncio else object):
+    def __init__(self, *args, **kwargs):
+        super(Recorder, self).__init__(*args, **kwargs)
+        self.received = []
+
+    def message_received(self, msg):
+        self.received.append(msg)
+
+class StandInSwitch(Recorder):
+    """
+    Answers features and flow stats requests, rejects flow mods to table
+    255 and answers barriers
+    """
+    def message_received(self, msg):
+        Recorder.message_received(self, msg)
+        if isinstance(msg, ofp.message.features_request):
+            self.send(ofp.message.features_reply(xid=msg.xid, datapath_id=0x1234, n_tables=4))
+        elif isinstance(msg, ofp.message.flow_stats_request):
+            for i in range(3):
+                flags = ofp.OFPSF_REPLY_MORE if i < 2 else 0
+                entries = [ofp.flow_stats_entry(cookie=i)]
+                self.send(ofp.message.flow_stats_reply(xid=msg.xid, flags=flags, entries=entries))
+        elif isinstance(msg, ofp.message.flow_add) and msg.table_id == 255:
+            self.send(ofp.message.bad_request_error_msg(xid=msg.xid, code=ofp.OFPBRC_BAD_TABLE_ID))
+        elif isinstance(msg, ofp.message.barrier_request):
+            self.send(ofp.message.barrier_reply(xid=msg.xid))
+
+@unittest.skipIf(asyncio is None, "neither asyncio nor trollius is installed")
+class TestFraming(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.conn = Recorder(ofp, loop=self.loop)
+        self.transport = FakeTransport()
+        self.conn.connection_made(self.transport)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_once(self):
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+    def test_hello(self):
+        self.run_once()
+        self.assertEquals(self.transport.writes, [ofp.message.hello(xid=1).pack()])
+
+    def test_split(self):
+        msgs = [ofp.message.packet_in(xid=5, data="abc"), ofp.message.port_status(xid=6)]
+        data = ''.join([msg.pack() for msg in msgs])
+        for i in range(len(data)):
+            self.conn.data_received(data[i])
+        self.assertEquals(self.conn.received, msgs)
+
+        self.conn.received = []
+        self.conn.data_received(data + data[:3])
+        self.conn.data_received(data[3:])
+        self.assertEquals(self.conn.received, msgs + msgs)
+
+    def test_invalid_length(self):
+        self.conn.data_received("\x04\x00\x00\x04\x00\x00\x00\x00")
+        self.assertTrue(self.transport.closed)
+
+    def test_coalesce(self):
+        xids = [self.conn.send(ofp.message.echo_request()) for _ in range(3)]
+        self.assertEquals(xids, [2, 3, 4])
+        self.assertEquals(self.transport.writes, [])
+        self.run_once()
+        self.assertEquals(self.transport.writes,
+                          [ofp.message.hello(xid=1).pack() +
+                           ''.join([ofp.message.echo_request(xid=xid).pack() for xid in xids])])
+
+    def test_echo(self):
+        self.run_once()
+        self.conn.data_received(ofp.message.echo_request(xid=42, data="x").pack())
+        self.run_once()
+        self.assertEquals(self.transport.writes[-1], ofp.message.echo_reply(xid=42, data="x").pack())
+        self.assertEquals(self.conn.received, [])
+
+    def test_cancelled(self):
+        self.run_once()
+        cancelled = self.conn.request(ofp.message.echo_request())
+        pending = self.conn.request(ofp.message.flow_add(), expect_reply=False)
+        barrier = self.conn.barrier()
+        cancelled.cancel()
+        pending.cancel()
+        # The late replies must not stop the rest of the data
+        data = ofp.message.echo_reply(xid=2).pack() + ofp.message.barrier_reply(xid=4).pack()
+        self.conn.data_received(data)
+        self.assertIsInstance(barrier.result(), ofp.message.barrier_reply)
+        self.assertEquals(self.conn.received, [])
+        self.assertFalse(self.transport.closed)
+
+        # Cancelled requests are forgotten even if no reply comes
+        orphan = self.conn.request(ofp.message.flow_add(), expect_reply=False)
+        orphan.cancel()
+        self.run_once()
+        self.assertEquals(self.conn._requests, {})
+        self.conn.data_received(ofp.message.echo_reply(xid=2).pack())
+        self.assertEquals(self.conn.received, [ofp.message.echo_reply(xid=2)])
+
+    def test_connection_lost(self):
+        future = self.conn.request(ofp.message.echo_request())
+        self.conn.connection_lost(None)
+        self.assertRaises(loxi.aio.ConnectionLost, future.result)
+
+@unittest.skipIf(asyncio is None, "neither asyncio nor trollius is installed")
+class TestStandInSwitch(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.switches = []
+        def switch_factory(ofp, loop):
+            switch = StandInSwitch(ofp, loop=loop)
+            self.switches.append(switch)
+            return switch
+        self.server = self.wait(loxi.aio.listen(ofp, '127.0.0.1', 0, loop=self.loop,
+                                               protocol_factory=switch_factory))
+        port = self.server.sockets[0].getsockname()[1]
+        self.transport, self.conn = self.wait(
+            loxi.aio.connect(ofp, '127.0.0.1', port, loop=self.loop, protocol_factory=Recorder))
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.close()
+        self.wait(self.server.wait_closed())
+        self.loop.close()
+
+    def wait(self, future):
+        return self.loop.run_until_complete(asyncio.wait_for(future, 5, loop=self.loop))
+
+    def test_request(self):
+        reply = self.wait(self.conn.request(ofp.message.features_request()))
+        self.assertIsInstance(reply, ofp.message.features_reply)
+        self.assertEquals(reply.datapath_id, 0x1234)
+        self.assertEquals(self.conn.peer_version, 4)
+
+    def test_multipart(self):
+        replies = self.wait(self.conn.request(ofp.message.flow_stats_request()))
+        self.assertEquals([reply.flags for reply in replies], [1, 1, 0])
+        self.assertEquals([entry.cookie for reply in replies for entry in reply.entries], [0, 1, 2])
+
+    def test_barrier(self):
+        ok = self.conn.request(ofp.message.flow_add(table_id=1), expect_reply=False)
+        bad = self.conn.request(ofp.message.flow_add(table_id=255), expect_reply=False)
+        barrier = self.conn.barrier()
+        after = self.conn.request(ofp.message.flow_add(table_id=2), expect_reply=False)
+        self.assertIsInstance(self.wait(barrier), ofp.message.barrier_reply)
+        self.assertEquals(ok.result(), None)
+        with self.assertRaises(loxi.aio.ErrorReply) as cm:
+            bad.result()
+        self.assertEquals(cm.exception.msg.code, ofp.OFPBRC_BAD_TABLE_ID)
+        self.assertFalse(after.done())
+        self.wait(self.conn.barrier())
+        self.assertTrue(after.done())
+
+    def test_echo(self):
+        switch, = self.switches
+        reply = self.wait(switch.request(ofp.message.echo_request(data="ping")))
+        self.assertEquals(reply.data, "ping")
+
+    def test_unsolicited(self):
+        switch, = self.switches
+        switch.send(ofp.message.packet_in(xid=0, data="pkt"))
+        self.wait(self.conn.request(ofp.message.echo_request()))
+        self.assertEquals([type(msg) for msg in self.conn.received],
+                          [ofp.message.hello, ofp.message.packet_in])
+
+if __name__ == '__main__':
+    unittest.main()
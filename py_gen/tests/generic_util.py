@@ -114,5 +114,57 @@ class TestOFReader(unittest.TestCase):
         child.skip_align()
         self.assertEquals(child.peek('2s')[0], 'qr')
 
+class TestLazyModule(unittest.TestCase):
+    def setUp(self):
+        import types
+        self.created = []
+        def _make_foo():
+            self.created.append('foo')
+            class foo(object):
+                subtypes = loxi.generic_util.LazySubtypes(module, { 1: 'bar' })
+            return foo
+        def _make_bar():
+            self.created.append('bar')
+            class bar(module.foo):
+                pass
+            return bar
+        original = types.ModuleType('lazy_test')
+        original.__dict__.update(_make_foo=_make_foo, _make_bar=_make_bar, x=1)
+        module = loxi.generic_util.LazyModule(original)
+        self.module = module
+
+    def test_create_once(self):
+        self.assertEquals(self.created, [])
+        foo = self.module.foo
+        self.assertEquals(self.created, ['foo'])
+        self.assertIs(self.module.foo, foo)
+        self.assertIs(self.module._namespace['foo'], foo)
+        self.assertEquals(self.created, ['foo'])
+        self.assertEquals(self.module.x, 1)
+
+    def test_subtypes(self):
+        foo = self.module.foo
+        self.assertEquals(self.created, ['foo'])
+        bar = foo.subtypes.get(1)
+        self.assertIs(bar, self.module.bar)
+        self.assertTrue(issubclass(bar, foo))
+        self.assertIs(foo.subtypes[1], bar)
+        self.assertIs(foo.subtypes.get(2), None)
+        self.assertEquals(self.created, ['foo', 'bar'])
+
+    def test_fallback(self):
+        import types
+        other = types.ModuleType('other')
+        other.baz = 2
+        self.module.add_fallback(other)
+        self.assertEquals(self.module.baz, 2)
+        with self.assertRaises(AttributeError):
+            self.module.missing
+
+    def test_names(self):
+        self.assertEquals(self.module.__all__, ['bar', 'foo', 'x'])
+        self.assertIn('foo', dir(self.module))
+        self.assertEquals(self.created, [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -197,7 +197,7 @@ class TestParse(unittest.TestCase):
         assert(msg.xid == 0x12345678)
 
         # Get a list of all concrete message classes
-        test_klasses = [x for x in ofp.message.__dict__.values()
+        test_klasses = [x for x in [getattr(ofp.message, name) for name in dir(ofp.message)]
                         if type(x) == type
                            and issubclass(x, ofp.message.message)
                            and not hasattr(x, 'subtypes')]
@@ -213,6 +213,47 @@ class TestParse(unittest.TestCase):
         msg = ofp.message.parse_message(buf)
         self.assertIsInstance(msg, ofp.message.message)
 
+class TestTemplates(unittest.TestCase):
+    def test_embedded_match(self):
+        actions = [ofp.action.output(port=1)]
+        obj = ofp.message.flow_add(xid=1, match=ofp.match(eth_src=[1, 2, 3, 4, 5, 6], ipv4_dst=1),
+                                   actions=actions)
+        template = obj.compile_template('match.eth_src', 'match.ipv4_dst', 'out_port')
+        expected = ofp.message.flow_add(xid=1, out_port=7, actions=actions,
+                                        match=ofp.match(eth_src=[6, 5, 4, 3, 2, 1], ipv4_dst=2))
+        self.assertEquals(expected.pack(), template.pack([6, 5, 4, 3, 2, 1], 2, 7))
+
+    def test_not_patchable(self):
+        obj = ofp.message.flow_add(xid=1)
+        self.assertRaises(ValueError, obj.compile_template, 'actions')
+        self.assertRaises(ValueError, ofp.action.output().compile_template, 'port')
+
+class TestArrays(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest("numpy not installed")
+
+    def test_table_stats_reply(self):
+        entries = [ofp.table_stats_entry(table_id=i, name="table%d" % i, wildcards=0x3fffff,
+                                         active_count=i * 100, matched_count=2**33)
+                   for i in range(3)]
+        buf = ofp.message.table_stats_reply(xid=1, entries=entries).pack()
+        msg = ofp.message.table_stats_reply.unpack_with_arrays(OFReader(buf))
+        self.assertEquals([0, 1, 2], list(msg.entries['table_id']))
+        self.assertEquals(["table0", "table1", "table2"], list(msg.entries['name']))
+        self.assertEquals([0x3fffff] * 3, list(msg.entries['wildcards']))
+        self.assertEquals([0, 100, 200], list(msg.entries['active_count']))
+        self.assertEquals([2**33] * 3, list(msg.entries['matched_count']))
+
+    def test_port_no(self):
+        # 16 bit port numbers in OpenFlow 1.0
+        entry = ofp.port_stats_entry(port_no=0xfffe, rx_packets=5)
+        array = ofp.common.port_stats_entry.unpack_array(OFReader(entry.pack()))
+        self.assertEquals(0xfffe, array[0]['port_no'])
+        self.assertEquals(5, array[0]['rx_packets'])
+
 class TestUtils(unittest.TestCase):
     def test_pretty_wildcards(self):
         self.assertEquals("OFPFW_ALL", ofp.util.pretty_wildcards(ofp.OFPFW_ALL))
@@ -236,7 +277,7 @@ class TestAll(unittest.TestCase):
     def setUp(self):
         mods = [ofp.action,ofp.message,ofp.common]
         self.klasses = [klass for mod in mods
-                              for klass in mod.__dict__.values()
+                              for klass in [getattr(mod, name) for name in dir(mod)]
                               if isinstance(klass, type) and
                                  issubclass(klass, loxi.OFObject) and
                                  not hasattr(klass, 'subtypes')]
@@ -283,5 +324,13 @@ class TestAll(unittest.TestCase):
             else:
                 fn()
 
+    def test_repr(self):
+        for klass in self.klasses:
+            obj = klass()
+            if hasattr(obj, "xid"): obj.xid = 42
+            text = repr(obj)
+            self.assertTrue(text.startswith(klass.__name__ + '('), text)
+            self.assertNotIn('\n', text)
+
 if __name__ == '__main__':
     unittest.main()
@@ -66,7 +66,7 @@ class TestAllOF11(unittest.TestCase):
     def setUp(self):
         mods = [ofp.action,ofp.message,ofp.common]
         self.klasses = [klass for mod in mods
-                              for klass in mod.__dict__.values()
+                              for klass in [getattr(mod, name) for name in dir(mod)]
                               if isinstance(klass, type) and
                                  issubclass(klass, loxi.OFObject) and
                                  not hasattr(klass, 'subtypes')]
@@ -25,6 +25,8 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # EPL for the specific language governing permissions and limitations
 # under the EPL.
+import copy
+import pickle
 import unittest
 from testutil import test_serialization
 from testutil import add_datafiles_tests
@@ -76,7 +78,7 @@ class TestAllOF13(unittest.TestCase):
     def setUp(self):
         mods = [ofp.action,ofp.message,ofp.common,ofp.oxm]
         self.klasses = [klass for mod in mods
-                              for klass in mod.__dict__.values()
+                              for klass in [getattr(mod, name) for name in dir(mod)]
                               if isinstance(klass, type) and
                                  issubclass(klass, loxi.OFObject) and
                                  not hasattr(klass, 'subtypes')]
@@ -126,5 +128,205 @@ class TestAllOF13(unittest.TestCase):
             else:
                 fn()
 
+    def test_repr(self):
+        for klass in self.klasses:
+            obj = klass()
+            if hasattr(obj, "xid"): obj.xid = 42
+            text = repr(obj)
+            self.assertTrue(text.startswith(klass.__name__ + '('), text)
+            self.assertNotIn('\n', text)
+
+class TestRepr(unittest.TestCase):
+    def test_flow_add(self):
+        match = ofp.match([ofp.oxm.in_port(3), ofp.oxm.eth_dst([1, 2, 3, 4, 5, 0xab])])
+        instructions = [ofp.instruction.apply_actions([ofp.action.output(port=ofp.OFPP_CONTROLLER)])]
+        msg = ofp.message.flow_add(xid=0x12, cookie=5, flags=ofp.OFPFF_SEND_FLOW_REM|ofp.OFPFF_RESET_COUNTS,
+                                   out_port=ofp.OFPP_ANY, match=match, instructions=instructions)
+        self.assertEquals(repr(msg),
+            "flow_add(xid=0x12, cookie=0x5, cookie_mask=0x0, table_id=0x0, idle_timeout=0x0, "
+            "hard_timeout=0x0, priority=0x0, buffer_id=0x0, out_port=OFPP_ANY, out_group=0x0, "
+            "flags=OFPFF_SEND_FLOW_REM|OFPFF_RESET_COUNTS, "
+            "match=match_v3(oxm_list=[in_port(value=3), eth_dst(value=01:02:03:04:05:ab)]), "
+            "instructions=[apply_actions(actions=[output(port=OFPP_CONTROLLER, max_len=0x0)])])")
+
+    def test_enums(self):
+        msg = ofp.message.bad_request_error_msg(code=ofp.OFPBRC_BAD_LEN, data="ab")
+        self.assertEquals(repr(msg), "bad_request_error_msg(xid=None, code=OFPBRC_BAD_LEN, data='ab')")
+        msg = ofp.message.bad_request_error_msg(code=0x1234)
+        self.assertEquals(repr(msg), "bad_request_error_msg(xid=None, code=0x1234, data='')")
+
+class TestTemplates(unittest.TestCase):
+    def flow_add(self, xid=1, cookie=5, in_port=3, ipv4_dst=0x0a000000, mask=0xffffff00):
+        match = ofp.match([ofp.oxm.in_port(in_port), ofp.oxm.eth_type(0x800),
+                           ofp.oxm.ipv4_dst_masked(ipv4_dst, mask)])
+        instructions = [ofp.instruction.apply_actions([ofp.action.output(port=2)])]
+        return ofp.message.flow_add(xid=xid, cookie=cookie, priority=10, match=match,
+                                    instructions=instructions)
+
+    def test_scalars(self):
+        template = self.flow_add().compile_template('xid', 'cookie')
+        self.assertEquals(self.flow_add(xid=7, cookie=0x99).pack(), template.pack(7, 0x99))
+        self.assertEquals(self.flow_add(xid=8).pack(), template.pack(xid=8))
+        self.assertEquals(self.flow_add().pack(), template.pack())
+
+    def test_oxms(self):
+        template = self.flow_add().compile_template('match.in_port', 'match.ipv4_dst_masked',
+                                                    'match.ipv4_dst_masked.value_mask')
+        self.assertEquals(self.flow_add(in_port=9, ipv4_dst=0x0b000000, mask=0xffff0000).pack(),
+                          template.pack(9, 0x0b000000, 0xffff0000))
+        self.assertEquals(self.flow_add(in_port=4).pack(), template.pack(**{'match.in_port': 4}))
+
+    def test_not_patchable(self):
+        obj = self.flow_add()
+        # these change the length or layout of the message
+        for name in ['version', 'length', 'match', 'instructions', 'match.tcp_dst']:
+            self.assertRaises(ValueError, obj.compile_template, name)
+
+    def test_wrong_values(self):
+        template = self.flow_add().compile_template('xid')
+        self.assertRaises(TypeError, template.pack, 1, 2)
+        self.assertRaises(TypeError, template.pack, cookie=1)
+
+class TestRetainWire(unittest.TestCase):
+    def setUp(self):
+        match = ofp.match([ofp.oxm.in_port(3), ofp.oxm.eth_type(0x800)])
+        instructions = [ofp.instruction.apply_actions([ofp.action.output(port=2)])]
+        self.buf = ofp.message.flow_add(xid=1, cookie=5, priority=10, match=match,
+                                        instructions=instructions).pack()
+
+    def test_clean(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        self.assertIs(msg.pack(), self.buf)
+        self.assertEquals(msg, ofp.message.parse_message(self.buf))
+
+    def test_xid(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.xid = 0x12345678
+        expected = ofp.message.parse_message(self.buf)
+        expected.xid = 0x12345678
+        self.assertEquals(msg.pack(), expected.pack())
+        self.assertIsNot(msg._wire, None)
+
+    def test_assignment(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.cookie = 6
+        expected = ofp.message.parse_message(self.buf)
+        expected.cookie = 6
+        self.assertEquals(msg.pack(), expected.pack())
+        self.assertIs(msg._wire, None)
+
+    def test_nested_assignment(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.match.oxm_list[0].value = 99
+        self.assertEquals(ofp.message.parse_message(msg.pack()).match.oxm_list[0].value, 99)
+        self.assertIs(msg._wire, None)
+
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.instructions[0].actions[0].port = 5
+        self.assertEquals(ofp.message.parse_message(msg.pack()).instructions[0].actions[0].port, 5)
+
+    def test_list_change(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.instructions[0].actions.append(ofp.action.output(port=4))
+        self.assertEquals(ofp.message.parse_message(msg.pack()), msg)
+        self.assertIs(msg._wire, None)
+
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.match.oxm_list[0] = ofp.oxm.in_port(9)
+        self.assertEquals(ofp.message.parse_message(msg.pack()).match.oxm_list[0].value, 9)
+
+    def test_equality(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        plain = ofp.message.parse_message(self.buf)
+        self.assertEquals(plain, msg)
+        self.assertEquals(plain.match, msg.match)
+        self.assertNotEqual(msg, ofp.message.flow_delete())
+        self.assertIsInstance(msg, ofp.message.flow_add)
+
+    def test_release(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        msg.instructions[0].actions.append(ofp.action.output(port=4))
+        loxi.generic_util.release_wire(msg)
+        self.assertNotEqual(msg.pack(), self.buf)
+        self.assertEquals(ofp.message.parse_message(msg.pack()), msg)
+
+    def test_copy(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        clone = copy.copy(msg)
+        self.assertIs(type(clone), ofp.message.flow_add)
+        self.assertIs(clone._wire, None)
+        self.assertEquals(clone, msg)
+        clone.priority = 20
+        for clone in [copy.deepcopy(msg), pickle.loads(pickle.dumps(msg, 2))]:
+            self.assertIs(type(clone), ofp.message.flow_add)
+            self.assertEquals(clone, msg)
+            clone.match.oxm_list[0].value = 99
+        self.assertIs(msg.pack(), self.buf)
+
+    def test_retain_again(self):
+        msg = ofp.message.parse_message(self.buf, retain=True)
+        loxi.generic_util.release_wire(msg)
+        loxi.generic_util.retain_wire(msg, self.buf)
+        self.assertIs(msg.pack(), self.buf)
+
+    def test_range(self):
+        data = "abc" + self.buf + "def"
+        msg = ofp.message.parse_message(self.buf)
+        loxi.generic_util.retain_wire(msg, buffer(data), 3, len(self.buf))
+        self.assertEquals(msg.pack(), self.buf)
+        msg.xid = 2
+        self.assertEquals(msg.pack(), self.buf[:7] + "\x02" + self.buf[8:])
+
+    def test_not_retained(self):
+        msg = ofp.message.parse_message(self.buf)
+        self.assertIs(msg._wire, None)
+        self.assertEquals(msg.pack(), self.buf)
+
+class TestArrays(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest("numpy not installed")
+
+    def test_port_stats_reply(self):
+        entries = [ofp.port_stats_entry(port_no=i, rx_packets=i * 10, tx_bytes=2**40 + i,
+                                        duration_sec=i, duration_nsec=7)
+                   for i in range(1, 5)]
+        buf = ofp.message.port_stats_reply(xid=7, flags=1, entries=entries).pack()
+        msg = ofp.message.port_stats_reply.unpack_with_arrays(OFReader(buf))
+        self.assertEquals(7, msg.xid)
+        self.assertEquals(1, msg.flags)
+        self.assertEquals(4, len(msg.entries))
+        self.assertEquals([1, 2, 3, 4], list(msg.entries['port_no']))
+        self.assertEquals([10, 20, 30, 40], list(msg.entries['rx_packets']))
+        self.assertEquals([2**40 + i for i in range(1, 5)], list(msg.entries['tx_bytes']))
+        self.assertEquals([7] * 4, list(msg.entries['duration_nsec']))
+
+    def test_native(self):
+        entry = ofp.queue_stats_entry(port_no=2, queue_id=3, tx_bytes=0x0102030405060708)
+        reader = OFReader(entry.pack() * 3)
+        array = ofp.common.queue_stats_entry.unpack_array(reader, native=True)
+        self.assertTrue(reader.is_empty())
+        self.assertTrue(array.dtype.isnative)
+        self.assertEquals([0x0102030405060708] * 3, list(array['tx_bytes']))
+
+    def test_byte_arrays(self):
+        desc = ofp.port_desc(port_no=3, hw_addr=[1, 2, 3, 4, 5, 6], name="eth3")
+        array = ofp.common.port_desc.unpack_array(OFReader(desc.pack()))
+        self.assertEquals("eth3", array[0]['name'])
+        self.assertEquals([1, 2, 3, 4, 5, 6], list(array[0]['hw_addr']))
+
+    def test_empty(self):
+        self.assertEquals(0, len(ofp.common.port_stats_entry.unpack_array(OFReader(""))))
+
+    def test_partial_entry(self):
+        with self.assertRaisesRegexp(loxi.ProtocolError, "whole number"):
+            ofp.common.port_stats_entry.unpack_array(OFReader("\x00" * 113))
+
+    def test_variable_length(self):
+        # flow stats entries have a variable length match and instructions
+        self.assertFalse(hasattr(ofp.common.flow_stats_entry, 'unpack_array'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -30,6 +30,7 @@ Utilities for generating the target Python code
 """
 
 import os
+from StringIO import StringIO
 import loxi_globals
 import template_utils
 import loxi_utils.loxi_utils as utils
@@ -39,5 +40,15 @@ templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templ
 def render_template(out, name, **context):
     template_utils.render_template(out, name, [templates_dir], context)
 
+def render_indented(name, indent, **context):
+    """
+    Render a template to a string with each non-blank line indented by
+    'indent', to nest the generated code in a block
+    """
+    out = StringIO()
+    render_template(out, name, **context)
+    return ''.join([line.strip() and indent + line or line
+                    for line in out.getvalue().splitlines(True)])
+
 def render_static(out, name):
     template_utils.render_static(out, name, [templates_dir])
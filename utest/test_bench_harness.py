@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+import sys
+import os
+import struct
+import unittest
+
+root_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
+sys.path.insert(0, root_dir)
+
+from loxi_bench import backends, corpus, report
+from loxi_bench.backends import Result
+
+def result(backend='c', op='parse', name='of13/hello.data', cls='of_hello', ns_per_op=100.0):
+    return Result(backend, op, name, cls, 4, 1, 8, ns_per_op, None, None)
+
+class CorpusTests(unittest.TestCase):
+    def test_split_messages(self):
+        msgs = [struct.pack("!BBHL", 4, 0, 8, 1), struct.pack("!BBHL", 4, 2, 11, 2) + "abc"]
+        self.assertEquals(msgs, corpus.split_messages("".join(msgs)))
+        self.assertEquals([], corpus.split_messages(""))
+        self.assertRaises(ValueError, corpus.split_messages, msgs[1][:10])
+        self.assertRaises(ValueError, corpus.split_messages, msgs[0][:7])
+
+    def test_test_vectors(self):
+        vectors = corpus.test_vectors("of13/packet_in")
+        self.assertTrue(vectors)
+        for v in vectors:
+            self.assertEquals(4, v.version)
+            self.assertTrue(v.binary)
+
+class ParseTests(unittest.TestCase):
+    def test_locibench(self):
+        data = { 'min_time': 0.01, 'results': [
+            { 'op': 'wrap', 'name': 'of13/hello.data', 'class': 'of_hello', 'version': 4,
+              'iterations': 1024, 'messages': 1, 'bytes': 8, 'ns_per_op': 10.0,
+              'ops_per_sec': 1e8, 'allocs_per_op': 0.0 },
+            { 'op': 'new_delete', 'name': 'of_hello', 'class': 'of_hello', 'version': 4,
+              'iterations': 1024, 'messages': 0, 'bytes': 0, 'ns_per_op': 50.0,
+              'ops_per_sec': 2e7, 'allocs_per_op': 2.0 } ] }
+        results = backends.parse_locibench(data)
+        self.assertEquals([Result('c', 'wrap', 'of13/hello.data', 'of_hello', 4, 1, 8, 10.0, 0.0, None)],
+                          results)
+        self.assertEquals(1e8, results[0].msgs_per_sec)
+        self.assertEquals(8e8, results[0].bytes_per_sec)
+
+    def test_jmh(self):
+        vector = corpus.Vector('of13/hello.data', 4, { 'binary': '\x00' * 8 })
+        workload = corpus.Workload('workload/of13/burst.bin', '/out/workload/of13/burst.bin', 4, 100, 800)
+        data = [
+            { 'benchmark': 'org.projectfloodlight.openflow.protocol.ver13.OFHelloVer13Bench.read',
+              'params': { 'corpus': 'of13/hello.data', 'ofClass': 'of_hello' },
+              'primaryMetric': { 'score': 20.0, 'scoreUnit': 'ops/us' },
+              'secondaryMetrics': { u'\u00b7gc.alloc.rate.norm': { 'score': 64.0, 'scoreUnit': 'B/op' } } },
+            { 'benchmark': 'org.projectfloodlight.openflow.protocol.ver13.OFHelloVer13Bench.equalsCopy',
+              'params': { 'corpus': 'of13/hello.data', 'ofClass': 'of_hello' },
+              'primaryMetric': { 'score': 50.0, 'scoreUnit': 'ops/us' } },
+            { 'benchmark': 'org.projectfloodlight.openflow.protocol.WorkloadBench.write',
+              'params': { 'workload': '/out/workload/of13/burst.bin' },
+              'primaryMetric': { 'score': 2.0, 'scoreUnit': 'ops/ms' } } ]
+        results = backends.parse_jmh(data, [vector], [workload])
+        self.assertEquals([
+            Result('java', 'parse', 'of13/hello.data', 'of_hello', 4, 1, 8, 50.0, None, 64.0),
+            Result('java', 'serialize', 'workload/of13/burst.bin', None, 4, 100, 800, 500000.0, None, None)],
+            results)
+
+class ReportTests(unittest.TestCase):
+    def test_fill_classes(self):
+        results = report.fill_classes([result(backend='java', cls=None), result()])
+        self.assertEquals(['of_hello', 'of_hello'], [r.cls for r in results])
+
+    def test_json(self):
+        results = [result(), result(backend='python', ns_per_op=1000.0)]
+        data = report.to_json(results)
+        self.assertEquals(1e7, data['results'][0]['msgs_per_sec'])
+        self.assertEquals(results, report.from_json(data))
+
+    def test_compare(self):
+        baseline = [result(), result(op='build'), result(backend='java')]
+        current = [result(ns_per_op=105.0), result(op='build', ns_per_op=125.0),
+                   result(backend='python', ns_per_op=1000.0)]
+        regressions = report.compare(baseline, current, 0.10)
+        self.assertEquals([(baseline[1], current[1])], regressions)
+        self.assertEquals([], report.compare(baseline, current, 0.25))
+
+    def test_format_table(self):
+        table = report.format_table([result(), result(backend='python', ns_per_op=1000.0)])
+        self.assertTrue(table.startswith("of_hello (wire version 4)"))
+        self.assertTrue("10.0M" in table)
+        self.assertTrue("1.0M" in table)
+
+if __name__ == '__main__':
+    unittest.main()
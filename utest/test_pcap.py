@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+import sys
+import os
+import unittest
+
+root_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
+sys.path.insert(0, root_dir)
+
+import struct
+from StringIO import StringIO
+
+from loxi_utils.pcap import PcapWriter, OPENFLOW_PORT
+
+class PcapWriterTest(unittest.TestCase):
+    def test_records(self):
+        out = StringIO()
+        writer = PcapWriter(out)
+        payloads = ["\x04\x00\x00\x08\x00\x00\x00\x01", "\x04\x02\x00\x0a\x00\x00\x00\x02ab"]
+        for payload in payloads:
+            writer.write(payload)
+        data = out.getvalue()
+
+        magic, major, minor, _, _, snaplen, linktype = struct.unpack("<IHHiIII", data[:24])
+        self.assertEquals((magic, major, minor, linktype), (0xa1b2c3d4, 2, 4, 1))
+
+        offset = 24
+        seq = 1
+        for payload in payloads:
+            _, _, incl_len, orig_len = struct.unpack("<IIII", data[offset:offset+16])
+            frame = data[offset+16:offset+16+incl_len]
+            self.assertEquals(incl_len, orig_len)
+            self.assertEquals(incl_len, 14 + 20 + 20 + len(payload))
+            self.assertEquals(frame[12:14], "\x08\x00")
+            dst_port, frame_seq = struct.unpack("!xxHI", frame[34:42])
+            self.assertEquals(dst_port, OPENFLOW_PORT)
+            self.assertEquals(frame_seq, seq)
+            self.assertEquals(frame[54:], payload)
+            seq += len(payload)
+            offset += 16 + incl_len
+        self.assertEquals(offset, len(data))
+
+if __name__ == '__main__':
+    unittest.main()
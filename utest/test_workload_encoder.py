@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+import sys
+import os
+import struct
+import unittest
+
+root_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
+sys.path.insert(0, root_dir)
+
+import loxi_globals
+import loxi_front_end.parser as parser
+import loxi_front_end.frontend as frontend
+import loxi_ir.ir as ir
+from workload_gen.encoder import Encoder, EncodeError
+
+source = """
+#version 4
+
+enum ofp_type(wire_type=uint8_t) {
+    OFPT_HELLO = 0,
+    OFPT_ECHO_REQUEST = 2,
+};
+
+struct of_header {
+    uint8_t version;
+    uint8_t type == ?;
+    uint16_t length;
+    uint32_t xid;
+};
+
+struct of_echo_request : of_header {
+    uint8_t version;
+    uint8_t type == 2;
+    uint16_t length;
+    uint32_t xid;
+    of_octets_t data;
+};
+
+struct of_tlv(align=8) {
+    uint16_t type == 7;
+    uint16_t length;
+    uint16_t key_length;
+    pad(2);
+    of_octets_t key;
+};
+
+struct of_padded(align=8, length_includes_align=True) {
+    uint16_t type == 8;
+    uint16_t length;
+    uint32_t value;
+    of_octets_t data;
+};
+"""
+
+class EncoderTests(unittest.TestCase):
+    def setUp(self):
+        self.saved_ir = loxi_globals.ir
+        version = ir.OFVersion("1.3", 4)
+        ofinput = frontend.create_ofinput("test.dat", parser.parse(source))
+        loxi_globals.ir = { version: ir.build_protocol(version, [ofinput]) }
+        self.encoder = Encoder(version)
+
+    def tearDown(self):
+        loxi_globals.ir = self.saved_ir
+
+    def test_message(self):
+        data = self.encoder.encode("of_echo_request", xid=0x12345678, data="abc")
+        self.assertEquals(struct.pack("!BBHL", 4, 2, 11, 0x12345678) + "abc", data)
+
+    def test_defaults(self):
+        self.assertEquals(struct.pack("!BBHL", 4, 2, 8, 0), self.encoder.encode("of_echo_request"))
+
+    def test_field_length_and_external_alignment(self):
+        data = self.encoder.encode("of_tlv", key="abcde")
+        # length excludes the trailing alignment padding
+        self.assertEquals(struct.pack("!HHH2x", 7, 13, 5) + "abcde" + "\x00" * 3, data)
+
+    def test_internal_alignment(self):
+        data = self.encoder.encode("of_padded", value=1, data="ab")
+        # length includes the trailing alignment padding
+        self.assertEquals(struct.pack("!HHL", 8, 16, 1) + "ab" + "\x00" * 6, data)
+
+    def test_enum_value(self):
+        self.assertEquals(2, self.encoder.enum_value("OFPT_ECHO_REQUEST"))
+        self.assertRaises(EncodeError, self.encoder.enum_value, "OFPT_NONE")
+
+    def test_errors(self):
+        self.assertRaises(EncodeError, self.encoder.encode, "of_header")
+        self.assertRaises(EncodeError, self.encoder.encode, "of_nonexistent")
+        self.assertRaises(EncodeError, self.encoder.encode, "of_echo_request", bogus=1)
+        self.assertRaises(EncodeError, self.encoder.encode, "of_tlv", key_length=1)
+
+if __name__ == '__main__':
+    unittest.main()
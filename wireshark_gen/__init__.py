@@ -26,6 +26,7 @@
 # under the EPL.
 
 import os
+import struct
 from collections import namedtuple
 import loxi_utils.loxi_utils as utils
 import loxi_front_end
@@ -33,6 +34,8 @@ import loxi_globals
 from loxi_ir import *
 import field_info
 import template_utils
+import test_data
+from loxi_utils import pcap
 
 templates_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'templates')
 
@@ -54,6 +57,10 @@ def get_reader(version, cls, m):
         return "read_" + enum.params['wire_type']
     elif (cls.name, m.name) in field_info.reader_overrides:
         return field_info.reader_overrides[(cls.name, m.name)]
+    elif m.oftype in utils.versioned_wiretypes:
+        # resolved at generation time, so that the dissectors do not branch
+        # on the version for every field
+        return "read_" + utils.lookup_versioned_wiretype(m.oftype, version)
     else:
         return "read_" + m.oftype.replace(')', '').replace('(', '_')
 
@@ -114,6 +121,41 @@ def create_fields():
 
     return r
 
+def bench_messages():
+    """
+    Return the binary OpenFlow messages in test_data, for the benchmark capture
+
+    Vectors of other objects (actions, OXMs, ...) are left out; they cannot
+    be dissected at the top level.
+    """
+    wire_versions = dict((v.version.replace(".", ""), v.wire_version) for v in loxi_globals.ir)
+    r = []
+    for name in test_data.list_files():
+        dotless_version = name.split('/')[0][2:]
+        if dotless_version not in wire_versions:
+            continue
+        binary = test_data.read(name).get('binary')
+        if binary is None or len(binary) < 8:
+            continue
+        version, length = struct.unpack("!BxH", binary[:4])
+        if version == wire_versions[dotless_version] and length == len(binary):
+            r.append(binary)
+    return r
+
+def generate_bench_capture(install_dir, repeat=100):
+    """
+    Write a canned capture of the test_data messages, repeated 'repeat' times
+
+    Replaying it through tshark (see the bench-wireshark make target) measures
+    the dissection cost per message.
+    """
+    messages = bench_messages()
+    with template_utils.open_output(install_dir, 'wireshark/bench.pcap') as out:
+        writer = pcap.PcapWriter(out)
+        for i in range(repeat):
+            for message in messages:
+                writer.write(message)
+
 def generate(install_dir):
     context = {
         'fields': create_fields(),
@@ -121,3 +163,5 @@ def generate(install_dir):
 
     with template_utils.open_output(install_dir, 'wireshark/openflow.lua') as out:
         template_utils.render_template(out, "openflow.lua", [templates_dir], context)
+
+    generate_bench_capture(install_dir)
@@ -41,31 +41,31 @@
 function ${name}(reader, subtree)
 :: field_length_members = []
 :: if ofclass.virtual:
-    return ${ofclass.name}_v${version.wire_version}_dissectors[reader.peek(${ofclass.discriminator.offset},${ofclass.discriminator.length}):uint()](reader, subtree)
+    return ${ofclass.name}_v${version.wire_version}_dissectors[reader:peek_uint(${ofclass.discriminator.offset},${ofclass.discriminator.length})](reader, subtree)
 :: else:
 :: if not ofclass.is_fixed_length:
-    local _length = reader.peek(${ofclass.length_member.offset}, ${ofclass.length_member.base_length}):uint()
+    local _length = reader:peek_uint(${ofclass.length_member.offset}, ${ofclass.length_member.base_length})
     local orig_reader = reader
-    reader = orig_reader.slice(_length)
+    reader = orig_reader:slice(_length)
 :: #endif
 :: for m in ofclass.members:
 :: if isinstance(m, OFPadMember):
-    reader.skip(${m.length})
+    reader:skip(${m.length})
 :: continue
 :: #endif
 :: if isinstance(m, OFFieldLengthMember):
-    local _${m.field_name}_length = reader.peek(0, ${m.base_length}):uint()
+    local _${m.field_name}_length = reader:peek_uint(0, ${m.base_length})
 :: field_length_members.append(m.field_name)
 :: #endif
 :: if m.oftype.startswith("list"):
 :: class_name = m.oftype.replace('_t)', '').replace('(', '').replace('list', '')
 :: if m.name in field_length_members:
-    read_list(reader.slice(_${m.name}_length), dissect_${class_name}_v${version.wire_version}, subtree, '${class_name}')
+    read_list(reader:slice(_${m.name}_length), dissect_${class_name}_v${version.wire_version}, subtree, '${class_name}')
 :: else:
     read_list(reader, dissect_${class_name}_v${version.wire_version}, subtree, '${class_name}')
 :: #endif
 :: if ofclass.has_external_alignment:
-    orig_reader.skip_align()
+    orig_reader:skip_align()
 :: #endif
 :: else:
 :: field_name = make_field_name(version, ofclass.name, m.name)
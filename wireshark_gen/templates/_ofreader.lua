@@ -25,48 +25,63 @@
 :: # EPL for the specific language governing permissions and limitations
 :: # under the EPL.
 ::
+-- Reader over a TvbRange. The methods are shared through the metatable, and
+-- slices share the TvbRange of their parent: a reader only tracks its own
+-- numeric bounds [base, limit) and current offset within the buffer.
 OFReader = {}
-OFReader.new = function(buf, offset)
-    local self = {}
+OFReader.__index = OFReader
+
+local setmetatable = setmetatable
+local floor = math.floor
+
+function OFReader.new(buf, offset, limit)
     offset = offset or 0
+    return setmetatable({ buf = buf, base = offset, offset = offset, limit = limit or buf:len() }, OFReader)
+end
+
+function OFReader:read(len)
+    local r = self.buf(self.offset, len)
+    self.offset = self.offset + len
+    return r
+end
+
+function OFReader:read_all()
+    local r = self.buf(self.offset, self.limit - self.offset)
+    self.offset = self.limit
+    return r
+end
 
-    self.read = function(len)
-        local r = buf(offset, len)
-        offset = offset + len
-        return r
-    end
+function OFReader:peek(off, len)
+    return self.buf(self.offset + off, len)
+end
 
-    self.read_all = function()
-        local r = buf(offset, buf:len() - offset)
-        offset = buf:len()
-        return r
-    end
+function OFReader:peek_uint(off, len)
+    return self.buf(self.offset + off, len):uint()
+end
 
-    self.peek = function(off, len)
-        return buf(offset + off, len)
-    end
+function OFReader:peek_all(off)
+    return self.buf(self.offset + off, self.limit - self.offset - off)
+end
 
-    self.peek_all = function(off)
-        return buf(offset + off, buf:len() - offset - off)
-    end
+function OFReader:skip(len)
+    self.offset = self.offset + len
+end
 
-    self.skip = function(len)
-        offset = offset + len
-    end
+function OFReader:skip_all()
+    self.offset = self.limit
+end
 
-    self.is_empty = function()
-        return offset == buf:len()
-    end
+function OFReader:is_empty()
+    return self.offset == self.limit
+end
 
-    self.slice = function(len)
-        r = OFReader.new(buf(offset, len))
-        offset = offset + len
-        return r
-    end
-    
-    self.skip_align = function()
-        offset = math.floor((offset + 7)/8)*8
-    end
+function OFReader:slice(len)
+    local offset = self.offset
+    self.offset = offset + len
+    return OFReader.new(self.buf, offset, offset + len)
+end
 
-    return self
+function OFReader:skip_align()
+    local base = self.base
+    self.offset = base + floor((self.offset - base + 7)/8)*8
 end
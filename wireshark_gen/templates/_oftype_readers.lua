@@ -26,7 +26,7 @@
 :: # under the EPL.
 
 function read_scalar(reader, subtree, field_name, length)
-    subtree:add(fields[field_name], reader.read(length))
+    subtree:add(fields[field_name], reader:read(length))
 end
 
 function read_uint8_t(reader, version, subtree, field_name)
@@ -54,8 +54,8 @@ function read_of_checksum_128_t(reader, version, subtree, field_name)
 end
 
 function read_of_octets_t(reader, version, subtree, field_name)
-    if not reader.is_empty() then
-        subtree:add(fields[field_name], reader.read_all())
+    if not reader:is_empty() then
+        subtree:add(fields[field_name], reader:read_all())
     end
 end
 
@@ -63,30 +63,19 @@ function read_list_of_hello_elem_t(reader, version, subtree, field_name)
     -- TODO
 end
 
-function read_of_match_t(reader, version, subtree, field_name)
-    if version == 1 then
-        dissect_of_match_v1_v1(reader, subtree:add("of_match"))
-    elseif version == 2 then
-        dissect_of_match_v2_v2(reader, subtree:add("of_match"))
-    elseif version >= 3 then
-        dissect_of_match_v3_v3(reader, subtree:add("of_match"))
-    end
+-- of_match_t, of_wc_bmap_t, of_port_no_t and of_fm_cmd_t are version
+-- dependent; see field_info.versioned_readers
+
+function read_of_match_v1_t(reader, version, subtree, field_name)
+    dissect_of_match_v1_v1(reader, subtree:add("of_match"))
 end
 
-function read_of_wc_bmap_t(reader, version, subtree, field_name)
-    if version <= 2 then
-        read_scalar(reader, subtree, field_name, 4)
-    else
-        read_scalar(reader, subtree, field_name, 8)
-    end
+function read_of_match_v2_t(reader, version, subtree, field_name)
+    dissect_of_match_v2_v2(reader, subtree:add("of_match"))
 end
 
-function read_of_port_no_t(reader, version, subtree, field_name)
-    if version == 1 then
-        read_scalar(reader, subtree, field_name, 2)
-    else
-        read_scalar(reader, subtree, field_name, 4)
-    end
+function read_of_match_v3_t(reader, version, subtree, field_name)
+    dissect_of_match_v3_v3(reader, subtree:add("of_match"))
 end
 
 function read_of_port_name_t(reader, version, subtree, field_name)
@@ -105,14 +94,6 @@ function read_of_ipv6_t(reader, version, subtree, field_name)
     read_scalar(reader, subtree, field_name, 16)
 end
 
-function read_of_fm_cmd_t(reader, version, subtree, field_name)
-    if version == 1 then
-        read_scalar(reader, subtree, field_name, 2)
-    else
-        read_scalar(reader, subtree, field_name, 1)
-    end
-end
-
 function read_of_desc_str_t(reader, version, subtree, field_name)
     read_scalar(reader, subtree, field_name, 256)
 end
@@ -126,28 +107,33 @@ function read_of_table_name_t(reader, version, subtree, field_name)
 end
 
 function read_of_port_desc_t(reader, version, subtree, field_name)
-    if reader.is_empty() then
+    if reader:is_empty() then
         return
     end
-    local child_subtree = subtree:add(fields[field_name], reader.peek_all(0))
+    local child_subtree = subtree:add(fields[field_name], reader:peek_all(0))
     local info = of_port_desc_dissectors[version](reader, child_subtree)
     child_subtree:set_text(info)
 end
 
 function read_of_oxm_t(reader, version, subtree, field_name)
-    if reader.is_empty() then
+    if reader:is_empty() then
         return
     end
-    local child_subtree = subtree:add(fields[field_name], reader.peek_all(0))
+    local child_subtree = subtree:add(fields[field_name], reader:peek_all(0))
     local info = of_oxm_dissectors[version](reader, child_subtree)
     child_subtree:set_text(info)
 end
 
 function read_list(reader, dissector, subtree, field_name)
-    if not reader.is_empty() then
-        local list_subtree = subtree:add(field_name .. " list", reader.peek_all(0))
-        while not reader.is_empty() do
-            local atom_subtree = list_subtree:add(field_name, reader.peek_all(0))
+    if skip_lists then
+        -- see p_of.prefs.hidden_tree
+        reader:skip_all()
+        return
+    end
+    if not reader:is_empty() then
+        local list_subtree = subtree:add(field_name .. " list", reader:peek_all(0))
+        while not reader:is_empty() do
+            local atom_subtree = list_subtree:add(field_name, reader:peek_all(0))
             local info = dissector(reader, atom_subtree)
             atom_subtree:set_text(info)
         end
@@ -157,30 +143,30 @@ function read_list(reader, dissector, subtree, field_name)
 end
 
 function read_ethernet(reader, version, subtree, field_name)
-    if reader.is_empty() then
+    if reader:is_empty() then
         return
     end
-    local child_subtree = subtree:add(fields[field_name], reader.peek_all(0))
+    local child_subtree = subtree:add(fields[field_name], reader:peek_all(0))
     child_subtree:set_text("Ethernet packet")
-    ethernet_dissector:call(reader.read_all():tvb(), current_pkt, child_subtree)
+    ethernet_dissector:call(reader:read_all():tvb(), current_pkt, child_subtree)
 end
 
 function read_of_bsn_vport_q_in_q_t(reader, version, subtree, field_name)
-    if reader.is_empty() then
+    if reader:is_empty() then
         return
     end
-    local child_subtree = subtree:add(fields[field_name], reader.peek_all(0))
+    local child_subtree = subtree:add(fields[field_name], reader:peek_all(0))
     local info = of_bsn_vport_q_in_q_dissectors[version](reader, child_subtree)
     child_subtree:set_text(info)
 end
 
 function read_openflow(reader, version, subtree, field_name)
-    if reader.is_empty() then
+    if reader:is_empty() then
         return
     end
-    local child_subtree = subtree:add(fields[field_name], reader.peek_all(0))
+    local child_subtree = subtree:add(fields[field_name], reader:peek_all(0))
     child_subtree:set_text("OpenFlow message")
     pcall(function () -- Message may be truncated, ignore errors dissecting
-        p_of.dissector:call(reader.read_all():tvb(), current_pkt, child_subtree)
+        p_of.dissector:call(reader:read_all():tvb(), current_pkt, child_subtree)
     end)
 end
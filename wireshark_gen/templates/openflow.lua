@@ -44,6 +44,25 @@ ethernet_dissector = Dissector.get("eth")
 
 current_pkt = nil
 
+-- set while dissecting a message without descending into lists
+skip_lists = false
+
+-- Reduced dissection is opt-in. A Lua dissector cannot ask whether a
+-- display filter or colouring rule references a field, so a hidden tree
+-- that only feeds a filter looks the same as tshark without -V, and the
+-- default has to keep dissecting everything.
+local hidden_tree_modes = {
+    { 1, "summary", "Summary only (version, type and info column)" },
+    { 2, "fields", "Message fields, without descending into lists" },
+    { 3, "full", "Full dissection" },
+}
+p_of.prefs.hidden_tree = Pref.enum("Dissection without a visible tree", 3,
+    "How much to dissect when the protocol tree is not displayed, e.g., tshark without -V. " ..
+    "'fields' and 'summary' are faster, but display filters on OpenFlow fields then " ..
+    "match nothing inside lists ('fields') or at all ('summary'), so only choose them " ..
+    "when not filtering on OpenFlow fields.",
+    hidden_tree_modes, false)
+
 local openflow_versions = {
 :: for version in loxi_globals.OFVersions.all_supported:
     [${version.wire_version}] = "${version.version}",
@@ -109,6 +128,40 @@ local of_message_dissectors = {
 :: #endfor
 }
 
+--- Summaries (class names) of messages, dispatching on the discriminators only
+:: for version, ofproto in ir.items():
+:: for ofclass in ofproto.classes:
+:: if ofclass.virtual and ofclass.is_message:
+${ofclass.name}_v${version.wire_version}_summaries = {}
+function summarize_${ofclass.name}_v${version.wire_version}(reader)
+    local summary = ${ofclass.name}_v${version.wire_version}_summaries[reader:peek_uint(${ofclass.discriminator.offset},${ofclass.discriminator.length})]
+    if type(summary) == "function" then
+        return summary(reader)
+    end
+    return summary or "unknown"
+end
+
+:: #endif
+:: #endfor
+:: for ofclass in ofproto.classes:
+:: if ofclass.is_message and ofclass.superclass:
+:: discriminator = ofclass.superclass.discriminator
+:: discriminator_value = ofclass.member_by_name(discriminator.name).value
+:: if ofclass.virtual:
+${ofclass.superclass.name}_v${version.wire_version}_summaries[${discriminator_value}] = summarize_${ofclass.name}_v${version.wire_version}
+:: else:
+${ofclass.superclass.name}_v${version.wire_version}_summaries[${discriminator_value}] = '${ofclass.name}'
+:: #endif
+:: #endif
+:: #endfor
+
+:: #endfor
+local of_message_summaries = {
+:: for version in ir:
+    [${version.wire_version}] = summarize_of_header_v${version.wire_version},
+:: #endfor
+}
+
 local of_port_desc_dissectors = {
 :: for version in ir:
     [${version.wire_version}] = dissect_of_port_desc_v${version.wire_version},
@@ -129,9 +182,8 @@ local of_bsn_vport_q_in_q_dissectors = {
 
 :: include('_oftype_readers.lua')
 
-function dissect_of_message(buf, root)
+function dissect_of_message(buf, root, mode)
     local reader = OFReader.new(buf)
-    local subtree = root:add(p_of, buf(0))
     local version_val = buf(0,1):uint()
     local type_val = buf(1,1):uint()
 
@@ -142,15 +194,41 @@ function dissect_of_message(buf, root)
         return "Unknown protocol", "Dissection error"
     end
 
+    if mode == "summary" then
+        if root then
+            root:add(p_of, buf(0))
+        end
+        return protocol, of_message_summaries[version_val](reader)
+    end
+
+    local subtree = root:add(p_of, buf(0))
     local info = "unknown"
+    skip_lists = mode == "fields"
     info = of_message_dissectors[version_val](reader, subtree)
+    skip_lists = false
 
     return protocol, info
 end
 
+-- How much of the messages to dissect: "summary", "fields" or "full"
+local function dissection_mode(root)
+    -- without a tree there is nowhere to add the fields
+    if root == nil then
+        return "summary"
+    end
+    local hidden_mode = hidden_tree_modes[p_of.prefs.hidden_tree][2]
+    -- TreeItem.visible is not available in older Wireshark versions
+    local ok, visible = pcall(function() return root.visible end)
+    if not ok or visible ~= false then
+        return "full"
+    end
+    return hidden_mode
+end
+
 -- of dissector function
 function p_of.dissector (buf, pkt, root)
     local offset = 0
+    local mode = dissection_mode(root)
     current_pkt = pkt
     repeat
         if buf:len() - offset >= 4 then
@@ -170,7 +248,7 @@ function p_of.dissector (buf, pkt, root)
                 return
             end
 
-            protocol, info = dissect_of_message(buf(offset, msg_len), root)
+            protocol, info = dissect_of_message(buf(offset, msg_len), root, mode)
 
             if offset == 0 then
                 pkt.cols.protocol:clear()
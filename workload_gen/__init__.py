@@ -0,0 +1,72 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Workload generator backend
+
+Writes the synthetic message streams defined in workload_gen.workloads for
+each OpenFlow version, as raw concatenated messages (.bin) and as a capture
+of a single TCP connection to the OpenFlow port (.pcap), plus a manifest
+describing them.
+"""
+
+import json
+import random
+
+import loxi_globals
+import template_utils
+from loxi_utils import pcap
+from workload_gen.encoder import Encoder
+from workload_gen.workloads import workloads
+
+def generate(install_dir):
+    options = loxi_globals.options
+    scale = options.workload_scale if options else 1
+    seed = options.workload_seed if options else 0
+
+    manifest = dict(scale=scale, seed=seed, files=[])
+    for version in sorted(loxi_globals.ir, key=lambda v: v.wire_version):
+        encoder = Encoder(version)
+        dirname = "workload/of%s" % version.version.replace(".", "")
+        for index, (name, workload) in enumerate(workloads):
+            rng = random.Random(seed * 1000 + index * 10 + version.wire_version)
+            msgs = workload(encoder, rng, scale)
+            if msgs is None:
+                continue
+            with template_utils.open_output(install_dir, "%s/%s.bin" % (dirname, name)) as out:
+                for msg in msgs:
+                    out.write(msg)
+            with template_utils.open_output(install_dir, "%s/%s.pcap" % (dirname, name)) as out:
+                writer = pcap.PcapWriter(out)
+                for msg in msgs:
+                    writer.write(msg)
+            manifest["files"].append(dict(name="%s/%s" % (dirname, name), version=version.version,
+                                          workload=name, messages=len(msgs),
+                                          bytes=sum(len(msg) for msg in msgs)))
+
+    with template_utils.open_output(install_dir, "workload/manifest.json") as out:
+        json.dump(manifest, out, indent=2, sort_keys=True)
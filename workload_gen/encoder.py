@@ -0,0 +1,191 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+IR-driven OpenFlow encoder
+
+Serializes instances of any class in loxi_globals.ir from keyword arguments,
+without going through one of the generated libraries:
+
+    encoder = Encoder(version)
+    action = encoder.encode("of_action_output", port=1, max_len=0xffff)
+    msg = encoder.encode("of_packet_out", xid=1, actions=[action])
+
+Type, length and field length members are computed. Data members that are
+not given default to zero (scalars), empty (lists, octets) or the default
+encoding of the embedded struct. Values of lists, embedded structs and
+of_oxm_t members are already encoded strings (lists: a list of them).
+"""
+
+import struct
+
+import loxi_globals
+import loxi_utils.loxi_utils as loxi_utils
+from loxi_ir import *
+
+# struct formats of the fixed size scalar wire types
+scalar_formats = {
+    'char': '!B',
+    'uint8_t': '!B',
+    'uint16_t': '!H',
+    'uint32_t': '!L',
+    'uint64_t': '!Q',
+    'of_ipv4_t': '!L',
+    'of_match_bmap_t': '!Q',
+}
+
+# fixed length byte strings, padded with zeros
+fixed_length_strings = {
+    'of_mac_addr_t': 6,
+    'of_ipv6_t': 16,
+    'of_port_name_t': 16,
+    'of_table_name_t': 32,
+    'of_serial_num_t': 32,
+    'of_desc_str_t': 256,
+    'of_str64_t': 64,
+}
+
+# 128 bit values, given as integers
+wide_integers = {
+    'of_bitmap_128_t': 16,
+    'of_checksum_128_t': 16,
+}
+
+class EncodeError(Exception):
+    pass
+
+class Encoder(object):
+    def __init__(self, version):
+        self.version = version
+        self.ofproto = loxi_globals.ir[version]
+        self.wire_version = version.wire_version
+        self._defaults = {}
+        # the IR lookups are linear searches; cache them per encoder
+        self._classes = {}
+        self._wire_types = {}
+
+    def enum_value(self, name):
+        """ Return the value of the enum entry 'name' in this version """
+        for enum in self.ofproto.enums:
+            for entry in enum.entries:
+                if entry.name == name:
+                    return entry.value
+        raise EncodeError("No enum entry %s in OpenFlow %s" % (name, self.version.version))
+
+    def class_by_name(self, name):
+        if name not in self._classes:
+            self._classes[name] = self.ofproto.class_by_name(name)
+        return self._classes[name]
+
+    def has_class(self, name):
+        return self.class_by_name(name) is not None
+
+    def has_member(self, class_name, member_name):
+        return self.class_by_name(class_name).member_by_name(member_name) is not None
+
+    def encode(self, class_name, **fields):
+        """ Return the wire encoding of an instance of 'class_name' """
+        ofclass = self.class_by_name(class_name)
+        if ofclass is None:
+            raise EncodeError("No class %s in OpenFlow %s" % (class_name, self.version.version))
+        if ofclass.virtual:
+            raise EncodeError("Cannot encode virtual class %s" % class_name)
+        for name in fields:
+            m = ofclass.member_by_name(name)
+            if not isinstance(m, OFDataMember):
+                raise EncodeError("%s has no data member %s" % (class_name, name))
+
+        parts = []
+        length_index = None
+        field_lengths = {}
+        encoded = {}
+        for m in ofclass.members:
+            if isinstance(m, OFPadMember):
+                parts.append('\x00' * m.pad_length)
+            elif isinstance(m, OFTypeMember):
+                parts.append(self.pack(m.oftype, m.value))
+            elif isinstance(m, OFLengthMember):
+                # placeholders, filled in once the length is known
+                length_index = len(parts)
+                parts.append(self.pack(m.oftype, 0))
+            elif isinstance(m, OFFieldLengthMember):
+                field_lengths[m.field_name] = (len(parts), m.oftype)
+                parts.append(self.pack(m.oftype, 0))
+            else:
+                data = self.pack(m.oftype, fields.get(m.name))
+                encoded[m.name] = data
+                parts.append(data)
+
+        for field_name, (index, oftype) in field_lengths.items():
+            parts[index] = self.pack(oftype, len(encoded[field_name]))
+
+        length = sum(len(p) for p in parts)
+        align = int(ofclass.params.get('align', 1))
+        padding = '\x00' * ((length + align - 1) // align * align - length)
+        if length_index is not None:
+            reported_length = length + len(padding) if ofclass.has_internal_alignment else length
+            parts[length_index] = self.pack(ofclass.length_member.oftype, reported_length)
+        return ''.join(parts) + padding
+
+    def pack(self, oftype, value):
+        """ Return the wire encoding of 'value' as 'oftype', or of its default if value is None """
+        wire_type = self._wire_types.get(oftype)
+        if wire_type is None:
+            wire_type = self._wire_types[oftype] = loxi_utils.lookup_versioned_wiretype(oftype, self.version)
+        if wire_type in scalar_formats:
+            return struct.pack(scalar_formats[wire_type], value or 0)
+        elif wire_type in fixed_length_strings:
+            length = fixed_length_strings[wire_type]
+            if isinstance(value, (list, tuple)):
+                value = struct.pack("!%dB" % len(value), *value)
+            return struct.pack("!%ds" % length, value or '')
+        elif wire_type in wide_integers:
+            value = value or 0
+            return ''.join(chr((value >> (8 * i)) & 0xff) for i in reversed(range(wide_integers[wire_type])))
+        elif wire_type == 'of_octets_t':
+            return value or ''
+        elif loxi_utils.oftype_is_list(wire_type):
+            return ''.join(value or [])
+        elif value is not None:
+            # embedded struct or of_oxm_t, already encoded
+            return value
+        else:
+            return self.default_struct(wire_type)
+
+    def default_struct(self, oftype):
+        """ Return the encoding of an embedded struct with all defaults """
+        if oftype not in self._defaults:
+            wire_type = loxi_utils.lookup_versioned_wiretype(oftype, self.version)
+            class_name = wire_type[:-2] if wire_type.endswith('_t') else wire_type
+            if not self.has_class(class_name):
+                raise EncodeError("No default for %s in OpenFlow %s" % (oftype, self.version.version))
+            self._defaults[oftype] = self.encode(class_name)
+        return self._defaults[oftype]
+
+    def match_class(self):
+        """ Return the name of the of_match_t class of this version """
+        return loxi_utils.lookup_versioned_wiretype('of_match_t', self.version)[:-2]
@@ -0,0 +1,176 @@
+# Copyright 2013, Big Switch Networks, Inc.
+#
+# LoxiGen is licensed under the Eclipse Public License, version 1.0 (EPL), with
+# the following special exception:
+#
+# LOXI Exception
+#
+# As a special exception to the terms of the EPL, you may distribute libraries
+# generated by LoxiGen (LoxiGen Libraries) under the terms of your choice, provided
+# that copyright and licensing notices generated by LoxiGen are not altered or removed
+# from the LoxiGen Libraries and the notice provided below is (i) included in
+# the LoxiGen Libraries, if distributed in source code form and (ii) included in any
+# documentation for the LoxiGen Libraries, if distributed in binary form.
+#
+# Notice: "Copyright 2013, Big Switch Networks, Inc. This library was generated by the LoxiGen Compiler."
+#
+# You may not use this file except in compliance with the EPL or LOXI Exception. You may obtain
+# a copy of the EPL at:
+#
+# http://www.eclipse.org/legal/epl-v10.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# EPL for the specific language governing permissions and limitations
+# under the EPL.
+
+"""
+Synthetic OpenFlow workloads
+
+Each workload is a function (encoder, rng, scale) returning a list of encoded
+messages, or None if the classes it needs do not exist in the encoder's
+version. 'scale' multiplies the number of generated objects; 'rng' is a
+seeded random.Random, so the output is reproducible.
+"""
+
+from workload_gen.encoder import Encoder
+
+# Ethernet frame sizes and weights of the simple IMIX distribution
+imix = [ (64, 7), (594, 4), (1518, 1) ]
+
+# Keep messages below this size, so that they fit into one IP packet of a capture
+max_message_length = 65000
+
+def random_mac(rng):
+    return [ rng.randrange(256) for i in range(6) ]
+
+def random_match(encoder, rng, index):
+    """ A 5-tuple style match with the match class of the encoder's version """
+    in_port = 1 + index % 48
+    tcp_dst = 1024 + index % 60000
+    if encoder.wire_version == 1:
+        wildcards = encoder.enum_value("OFPFW_ALL") & ~(
+            encoder.enum_value("OFPFW_IN_PORT") | encoder.enum_value("OFPFW_DL_TYPE") |
+            encoder.enum_value("OFPFW_NW_PROTO") | encoder.enum_value("OFPFW_TP_DST"))
+        return encoder.encode("of_match_v1", wildcards=wildcards, in_port=in_port,
+                              eth_type=0x0800, ip_proto=6, tcp_dst=tcp_dst)
+    elif encoder.wire_version == 2:
+        return encoder.encode("of_match_v2", in_port=in_port, eth_type=0x0800, ip_proto=6,
+                              tcp_dst=tcp_dst, eth_src_mask=[0xff] * 6, eth_dst_mask=[0xff] * 6,
+                              ipv4_src_mask=0xffffffff, ipv4_dst_mask=0xffffffff,
+                              metadata_mask=0xffffffffffffffff)
+    else:
+        return encoder.encode("of_match_v3", oxm_list=[
+            encoder.encode("of_oxm_in_port", value=in_port),
+            encoder.encode("of_oxm_eth_type", value=0x0800),
+            encoder.encode("of_oxm_ip_proto", value=6),
+            encoder.encode("of_oxm_tcp_dst", value=tcp_dst),
+        ])
+
+def output_actions(encoder, port):
+    """ Data members that make a flow output to 'port' """
+    actions = [ encoder.encode("of_action_output", port=port, max_len=0xffff) ]
+    if encoder.wire_version == 1:
+        return dict(actions=actions)
+    return dict(instructions=[ encoder.encode("of_instruction_apply_actions", actions=actions) ])
+
+def flow_stats_reply(encoder, rng, scale):
+    """ 10000 * scale flow stats entries, split into replies that fit a message """
+    entries = []
+    for i in range(10000 * scale):
+        fields = dict(table_id=i % 4, duration_sec=rng.randrange(86400), priority=100 + i % 10,
+                      idle_timeout=60, cookie=i, packet_count=rng.randrange(1 << 32),
+                      byte_count=rng.randrange(1 << 40), match=random_match(encoder, rng, i))
+        fields.update(output_actions(encoder, 1 + i % 48))
+        entries.append(encoder.encode("of_flow_stats_entry", **fields))
+
+    header_length = len(encoder.encode("of_flow_stats_reply"))
+    more = encoder.enum_value("OFPSF_REPLY_MORE")
+    replies = []
+    batch = []
+    batch_length = header_length
+    for entry in entries:
+        if batch and batch_length + len(entry) > max_message_length:
+            replies.append(batch)
+            batch = []
+            batch_length = header_length
+        batch.append(entry)
+        batch_length += len(entry)
+    replies.append(batch)
+    return [ encoder.encode("of_flow_stats_reply", xid=1, entries=batch,
+                            flags=more if i < len(replies) - 1 else 0)
+             for i, batch in enumerate(replies) ]
+
+def packet_in_burst(encoder, rng, scale):
+    """ 10000 * scale packet-ins with IMIX frame sizes """
+    frame_data = ''.join(chr(rng.randrange(256)) for i in range(max(s for s, w in imix)))
+    sizes = [ s for s, w in imix for i in range(w) ]
+    if encoder.has_member("of_packet_in", "match"):
+        location = lambda i: dict(match=random_match(encoder, rng, i))
+    else:
+        location = lambda i: dict(in_port=1 + i % 48)
+    msgs = []
+    for i in range(10000 * scale):
+        size = rng.choice(sizes)
+        # Ethernet header with an IPv4 ethertype, random payload
+        frame = ''.join(map(chr, random_mac(rng) + random_mac(rng))) + '\x08\x00' + frame_data[14:size]
+        fields = dict(xid=i, buffer_id=0xffffffff, total_len=size,
+                      reason=encoder.enum_value("OFPR_NO_MATCH"), data=frame)
+        fields.update(location(i))
+        msgs.append(encoder.encode("of_packet_in", **fields))
+    return msgs
+
+def deep_match_flow_add(encoder, rng, scale):
+    """ 10000 * scale flow adds with 12 OXMs each """
+    if encoder.wire_version < 3:
+        return None
+    msgs = []
+    for i in range(10000 * scale):
+        oxms = [
+            encoder.encode("of_oxm_in_port", value=1 + i % 48),
+            encoder.encode("of_oxm_eth_dst", value=random_mac(rng)),
+            encoder.encode("of_oxm_eth_src", value=random_mac(rng)),
+            encoder.encode("of_oxm_eth_type", value=0x0800),
+            encoder.encode("of_oxm_vlan_vid", value=0x1000 | (1 + i % 4094)),
+            encoder.encode("of_oxm_ip_dscp", value=i % 64),
+            encoder.encode("of_oxm_ip_proto", value=6),
+            encoder.encode("of_oxm_ipv4_src_masked", value=rng.randrange(1 << 32), value_mask=0xffffff00),
+            encoder.encode("of_oxm_ipv4_dst_masked", value=rng.randrange(1 << 32), value_mask=0xffff0000),
+            encoder.encode("of_oxm_tcp_src", value=rng.randrange(1024, 65536)),
+            encoder.encode("of_oxm_tcp_dst", value=1 + i % 1024),
+            encoder.encode("of_oxm_metadata_masked", value=i, value_mask=0xffff),
+        ]
+        fields = dict(xid=i, cookie=i, priority=1000 + i % 100, buffer_id=0xffffffff,
+                      out_port=encoder.enum_value("OFPP_ANY"), out_group=encoder.enum_value("OFPG_ANY"),
+                      match=encoder.encode("of_match_v3", oxm_list=oxms))
+        fields.update(output_actions(encoder, 1 + i % 48))
+        msgs.append(encoder.encode("of_flow_add", **fields))
+    return msgs
+
+def bsn_gentable_flood(encoder, rng, scale):
+    """ 10000 * scale BSN gentable entry adds keyed by port, VLAN and MAC """
+    if not encoder.has_class("of_bsn_gentable_entry_add"):
+        return None
+    msgs = []
+    for i in range(10000 * scale):
+        key = [
+            encoder.encode("of_bsn_tlv_port", value=1 + i % 48),
+            encoder.encode("of_bsn_tlv_vlan_vid", value=1 + i % 4094),
+            encoder.encode("of_bsn_tlv_mac", value=random_mac(rng)),
+        ]
+        value = [
+            encoder.encode("of_bsn_tlv_port", value=1 + rng.randrange(48)),
+            encoder.encode("of_bsn_tlv_idle_timeout", value=300),
+        ]
+        msgs.append(encoder.encode("of_bsn_gentable_entry_add", xid=i, table_id=i % 8,
+                                   checksum=rng.randrange(1 << 128), key=key, value=value))
+    return msgs
+
+# name -> workload function, in output order
+workloads = [
+    ("flow_stats_reply", flow_stats_reply),
+    ("packet_in_burst", packet_in_burst),
+    ("deep_match_flow_add", deep_match_flow_add),
+    ("bsn_gentable_flood", bsn_gentable_flood),
+]